@@ -0,0 +1,207 @@
+"""single file bundle of pre-decoded assets, which is memory-mapped at startup"""
+
+from GameErrors import AssetBundleError
+import pygame
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+# header is (magic, version, length of index in bytes)
+ASSET_BUNDLE_MAGIC = b"BSAB"
+ASSET_BUNDLE_VERSION = 1
+ASSET_BUNDLE_HEADER = struct.Struct("<4sII")
+# data of every asset starts at offset divisible by this
+ASSET_BUNDLE_ALIGNMENT = 16
+
+
+def align(offset):
+    """returns first offset divisible by ASSET_BUNDLE_ALIGNMENT, which is not
+    smaller than offset"""
+    return -(-offset // ASSET_BUNDLE_ALIGNMENT) * ASSET_BUNDLE_ALIGNMENT
+
+
+def image_to_raw_pixels(image):
+    """returns (format, pixels) of image, opaque images are stored without
+    alpha channel, so they are smaller and blit faster after conversion"""
+    if image.get_flags() & pygame.SRCALPHA:
+        opaque_pixels = pygame.mask.from_surface(image, 254).count()
+        if opaque_pixels < image.get_width() * image.get_height():
+            return "RGBA", pygame.image.tobytes(image, "RGBA")
+    return "RGB", pygame.image.tobytes(image, "RGB")
+
+
+def write_asset_bundle(bundle_path, assets_directory, image_names, font_names):
+    """decodes images and reads fonts from assets_directory and writes them
+    to bundle_path, names are paths relative to assets_directory and they
+    are used as keys in bundle, raises AssetBundleError if name is given
+    more than once"""
+    names = list(image_names) + list(font_names)
+    for name in names:
+        if names.count(name) > 1:
+            raise AssetBundleError(bundle_path, f"asset {name} is given more than once")
+
+    index = {}
+    # (name, data) of assets in order of their offsets
+    chunks = []
+    offset = 0
+    for name in image_names:
+        image = pygame.image.load(os.path.join(assets_directory, name))
+        pixel_format, data = image_to_raw_pixels(image)
+        index[name] = {
+            "offset": offset,
+            "size": len(data),
+            "format": pixel_format,
+            "width": image.get_width(),
+            "height": image.get_height(),
+        }
+        chunks.append((name, data))
+        offset = align(offset + len(data))
+    for name in font_names:
+        with open(os.path.join(assets_directory, name), "rb") as font_file:
+            data = font_file.read()
+        index[name] = {"offset": offset, "size": len(data)}
+        chunks.append((name, data))
+        offset = align(offset + len(data))
+
+    index_data = json.dumps(index, sort_keys=True).encode()
+    # offsets in index are relative to start of data section
+    data_start = align(ASSET_BUNDLE_HEADER.size + len(index_data))
+    # bundle is written next to its final path and renamed at the end, so an
+    # interrupted build never leaves a truncated bundle behind
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        suffix=".bundle", dir=os.path.dirname(bundle_path) or None
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as bundle_file:
+            bundle_file.write(
+                ASSET_BUNDLE_HEADER.pack(
+                    ASSET_BUNDLE_MAGIC, ASSET_BUNDLE_VERSION, len(index_data)
+                )
+            )
+            bundle_file.write(index_data)
+            for name, data in chunks:
+                bundle_file.seek(data_start + index[name]["offset"])
+                bundle_file.write(data)
+        os.replace(temporary_path, bundle_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+class AssetBundle:
+    """read only view of bundle written by write_asset_bundle, file is
+    memory-mapped, so only pages of assets which are used are read from disk
+    and images are created straight from mapped pixels without decoding
+
+    :param _path: path of bundle file
+    :type _path: str
+    :param _memory_map: copy-on-write map of the file, writing to surfaces
+        created from it does not change the file
+    :type _memory_map: mmap.mmap
+    :param _index: maps name of asset to its offset, size and image format
+    :type _index: dict
+    :param _data_start: offset of data section in the file
+    :type _data_start: int
+    """
+
+    def __init__(self, path):
+        self._path = path
+        try:
+            with open(path, "rb") as bundle_file:
+                self._memory_map = mmap.mmap(
+                    bundle_file.fileno(), 0, access=mmap.ACCESS_COPY
+                )
+        except ValueError as error:
+            # empty file cannot be mapped
+            raise AssetBundleError(path, "file is empty") from error
+        except OSError as error:
+            raise AssetBundleError(path, f"file cannot be mapped: {error}") from error
+
+        if len(self._memory_map) < ASSET_BUNDLE_HEADER.size:
+            raise AssetBundleError(path, "file is too short")
+        magic, version, index_size = ASSET_BUNDLE_HEADER.unpack_from(self._memory_map)
+        if magic != ASSET_BUNDLE_MAGIC:
+            raise AssetBundleError(path, "it is not asset bundle")
+        if version != ASSET_BUNDLE_VERSION:
+            raise AssetBundleError(path, f"unsupported version {version}")
+
+        index_end = ASSET_BUNDLE_HEADER.size + index_size
+        if index_end > len(self._memory_map):
+            raise AssetBundleError(path, "index is truncated")
+        try:
+            self._index = json.loads(
+                self._memory_map[ASSET_BUNDLE_HEADER.size : index_end]
+            )
+        except ValueError as error:
+            # UnicodeDecodeError and JSONDecodeError are both ValueErrors
+            raise AssetBundleError(path, "index is not valid JSON") from error
+        if not isinstance(self._index, dict):
+            raise AssetBundleError(path, "index is not a dictionary")
+        self._data_start = align(index_end)
+        for name, entry in self._index.items():
+            self._check_entry(name, entry)
+
+    def _check_entry(self, name, entry):
+        """raises AssetBundleError if entry of index does not describe data
+        which lies inside the file, so reading assets never goes past the
+        end of a truncated bundle"""
+        if not isinstance(entry, dict):
+            raise AssetBundleError(self._path, f"entry of {name} is not valid")
+        offset = entry.get("offset")
+        size = entry.get("size")
+        for value in (offset, size):
+            if type(value) is not int or value < 0:
+                raise AssetBundleError(self._path, f"entry of {name} is not valid")
+        if self._data_start + offset + size > len(self._memory_map):
+            raise AssetBundleError(self._path, f"data of {name} is truncated")
+        if "format" in entry:
+            width = entry.get("width")
+            height = entry.get("height")
+            pixel_format = entry["format"]
+            if (
+                pixel_format not in ("RGB", "RGBA")
+                or type(width) is not int
+                or type(height) is not int
+                or width * height * len(pixel_format) != size
+            ):
+                raise AssetBundleError(
+                    self._path, f"image {name} does not match its size"
+                )
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def names(self):
+        return list(self._index)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def get_data(self, name):
+        """returns memoryview of asset data, it shares memory with the file"""
+        entry = self._index[name]
+        start = self._data_start + entry["offset"]
+        return memoryview(self._memory_map)[start : start + entry["size"]]
+
+    def get_image(self, name):
+        """returns surface which uses pixels of mapped file"""
+        entry = self._index[name]
+        return pygame.image.frombuffer(
+            self.get_data(name), (entry["width"], entry["height"]), entry["format"]
+        )
+
+    def get_bytes(self, name):
+        """returns copy of asset data, used for fonts"""
+        return self.get_data(name).tobytes()
+
+
+if __name__ == "__main__":
+    # build step, run after changing files in assets directory
+    from MemoryAccess import build_asset_bundle
+
+    build_asset_bundle()
@@ -0,0 +1,262 @@
+"""array backed state of a single game board"""
+
+from GameErrors import OcupiedCellError, CellAlreadyShotError
+import constants
+
+import numpy as np
+
+# value stored in ship id array when there is no ship on the cell
+NO_SHIP = -1
+
+
+class Board:
+    """stores state of the whole game board in parallel numpy arrays,
+    single cells can be accessed as BoardCell views (board[row, column])
+
+    :param _height: how many rows does the board have
+    :type _height: int
+    :param _width: how many columns does the board have
+    :type _width: int
+    :param _occupancy: 1 where a ship is positioned, 0 where cell is free
+    :type _occupancy: numpy.ndarray(uint8)
+    :param _shots: 1 where cell has already been shot, else 0
+    :type _shots: numpy.ndarray(uint8)
+    :param _ship_ids: index of ship in _ships or NO_SHIP if cell is free
+    :type _ship_ids: numpy.ndarray(int16)
+    :param _ships: ships positioned on the board, indexed by ship id
+    :type _ships: list
+    :param _ship_index: maps ship instance to its id on this board
+    :type _ship_index: dict
+    :param _changes_count: how many changes have happened on the board,
+        single placement or shot is one change
+    :type _changes_count: int
+    :param _change_numbers: number of the last change of every cell, 0 if
+        cell has not changed, views of the board redraw only cells changed
+        since they were drawn and board does not keep history of changes
+    :type _change_numbers: numpy.ndarray(uint32)
+    """
+
+    def __init__(self, height, width):
+        self._height = height
+        self._width = width
+        self._occupancy = np.zeros((height, width), dtype=np.uint8)
+        self._shots = np.zeros((height, width), dtype=np.uint8)
+        self._ship_ids = np.full((height, width), NO_SHIP, dtype=np.int16)
+        self._ships = []
+        self._ship_index = {}
+        self._changes_count = 0
+        self._change_numbers = np.zeros((height, width), dtype=np.uint32)
+
+    @property
+    def height(self):
+        return self._height
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def occupancy(self):
+        return self._occupancy
+
+    @property
+    def shots(self):
+        return self._shots
+
+    @property
+    def ship_ids(self):
+        return self._ship_ids
+
+    @property
+    def changes_count(self):
+        """returns how many changes have happened on the board"""
+        return self._changes_count
+
+    def changed_cells(self, since=0):
+        """returns list of (row, column) of cells changed after first
+        since changes, every cell is listed once in order of rows"""
+        if since >= self._changes_count:
+            return []
+        return [
+            (row, column)
+            for row, column in np.argwhere(self._change_numbers > since).tolist()
+        ]
+
+    def mark_changed(self, area):
+        """counts new change of cells of area (index of numpy arrays)"""
+        self._changes_count += 1
+        self._change_numbers[area] = self._changes_count
+
+    def __len__(self):
+        return self._height
+
+    def __getitem__(self, key):
+        """board[row, column] returns BoardCell view of a single cell,
+        board[row] returns list of views of whole row"""
+        if isinstance(key, tuple):
+            row, column = key
+            return BoardCell(board=self, row=row, column=column)
+        return [
+            BoardCell(board=self, row=key, column=column)
+            for column in range(self._width)
+        ]
+
+    def clone(self, ship_copies):
+        """returns independent copy of board, ship_copies maps every ship
+        on this board to ship which replaces it on the copy"""
+        board = object.__new__(Board)
+        board._height = self._height
+        board._width = self._width
+        board._occupancy = self._occupancy.copy()
+        board._shots = self._shots.copy()
+        board._ship_ids = self._ship_ids.copy()
+        board._ships = [ship_copies[ship] for ship in self._ships]
+        board._ship_index = {ship: ship_id for ship_id, ship in enumerate(board._ships)}
+        board._changes_count = self._changes_count
+        board._change_numbers = self._change_numbers.copy()
+        return board
+
+    @property
+    def ships(self):
+        """returns list of ships positioned on the board, indexed by id"""
+        return self._ships
+
+    def is_free(self, row, column):
+        """returns True if there is no ship on the cell"""
+        return not self._occupancy[row, column]
+
+    def was_shot(self, row, column):
+        """returns True if cell has already been shot"""
+        return bool(self._shots[row, column])
+
+    def ship_handle(self, row, column):
+        """returns ship positioned on the cell or None"""
+        ship_id = self._ship_ids[row, column]
+        if ship_id == NO_SHIP:
+            return None
+        return self._ships[ship_id]
+
+    def register_ship(self, ship):
+        """returns id of ship on this board, registers it if needed"""
+        ship_id = self._ship_index.get(ship)
+        if ship_id is None:
+            ship_id = len(self._ships)
+            self._ships.append(ship)
+            self._ship_index[ship] = ship_id
+        return ship_id
+
+    def ship_area(self, row, column, length, orientation):
+        """returns index (tuple of slices) of cells covered by ship"""
+        if orientation == constants.SHIP_HORIZONTAL:
+            return (row, slice(column, column + length))
+        return (slice(row, row + length), column)
+
+    def is_area_free(self, row, column, length, orientation):
+        """returns True if no ship is positioned on the cells
+        which ship of length would cover"""
+        area = self.ship_area(row, column, length, orientation)
+        return not self._occupancy[area].any()
+
+    def position_ship(self, row, column, new_ship):
+        """positions ship on a single cell,
+        raises OcupiedCellError if cell isn't free"""
+        if self._occupancy[row, column]:
+            raise OcupiedCellError()
+
+        self._ship_ids[row, column] = self.register_ship(new_ship)
+        self._occupancy[row, column] = 1
+        self.mark_changed((row, column))
+
+    def place_ship(self, new_ship, row, column, orientation):
+        """positions whole ship at once, top left corner of ship is at
+        (row, column), raises OcupiedCellError on colision"""
+        area = self.ship_area(row, column, new_ship.length, orientation)
+        if self._occupancy[area].any():
+            raise OcupiedCellError()
+
+        self._ship_ids[area] = self.register_ship(new_ship)
+        self._occupancy[area] = 1
+        self.mark_changed(area)
+
+    def remove_ship(self, row, column):
+        """removes ship from a single cell"""
+        self._occupancy[row, column] = 0
+        self._ship_ids[row, column] = NO_SHIP
+        self.mark_changed((row, column))
+
+    def handle_attack(self, row, column):
+        """
+        handles attack on single cell, returns values:
+        constants.ATTACK_UNSUCCESSFUL - when water was hit
+        constants.SHIP_HIT - when ship was hit, but not sunk
+        constants.SHIP_SUNK - when ship was hit and sunk
+
+        raises CellAlreadyShotError if attack on this cell was
+        already performed
+        """
+        if self._shots[row, column]:
+            raise CellAlreadyShotError()
+
+        self._shots[row, column] = 1
+        self.mark_changed((row, column))
+
+        ship_id = self._ship_ids[row, column]
+        if ship_id == NO_SHIP:
+            return constants.ATTACK_UNSUCCESSFUL
+        # there's a ship
+        is_ship_sunk = self._ships[ship_id].take_damage()
+
+        return constants.SHIP_SUNK if is_ship_sunk else constants.SHIP_HIT
+
+
+class BoardCell:
+    """thin view of a single cell/tile of Board, all state is kept
+    in board's arrays. Created without board it owns 1x1 board
+
+    :param _board: board that stores state of this cell
+    :type _board: Board
+    :param _row: row of the cell on the board
+    :type _row: int
+    :param _column: column of the cell on the board
+    :type _column: int
+    """
+
+    __slots__ = ("_board", "_row", "_column")
+
+    def __init__(self, board=None, row=0, column=0):
+        self._board = board if board is not None else Board(1, 1)
+        self._row = row
+        self._column = column
+
+    @property
+    def is_free(self):
+        return self._board.is_free(self._row, self._column)
+
+    @property
+    def was_shot(self):
+        return self._board.was_shot(self._row, self._column)
+
+    @property
+    def ship_handle(self):
+        return self._board.ship_handle(self._row, self._column)
+
+    def position_ship(self, new_ship):
+        """positions provided ship on cell; accepts ONLY Ship class
+        raises OcupiedCellError if cell isn't free"""
+        self._board.position_ship(self._row, self._column, new_ship)
+
+    def remove_ship(self):
+        """removes ship from cell"""
+        self._board.remove_ship(self._row, self._column)
+
+    def handle_attack(self):
+        """
+        handles attack on signe cell, returns values:
+        constants.ATTACK_UNSUCCESSFUL - when water was hit
+        constants.SHIP_HIT - when ship was hit, but not sunk
+        constants.SHIP_SUNK - when ship was hit and sunk
+
+        raises CellAlreadyShotError if attack on this cell was
+        already performed
+        """
+        return self._board.handle_attack(self._row, self._column)
@@ -1,9 +1,11 @@
 """ provides functions translating row and column to
 x,y coordinates on screen(or the other way around) for
-positioning on gameboards"""
+positioning on gameboards, BoardLayout does it for boards of any size"""
 import constants
 from GameErrors import OutOfTableError
 
+import numpy as np
+
 
 def verify_row_and_column(row, column):
     """raises error when invalid row or column is provided"""
@@ -69,3 +71,157 @@ def calculate_row_and_column(coordinates, from_left_table=True):
     verify_row_and_column(row, column)
 
     return (row, column)
+
+
+class BoardLayout:
+    """positions of both tables and their cells on screen, computed once
+    for board of given size. Cells are squares of cell_size pixels, which
+    is the biggest size letting table fit in its area of screen
+    (for standard 10x10 board it is constants.CELL_SIZE)
+
+    only right and bottom edges belong to particular cell
+    (the same as calculate_row_and_column)
+
+    :param _board_height: how many rows does the board have
+    :type _board_height: int
+    :param _board_width: how many columns does the board have
+    :type _board_width: int
+    :param _cell_size: size of cell in pixels
+    :type _cell_size: int
+    :param _table_x: x of left edge of (left table, right table)
+    :type _table_x: tuple
+    :param _table_y: y of top edge of both tables
+    :type _table_y: int
+    :param _column_x: x of cells in every column, row 0 for left table
+        and row 1 for right table
+    :type _column_x: numpy.ndarray
+    :param _row_y: y of cells in every row
+    :type _row_y: numpy.ndarray
+    """
+
+    def __init__(
+        self,
+        board_height=constants.BOARD_CELL_SIZE,
+        board_width=constants.BOARD_CELL_SIZE,
+        screen_width=constants.SCREEN_WIDTH,
+        screen_height=constants.SCREEN_HEIGHT,
+    ):
+        self._board_height = board_height
+        self._board_width = board_width
+
+        # each table gets half of screen width and space below status bar
+        table_area = min(
+            constants.TABLE_SIZE,
+            screen_width // 2 - constants.TABLE_HORIZONTAL_OFFSET,
+            screen_height - constants.TABLE_VERTICAL_OFFSET,
+        )
+        self._cell_size = max(1, table_area // max(board_height, board_width))
+
+        self._table_x = (
+            constants.TABLE_HORIZONTAL_OFFSET,
+            screen_width - constants.TABLE_HORIZONTAL_OFFSET - self.table_width,
+        )
+        self._table_y = constants.TABLE_VERTICAL_OFFSET
+
+        columns = np.arange(board_width) * self._cell_size
+        self._column_x = np.stack([table_x + columns for table_x in self._table_x])
+        self._row_y = self._table_y + np.arange(board_height) * self._cell_size
+
+    @property
+    def board_height(self):
+        return self._board_height
+
+    @property
+    def board_width(self):
+        return self._board_width
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    @property
+    def table_width(self):
+        return self._board_width * self._cell_size
+
+    @property
+    def table_height(self):
+        return self._board_height * self._cell_size
+
+    @property
+    def table_y(self):
+        return self._table_y
+
+    def table_x(self, from_left_table=True):
+        """returns x of left edge of table"""
+        return self._table_x[0 if from_left_table else 1]
+
+    def table_position(self, from_left_table=True):
+        """returns (x,y) coordinates of top left corner of table"""
+        return (self.table_x(from_left_table), self._table_y)
+
+    def table_rect(self, from_left_table=True):
+        """returns (x, y, width, height) of area covered by table"""
+        return (
+            *self.table_position(from_left_table),
+            self.table_width,
+            self.table_height,
+        )
+
+    def verify_row_and_column(self, row, column):
+        """raises error when invalid row or column is provided"""
+        if (
+            row < 0
+            or column < 0
+            or column > self._board_width - 1
+            or row > self._board_height - 1
+        ):
+            raise OutOfTableError(row, column)
+
+    def cell_position(self, row, column, from_left_table=True):
+        """returns (x,y) coordinates of top left corner of cell, raises
+        OutOfTableError if row or column doesn't exist in table"""
+        self.verify_row_and_column(row, column)
+        return (
+            int(self._column_x[0 if from_left_table else 1, column]),
+            int(self._row_y[row]),
+        )
+
+    def cell_rect(self, row, column, from_left_table=True):
+        """returns (x, y, width, height) of area covered by cell"""
+        return (
+            *self.cell_position(row, column, from_left_table),
+            self._cell_size,
+            self._cell_size,
+        )
+
+    def cell_positions(self, rows, columns, from_left_table=True):
+        """returns array of shape (cells, 2) with (x,y) coordinates of
+        cells given by arrays of rows and columns (which must be valid)"""
+        positions = np.empty((len(rows), 2), dtype=np.int32)
+        positions[:, 0] = self._column_x[0 if from_left_table else 1, columns]
+        positions[:, 1] = self._row_y[rows]
+        return positions
+
+    def cells_at(self, coordinates_x, coordinates_y, from_left_table=True):
+        """returns (rows, columns, inside) arrays for arrays of screen
+        coordinates, inside is False where coordinates are out of table"""
+        coordinates_x = np.asarray(coordinates_x)
+        coordinates_y = np.asarray(coordinates_y)
+        columns = (coordinates_x - self.table_x(from_left_table) - 1) // self._cell_size
+        rows = (coordinates_y - self._table_y - 1) // self._cell_size
+        inside = (
+            (rows >= 0)
+            & (rows < self._board_height)
+            & (columns >= 0)
+            & (columns < self._board_width)
+        )
+        return rows, columns, inside
+
+    def cell_at(self, coordinates, from_left_table=True):
+        """returns (row, column) of cell at (x,y) screen coordinates, raises
+        OutOfTableError if they are out of table"""
+        coordinate_x, coordinate_y = coordinates
+        column = (coordinate_x - self.table_x(from_left_table) - 1) // self._cell_size
+        row = (coordinate_y - self._table_y - 1) // self._cell_size
+        self.verify_row_and_column(row, column)
+        return (row, column)
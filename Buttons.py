@@ -21,6 +21,11 @@ class Button:
         self._image = image
         self._screen = screen
 
+    @property
+    def rect(self):
+        """returns (x, y, width, height) of area covered by button"""
+        return (*self._position, self._width, self._height)
+
     def check_if_mouse_on_button(self, mouse_position):
         """checks if mouse was on button"""
         mouse_x, mouse_y = mouse_position
@@ -61,6 +66,8 @@ class ButtonHandler:
     :type _ready_to_switch_button: list
     :param _buttons_to_draw: buttons from this list will be drawn when draw() is called
     :type _buttons_to_draw: list
+    :param _dirty_rects: areas of screen changed since last dirty_rects() call
+    :type _dirty_rects: list
 
     """
 
@@ -85,6 +92,7 @@ class ButtonHandler:
         ]
 
         self._buttons_to_draw = []
+        self._dirty_rects = []
 
     @property
     def phase(self):
@@ -107,6 +115,7 @@ class ButtonHandler:
     def update(self):
         """sets visibility of buttons according to
         current phase"""
+        previous_buttons = self._buttons_to_draw
         if self.phase == constants.GAME_START_SCREEN:
             self._buttons_to_draw = self._start_buttons
         elif self.phase == constants.READY_TO_SWITCH_PHASE:
@@ -116,6 +125,21 @@ class ButtonHandler:
         else:
             self._buttons_to_draw = []
 
+        # areas of buttons which appeared or disappeared have to be redrawn
+        if self._buttons_to_draw is not previous_buttons:
+            for button in previous_buttons + self._buttons_to_draw:
+                self._dirty_rects.append(button.rect)
+
+    def dirty_rects(self):
+        """returns list of areas changed since last call"""
+        dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        return dirty_rects
+
+    def next_update_time(self):
+        """buttons are not animated"""
+        return None
+
     def draw(self):
         """draws right buttons on screen"""
         if not self._buttons_to_draw:
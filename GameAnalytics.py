@@ -0,0 +1,424 @@
+""" streaming analytics of game logs, games are read and aggregated one by one,
+so logs much larger than memory can be analyzed"""
+from GameErrors import BoardSizeMismatchError
+from GameLog import (
+    GAME_STARTED_EVENT,
+    SHOT_EVENT,
+    read_game_events,
+    split_games,
+)
+import constants
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+import json
+import os
+import numpy as np
+
+# size of part of log file analyzed by worker in one task (in bytes)
+ANALYTICS_CHUNK_SIZE = 16 * 2**20
+
+# decoder is created once, json.loads of bytes also detects their encoding
+decode_event = json.JSONDecoder().decode
+
+
+class GameSummary:
+    """metrics of single logged game, the same as GameLogicController
+    shows on game result screen, and cells which players have shot
+
+    :param _gamemode: gamemode of the game
+    :type _gamemode: int
+    :param _board_shape: (board height, board width)
+    :type _board_shape: tuple
+    :param _rounds_played: how many shots have been performed
+    :type _rounds_played: int
+    :param _game_play_time: milliseconds from start of the game to last event
+    :type _game_play_time: int
+    :param _winner_index: 1 or 2 if player has won, otherwise None
+    :type _winner_index: int
+    :param _fleet_percentages: percentage of fleet intact of player 1 and 2
+    :type _fleet_percentages: tuple
+    :param _shot_cells: flat indices of cells shot by player 1 and 2
+    :type _shot_cells: tuple
+    :param _hit_cells: flat indices of cells where player 1 and 2 have hit ship
+    :type _hit_cells: tuple
+    """
+
+    __slots__ = (
+        "_gamemode",
+        "_board_shape",
+        "_rounds_played",
+        "_game_play_time",
+        "_winner_index",
+        "_fleet_percentages",
+        "_shot_cells",
+        "_hit_cells",
+    )
+
+    def __init__(
+        self,
+        gamemode,
+        board_shape,
+        rounds_played,
+        game_play_time,
+        winner_index,
+        fleet_percentages,
+        shot_cells,
+        hit_cells,
+    ):
+        self._gamemode = gamemode
+        self._board_shape = board_shape
+        self._rounds_played = rounds_played
+        self._game_play_time = game_play_time
+        self._winner_index = winner_index
+        self._fleet_percentages = fleet_percentages
+        self._shot_cells = shot_cells
+        self._hit_cells = hit_cells
+
+    @property
+    def gamemode(self):
+        return self._gamemode
+
+    @property
+    def board_shape(self):
+        return self._board_shape
+
+    @property
+    def rounds_played(self):
+        return self._rounds_played
+
+    @property
+    def game_play_time(self):
+        return timedelta(milliseconds=self._game_play_time)
+
+    @property
+    def game_play_milliseconds(self):
+        return self._game_play_time
+
+    @property
+    def winner_index(self):
+        return self._winner_index
+
+    @property
+    def fleet_percentages(self):
+        return self._fleet_percentages
+
+    @property
+    def shot_cells(self):
+        return self._shot_cells
+
+    @property
+    def hit_cells(self):
+        return self._hit_cells
+
+    def get_fleet_percentage(self, player_index):
+        """returns percentage of fleet intact of player 1 or 2"""
+        return self._fleet_percentages[player_index - 1]
+
+
+def summarize_game(events):
+    """returns GameSummary of events of single game, it is computed straight
+    from events, players and boards are not reconstructed"""
+    start_event = events[0]
+    board_height = start_event["board_height"]
+    board_width = start_event["board_width"]
+    total_segments = sum(
+        length * quantity for _, length, quantity in start_event["fleet"]
+    )
+
+    shot_cells = ([], [])
+    hit_cells = ([], [])
+    # how many segments of player 1 and 2 have been hit
+    segments_hit = [0, 0]
+    winner_index = None
+    for event in events:
+        if event["event"] != SHOT_EVENT:
+            continue
+        shooter = event["player"] - 1
+        cell = event["row"] * board_width + event["column"]
+        shot_cells[shooter].append(cell)
+        if event["status"] in (constants.SHIP_HIT, constants.SHIP_SUNK):
+            hit_cells[shooter].append(cell)
+            segments_hit[1 - shooter] += 1
+            if segments_hit[1 - shooter] == total_segments:
+                winner_index = event["player"]
+
+    if total_segments:
+        fleet_percentages = tuple(
+            ((total_segments - hit) * 100) // total_segments for hit in segments_hit
+        )
+    else:
+        fleet_percentages = (0, 0)
+    return GameSummary(
+        gamemode=start_event["gamemode"],
+        board_shape=(board_height, board_width),
+        rounds_played=len(shot_cells[0]) + len(shot_cells[1]),
+        game_play_time=events[-1]["time"],
+        winner_index=winner_index,
+        fleet_percentages=fleet_percentages,
+        shot_cells=shot_cells,
+        hit_cells=hit_cells,
+    )
+
+
+def summarize_games(path):
+    """yields GameSummary of every game logged in file"""
+    for game_events in split_games(read_game_events(path)):
+        yield summarize_game(game_events)
+
+
+class LogAnalytics:
+    """metrics aggregated over many logged games, all games must be played
+    on boards of the same size, index 0 of heatmaps is player 1 and 1 is
+    player 2 (player who shot)
+
+    :param _games_played: how many games have been added
+    :type _games_played: int
+    :param _wins: how many games player 1 and 2 have won
+    :type _wins: list
+    :param _rounds_distribution: maps rounds played to number of such games
+    :type _rounds_distribution: collections.Counter
+    :param _total_play_time: sum of play times of games in milliseconds
+    :type _total_play_time: int
+    :param _winner_fleet_distribution: maps percentage of winners fleet intact
+        to number of such games
+    :type _winner_fleet_distribution: collections.Counter
+    :param _board_shape: (board height, board width) of games, None before
+        first game is added
+    :type _board_shape: tuple
+    :param _shot_heatmaps: number of shots at every cell, shape (2, height, width)
+    :type _shot_heatmaps: numpy.ndarray
+    :param _hit_heatmaps: number of hits at every cell, shape (2, height, width)
+    :type _hit_heatmaps: numpy.ndarray
+    """
+
+    def __init__(self):
+        self._games_played = 0
+        self._wins = [0, 0]
+        self._rounds_distribution = Counter()
+        self._total_play_time = 0
+        self._winner_fleet_distribution = Counter()
+        self._board_shape = None
+        self._shot_heatmaps = None
+        self._hit_heatmaps = None
+
+    @property
+    def games_played(self):
+        return self._games_played
+
+    @property
+    def wins(self):
+        return tuple(self._wins)
+
+    @property
+    def finished_games(self):
+        return sum(self._wins)
+
+    @property
+    def rounds_distribution(self):
+        return self._rounds_distribution
+
+    @property
+    def winner_fleet_distribution(self):
+        return self._winner_fleet_distribution
+
+    @property
+    def board_shape(self):
+        return self._board_shape
+
+    @property
+    def mean_rounds(self):
+        """returns mean number of rounds played in a game"""
+        if self._games_played == 0:
+            return 0.0
+        total_rounds = sum(
+            rounds * games for rounds, games in self._rounds_distribution.items()
+        )
+        return total_rounds / self._games_played
+
+    @property
+    def mean_game_play_milliseconds(self):
+        """returns mean play time of a game in milliseconds"""
+        if self._games_played == 0:
+            return 0.0
+        return self._total_play_time / self._games_played
+
+    @property
+    def mean_game_play_time(self):
+        """returns mean play time of a game as timedelta"""
+        return timedelta(milliseconds=self.mean_game_play_milliseconds)
+
+    @property
+    def mean_winner_fleet_percentage(self):
+        """returns mean percentage of winners fleet intact in finished games"""
+        if self.finished_games == 0:
+            return 0.0
+        total_percentage = sum(
+            percentage * games
+            for percentage, games in self._winner_fleet_distribution.items()
+        )
+        return total_percentage / self.finished_games
+
+    def get_shot_heatmap(self, player_index=None):
+        """returns number of shots of player 1 or 2 at every cell,
+        shots of both players if player_index is None"""
+        return self._select_heatmap(self._shot_heatmaps, player_index)
+
+    def get_hit_heatmap(self, player_index=None):
+        """returns number of hits of player 1 or 2 at every cell,
+        hits of both players if player_index is None"""
+        return self._select_heatmap(self._hit_heatmaps, player_index)
+
+    def get_hit_rate_heatmap(self, player_index=None):
+        """returns part of shots at every cell which have hit a ship,
+        0 where nobody has shot"""
+        shots = self.get_shot_heatmap(player_index)
+        hits = self.get_hit_heatmap(player_index)
+        hit_rates = np.zeros(shots.shape, dtype=np.float64)
+        np.divide(hits, shots, out=hit_rates, where=shots > 0)
+        return hit_rates
+
+    def _select_heatmap(self, heatmaps, player_index):
+        if heatmaps is None:
+            return np.zeros((0, 0), dtype=np.int64)
+        if player_index is None:
+            return heatmaps.sum(axis=0)
+        return heatmaps[player_index - 1].copy()
+
+    def _check_board_shape(self, board_shape):
+        """creates heatmaps for first game, raises BoardSizeMismatchError if
+        board of game has different size than previous ones"""
+        board_shape = tuple(board_shape)
+        if self._board_shape is None:
+            self._board_shape = board_shape
+            self._shot_heatmaps = np.zeros((2,) + board_shape, dtype=np.int64)
+            self._hit_heatmaps = np.zeros((2,) + board_shape, dtype=np.int64)
+        elif board_shape != self._board_shape:
+            raise BoardSizeMismatchError(board_shape, self._board_shape)
+
+    def add_game(self, summary):
+        """adds GameSummary of single game"""
+        self._check_board_shape(summary.board_shape)
+        self._games_played += 1
+        self._rounds_distribution[summary.rounds_played] += 1
+        self._total_play_time += summary.game_play_milliseconds
+        if summary.winner_index is not None:
+            self._wins[summary.winner_index - 1] += 1
+            self._winner_fleet_distribution[
+                summary.get_fleet_percentage(summary.winner_index)
+            ] += 1
+
+        # views of heatmaps with cells in one row, indexed by flat index
+        shot_counts = self._shot_heatmaps.reshape(2, -1)
+        hit_counts = self._hit_heatmaps.reshape(2, -1)
+        cells_count = shot_counts.shape[1]
+        for player in range(2):
+            shot_counts[player] += np.bincount(
+                summary.shot_cells[player], minlength=cells_count
+            )
+            hit_counts[player] += np.bincount(
+                summary.hit_cells[player], minlength=cells_count
+            )
+
+    def add_games(self, summaries):
+        """adds all summaries (any iterable, e.g. generator), returns self"""
+        for summary in summaries:
+            self.add_game(summary)
+        return self
+
+    def merge(self, other):
+        """adds aggregated games of other LogAnalytics to this one"""
+        if other._board_shape is None:
+            return
+        self._check_board_shape(other._board_shape)
+        self._games_played += other._games_played
+        for index in range(2):
+            self._wins[index] += other._wins[index]
+        self._rounds_distribution.update(other._rounds_distribution)
+        self._total_play_time += other._total_play_time
+        self._winner_fleet_distribution.update(other._winner_fleet_distribution)
+        self._shot_heatmaps += other._shot_heatmaps
+        self._hit_heatmaps += other._hit_heatmaps
+
+    def as_dict(self):
+        """returns metrics (without heatmaps) as a dictionary of numbers,
+        which can be serialized to JSON"""
+        return {
+            "games_played": self.games_played,
+            "finished_games": self.finished_games,
+            "wins": self.wins,
+            "mean_rounds": self.mean_rounds,
+            "mean_game_play_milliseconds": self.mean_game_play_milliseconds,
+            "mean_winner_fleet_percentage": self.mean_winner_fleet_percentage,
+            "rounds_distribution": dict(self._rounds_distribution),
+            "winner_fleet_distribution": dict(self._winner_fleet_distribution),
+        }
+
+
+def split_log_file(path, chunk_size=ANALYTICS_CHUNK_SIZE):
+    """returns list of (path, start, end) byte ranges of log file,
+    each of them is at most chunk_size long"""
+    file_size = os.path.getsize(path)
+    return [
+        (path, start, min(start + chunk_size, file_size))
+        for start in range(0, file_size, chunk_size)
+    ]
+
+
+def read_log_chunk(path, start, end):
+    """yields events of games whose start event begins in byte range
+    [start, end) of log file, game is read to its end even if it continues
+    after the range, so every game belongs to exactly one range"""
+    with open(path, "rb") as log_file:
+        if start > 0:
+            # line which begins before start belongs to previous range
+            log_file.seek(start - 1)
+            log_file.readline()
+        position = log_file.tell()
+        in_game = False
+        for line in log_file:
+            line_start = position
+            position += len(line)
+            if not line.strip():
+                continue
+            event = decode_event(line.decode())
+            if event["event"] == GAME_STARTED_EVENT:
+                if line_start >= end:
+                    return
+                in_game = True
+            if in_game:
+                yield event
+
+
+def analyze_log_chunk(chunk):
+    """returns LogAnalytics of games in (path, start, end) byte range,
+    runs in worker process"""
+    path, start, end = chunk
+    games = split_games(read_log_chunk(path, start, end))
+    return LogAnalytics().add_games(
+        summarize_game(game_events) for game_events in games
+    )
+
+
+def analyze_logs(paths, workers=None, chunk_size=ANALYTICS_CHUNK_SIZE):
+    """analyzes games logged in files (path or list of paths), files are split
+    into chunks of chunk_size bytes which are analyzed by a pool of worker
+    processes (workers=None uses all cores, workers=1 analyzes in current
+    process), returns merged LogAnalytics"""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    chunks = []
+    for path in paths:
+        chunks.extend(split_log_file(path, chunk_size))
+
+    analytics = LogAnalytics()
+    if workers == 1:
+        for chunk in chunks:
+            analytics.merge(analyze_log_chunk(chunk))
+        return analytics
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_analytics in executor.map(analyze_log_chunk, chunks):
+            analytics.merge(chunk_analytics)
+    return analytics
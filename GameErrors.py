@@ -24,6 +24,19 @@ class NotSuchShipToPlaceError(Exception):
         self._lenght = lenght
 
 
+class FleetDoesNotFitError(Exception):
+    def __init__(self):
+        super().__init__("fleet cannot be placed on the free cells of the board")
+
+
+class FleetStoreMismatchError(Exception):
+    def __init__(self, fleet_index):
+        super().__init__(
+            f"fleet {fleet_index} of fleet store does not match fleet spec of player"
+        )
+        self._fleet_index = fleet_index
+
+
 class OutOfTableError(Exception):
     def __init__(self, row, column):
         super().__init__(
@@ -32,3 +45,46 @@ class OutOfTableError(Exception):
         )
         self._row = row
         self._column = column
+
+
+class SnapshotError(Exception):
+    def __init__(self, reason):
+        super().__init__(f"game snapshot cannot be restored: {reason}")
+
+
+class ReplayError(Exception):
+    def __init__(self, reason, event_index=None):
+        message = f"logged game cannot be replayed: {reason}"
+        if event_index is not None:
+            message += f" (event {event_index} of the game)"
+        super().__init__(message)
+        self._reason = reason
+        self._event_index = event_index
+
+    @property
+    def reason(self):
+        return self._reason
+
+    @property
+    def event_index(self):
+        return self._event_index
+
+
+class BoardSizeMismatchError(Exception):
+    def __init__(self, board_shape, expected_shape):
+        super().__init__(
+            f"game on board {board_shape} cannot be aggregated"
+            + f" with games on board {expected_shape}"
+        )
+        self._board_shape = board_shape
+        self._expected_shape = expected_shape
+
+
+class AssetBundleError(Exception):
+    def __init__(self, path, reason):
+        super().__init__(f"asset bundle {path} cannot be used: {reason}")
+
+
+class LayoutPoolError(Exception):
+    def __init__(self, path, reason):
+        super().__init__(f"layout pool {path} cannot be used: {reason}")
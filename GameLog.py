@@ -0,0 +1,231 @@
+""" append-only log of game events and headless replay of logged games"""
+from GameErrors import (
+    ReplayError,
+    CellAlreadyShotError,
+    ShipPlacingError,
+    NotSuchShipToPlaceError,
+)
+from Player import Player
+from Ships import FleetSpec
+import constants
+
+import json
+
+# types of logged events
+GAME_STARTED_EVENT = "start"
+SHIP_PLACED_EVENT = "placement"
+SHOT_EVENT = "shot"
+PHASE_CHANGED_EVENT = "phase"
+
+
+class GameEventLog:
+    """writes events of games as JSON lines (one event per line), every line
+    is flushed, so log of crashed session is complete up to last event.
+    Every event has "event" type and "time" in milliseconds since start
+    of the game, other fields depend on type:
+        start - gamemode, board_height, board_width, fleet (ship kinds)
+        placement - player (1 or 2), length, orientation, x, y
+        shot - player (1 or 2 who shot), row, column, status
+        phase - phase
+
+    :param _file: file where events are written
+    :type _file: io.TextIOBase
+    :param _events_count: how many events have been written
+    :type _events_count: int
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "a", encoding="utf-8")
+        self._events_count = 0
+
+    @property
+    def events_count(self):
+        return self._events_count
+
+    def record(self, event_type, time, **fields):
+        """appends single event to the log"""
+        event = {"event": event_type, "time": time}
+        event.update(fields)
+        self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self._events_count += 1
+
+    def close(self):
+        self._file.close()
+
+
+def read_game_events(path):
+    """yields events from log file one by one"""
+    with open(path, encoding="utf-8") as log_file:
+        for line in log_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def replay_games(path):
+    """yields GameReplay of every game logged in file"""
+    for game_events in split_games(read_game_events(path)):
+        yield GameReplay.from_events(game_events)
+
+
+def split_games(events):
+    """yields lists of events of single games, every game begins
+    with start event"""
+    game_events = []
+    for event in events:
+        if event["event"] == GAME_STARTED_EVENT and game_events:
+            yield game_events
+            game_events = []
+        game_events.append(event)
+    if game_events:
+        yield game_events
+
+
+class GameReplay:
+    """reconstructs logged game without pygame and without bots, ships are
+    placed and shots are performed on plain players exactly as they were
+    logged, status of every shot is checked against the log
+
+    :param _players: both players of the game
+    :type _players: list
+    :param _gamemode: gamemode of the game
+    :type _gamemode: int
+    :param _phase: phase of the game after last applied event
+    :type _phase: int
+    :param _time: time of last applied event
+    :type _time: int
+    :param _rounds_played: how many shots have been performed
+    :type _rounds_played: int
+    :param _winner_index: 1 or 2 if player has won, otherwise None
+    :type _winner_index: int
+    :param _events_applied: how many events of the game have been applied
+    :type _events_applied: int
+    """
+
+    def __init__(self):
+        self._events_applied = 0
+        self._players = []
+        self._gamemode = None
+        self._phase = constants.GAME_START_SCREEN
+        self._time = 0
+        self._rounds_played = 0
+        self._winner_index = None
+
+    @classmethod
+    def from_events(cls, events):
+        """returns replay with all events applied"""
+        replay = cls()
+        for event in events:
+            replay.apply(event)
+        return replay
+
+    @property
+    def players(self):
+        return self._players
+
+    @property
+    def gamemode(self):
+        return self._gamemode
+
+    @property
+    def phase(self):
+        return self._phase
+
+    @property
+    def time(self):
+        return self._time
+
+    @property
+    def rounds_played(self):
+        return self._rounds_played
+
+    @property
+    def winner_index(self):
+        return self._winner_index
+
+    def get_player(self, player_index):
+        """returns player 1 or 2, raises ReplayError for other index"""
+        if player_index not in (1, 2):
+            raise ReplayError(f"there is no player {player_index}")
+        return self._players[player_index - 1]
+
+    def apply(self, event):
+        """applies single event, raises ReplayError with index of the event
+        if event is not complete or it does not match reconstructed game"""
+        event_index = self._events_applied
+        try:
+            self.apply_event(event)
+        except ReplayError as error:
+            if error.event_index is not None:
+                raise
+            raise ReplayError(error.reason, event_index) from error
+        except KeyError as error:
+            raise ReplayError(f"event has no field {error}", event_index) from error
+        except (
+            CellAlreadyShotError,
+            ShipPlacingError,
+            NotSuchShipToPlaceError,
+            TypeError,
+            ValueError,
+        ) as error:
+            raise ReplayError(str(error), event_index) from error
+        self._events_applied += 1
+
+    def apply_event(self, event):
+        """applies single event without adding index of event to errors"""
+        event_type = event["event"]
+        self._time = event["time"]
+        if event_type == GAME_STARTED_EVENT:
+            self.start_game(event)
+        elif not self._players:
+            raise ReplayError("event before start of the game")
+        elif event_type == SHIP_PLACED_EVENT:
+            if event["orientation"] not in (
+                constants.SHIP_HORIZONTAL,
+                constants.SHIP_VERTICAL,
+            ):
+                raise ReplayError(f"invalid ship orientation {event['orientation']}")
+            self.get_player(event["player"]).add_ship(
+                event["length"], event["orientation"], event["x"], event["y"]
+            )
+        elif event_type == SHOT_EVENT:
+            self.perform_shot(event)
+        elif event_type == PHASE_CHANGED_EVENT:
+            self._phase = event["phase"]
+        else:
+            raise ReplayError(f"unknown event {event_type}")
+
+    def start_game(self, event):
+        """creates players of new game"""
+        fleet_spec = FleetSpec(
+            {ship_name: quantity for ship_name, _, quantity in event["fleet"]},
+            {ship_name: length for ship_name, length, _ in event["fleet"]},
+        )
+        self._players = [
+            Player(event["board_height"], event["board_width"], fleet_spec)
+            for _ in range(2)
+        ]
+        self._gamemode = event["gamemode"]
+        self._rounds_played = 0
+        self._winner_index = None
+
+    def perform_shot(self, event):
+        """performs logged shot and checks its status"""
+        # checks index of player who shot
+        self.get_player(event["player"])
+        opponent = self.get_player(3 - event["player"])
+        row = event["row"]
+        column = event["column"]
+        if not (
+            0 <= row < opponent.board_height and 0 <= column < opponent.board_width
+        ):
+            raise ReplayError(f"shot at ({row}, {column}) is outside the board")
+        status = opponent.take_attack(column, row)
+        if status != event["status"]:
+            raise ReplayError(
+                f"shot at ({event['row']}, {event['column']}) returned {status},"
+                + f" but {event['status']} was logged"
+            )
+        self._rounds_played += 1
+        if opponent.is_defeated:
+            self._winner_index = event["player"]
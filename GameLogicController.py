@@ -1,8 +1,46 @@
 import constants
-from Player import Player, BotPlayer
-from GameErrors import NotSuchShipToPlaceError, ShipPlacingError, CellAlreadyShotError
+from Player import Player, BotPlayer, SNAPSHOT_PLAYER_CLASSES
+from Ships import FleetSpec
+from GameErrors import (
+    NotSuchShipToPlaceError,
+    ShipPlacingError,
+    CellAlreadyShotError,
+    SnapshotError,
+)
+from Snapshot import SnapshotWriter, SnapshotReader
+from GameStatistics import GameStatistics, ShotStatistics
+from GameLog import (
+    GAME_STARTED_EVENT,
+    SHIP_PLACED_EVENT,
+    SHOT_EVENT,
+    PHASE_CHANGED_EVENT,
+)
 from datetime import timedelta
-import pygame
+import time
+
+try:
+    import pygame
+except ImportError:  # headless simulations can run without pygame
+    pygame = None
+
+
+# phases which can be restored from snapshot
+SNAPSHOT_PHASES = (
+    constants.GAME_START_SCREEN,
+    constants.POSITIONING_PHASE,
+    constants.GAME_PHASE,
+    constants.READY_TO_SWITCH_PHASE,
+    constants.BLACKSCREEN_PHASE,
+    constants.GAME_RESULT_PHASE,
+)
+
+
+def get_ticks():
+    """returns milliseconds since start of program, uses pygame clock
+    when pygame is available"""
+    if pygame is not None:
+        return pygame.time.get_ticks()
+    return int(time.monotonic() * 1000)
 
 
 class GameLogicController:
@@ -12,8 +50,8 @@ class GameLogicController:
     :type _board_height: int
     :param _board_width: how many cells does board have horizontally
     :type _board_width: int
-    :param _ship_configuration: represents how many ships of a kind player should place
-    :type _ship_configuration: dict
+    :param _fleet_spec: represents how many ships of a kind player should place
+    :type _fleet_spec: Ships.FleetSpec
     :param _game_is_running: if is's True game is running
     :type _game_is_running: bool
     :param _gamemode: stors id of gamemode (PVP or PVC)
@@ -42,17 +80,32 @@ class GameLogicController:
     :type _winner: Player.Player
     :param _total_ship_segments: represents how many segments in total ships can have
     :type _total_ship_segments: int
+    :param _shot_statistics: counters of shots of player1 and player2
+    :type _shot_statistics: list
+    :param _clock: returns current time in milliseconds (pygame clock by default)
+    :type _clock: callable
+    :param _event_log: log where events of the game are recorded or None
+    :type _event_log: GameLog.GameEventLog
     """
 
     def __init__(
         self,
         board_height=constants.BOARD_CELL_SIZE,
         board_width=constants.BOARD_CELL_SIZE,
-        ship_configuration=constants.STANDARD_SHIP_QUANTITIES,
+        ship_configuration=None,
+        clock=get_ticks,
+        event_log=None,
     ):
         self._board_height = board_height
         self._board_width = board_width
-        self._ship_configuration = ship_configuration
+        # ship_configuration is FleetSpec or dict mapping ship name to quantity,
+        # None means standard fleet
+        if isinstance(ship_configuration, FleetSpec):
+            self._fleet_spec = ship_configuration
+        else:
+            self._fleet_spec = FleetSpec(ship_configuration)
+        self._clock = clock
+        self._event_log = event_log
 
         self._game_is_running = True
         self._gamemode = None
@@ -67,10 +120,11 @@ class GameLogicController:
         self._prompts = []
 
         # variables for statistics
-        self._game_start_time = pygame.time.get_ticks()
+        self._game_start_time = self._clock()
         self._game_play_time = timedelta(milliseconds=0)
         self._total_ship_segments = None
         self._rounds_played = 0
+        self._shot_statistics = [ShotStatistics(), ShotStatistics()]
         self._winner = None
 
     @property
@@ -81,6 +135,18 @@ class GameLogicController:
     def gamemode(self):
         return self._gamemode
 
+    @property
+    def fleet_spec(self):
+        return self._fleet_spec
+
+    @property
+    def board_height(self):
+        return self._board_height
+
+    @property
+    def board_width(self):
+        return self._board_width
+
     @property
     def player1(self):
         return self._player1
@@ -120,6 +186,11 @@ class GameLogicController:
                 return "Player1"
             else:
                 return "Player2"
+        elif self._gamemode == constants.CVC:
+            if self._winner == self._player1:
+                return "Bot1"
+            else:
+                return "Bot2"
         else:
             if self._winner == self._player1:
                 return "Player"
@@ -132,32 +203,9 @@ class GameLogicController:
         if self._phase == constants.GAME_RESULT_PHASE:
             return timedelta(milliseconds=self._game_play_time)
 
-        time = pygame.time.get_ticks() - self._game_start_time
+        time = self._clock() - self._game_start_time
         return timedelta(milliseconds=time)
 
-    def get_play_time_as_str(self):
-        """returns time spend playing as a formated str"""
-        time_played = int(self.game_play_time.total_seconds())
-        minutes, seconds = divmod(time_played, 60)
-        hours, minutes = divmod(minutes, 60)
-
-        output_text = ""
-        if hours != 0:
-            if hours == 1:
-                output_text += str(hours) + " hour, "
-            else:
-                output_text += str(hours) + " hours, "
-        if minutes != 0:
-            if minutes == 1:
-                output_text += str(minutes) + " minute, "
-            else:
-                output_text += str(minutes) + " minutes, "
-        if seconds == 1:
-            output_text += str(seconds) + " second"
-        else:
-            output_text += str(seconds) + " seconds"
-        return output_text
-
     def get_player_names(self):
         """returns tuple of (current players name, opponent name)
         mainly for labeling tables"""
@@ -169,16 +217,27 @@ class GameLogicController:
             else:
                 return ("You - Player2", "Opponent - Player1")
 
-    def generate_statistics(self):
-        """returns a dictionary of statistics"""
-        statistics = {}
-        statistics["Time of gameplay"] = str(self.get_play_time_as_str())
-        statistics["Rounds played"] = str(self.rounds_played)
-        statistics["Percentage of winners fleet intact"] = str(
-            self.calculate_percentage_state_of_players_fleet(self.winner)
+    @property
+    def statistics(self):
+        """returns GameStatistics.GameStatistics with current numbers,
+        they are formatted only when they are displayed"""
+        winner_index = None
+        winner_alive_segments = None
+        if self._winner is not None:
+            winner_index = self.get_player_index(self._winner)
+            winner_alive_segments = self.calculate_players_alive_segments(self._winner)
+        return GameStatistics(
+            play_time=self.game_play_time // timedelta(milliseconds=1),
+            rounds_played=self._rounds_played,
+            players_shots=self._shot_statistics,
+            winner_index=winner_index,
+            winner_alive_segments=winner_alive_segments,
+            total_segments=self.get_total_ship_segments(),
         )
 
-        return statistics
+    def get_shot_statistics(self, player):
+        """returns counters of shots performed by player"""
+        return self._shot_statistics[self.get_player_index(player) - 1]
 
     def fetch_prompt(self):
         """returns propt to display and removes it from queue
@@ -191,28 +250,18 @@ class GameLogicController:
 
     def calculate_players_alive_segments(self, player):
         """returns how many alive ship segments does player have"""
-        player_alive_segments_counter = 0
-        for ship in player.fleet:
-            player_alive_segments_counter += ship.length - ship.hit_counter
-
-        return player_alive_segments_counter
+        return player.alive_segments
 
     def get_total_ship_segments(self):
         """retuns how many ship segments on player can have
         calculates this value if it has not been done previously"""
         if self._total_ship_segments is None:
-            self._total_ship_segments = self.calculate_total_ship_segments
-        return self._total_ship_segments()
+            self._total_ship_segments = self.calculate_total_ship_segments()
+        return self._total_ship_segments
 
     def calculate_total_ship_segments(self):
         """returns how many ship segments are in total"""
-        total_segment_counter = 0
-        for ship_name in constants.STANDARD_SHIP_QUANTITIES:
-            quantity = constants.STANDARD_SHIP_QUANTITIES[ship_name]
-            length = constants.SHIP_LENGTHS[ship_name]
-            total_segment_counter += quantity * length
-
-        return total_segment_counter
+        return self._fleet_spec.total_segments
 
     def calculate_percentage_state_of_players_fleet(self, player):
         """returns percentage equal to total not shot ship segments
@@ -226,6 +275,66 @@ class GameLogicController:
         except ZeroDivisionError:
             return 0
 
+    def reset(self):
+        """returns to start screen, board size, fleet, clock and event log
+        are kept"""
+        self.__init__(
+            board_height=self._board_height,
+            board_width=self._board_width,
+            ship_configuration=self._fleet_spec,
+            clock=self._clock,
+            event_log=self._event_log,
+        )
+
+    def get_player_index(self, player):
+        """returns 1 for player1 and 2 for player2"""
+        return 1 if player is self._player1 else 2
+
+    def record_event(self, event_type, **fields):
+        """records event in event log if there is one"""
+        if self._event_log is not None:
+            self._event_log.record(
+                event_type, self._clock() - self._game_start_time, **fields
+            )
+
+    def record_game_start(self):
+        """records start of the game and ships players have already placed"""
+        if self._event_log is None:
+            return
+        self.record_event(
+            GAME_STARTED_EVENT,
+            gamemode=self._gamemode,
+            board_height=self._board_height,
+            board_width=self._board_width,
+            fleet=self._fleet_spec.ship_kinds,
+        )
+        for player in (self._player1, self._player2):
+            for length, orientation, coordinate_x, coordinate_y in player.placements:
+                self.record_event(
+                    SHIP_PLACED_EVENT,
+                    player=self.get_player_index(player),
+                    length=length,
+                    orientation=orientation,
+                    x=coordinate_x,
+                    y=coordinate_y,
+                )
+
+    def record_shot(self, player, target_row, target_column, attack_status):
+        """counts shot performed by player and records it"""
+        self.get_shot_statistics(player).add_shot(attack_status)
+        self.record_event(
+            SHOT_EVENT,
+            player=self.get_player_index(player),
+            row=target_row,
+            column=target_column,
+            status=attack_status,
+        )
+
+    def change_phase(self, phase):
+        """changes phase of the game and records it"""
+        self._phase = phase
+        self.record_event(PHASE_CHANGED_EVENT, phase=phase)
+
     def switch_current_player(self):
         """handles switching users in PVP"""
         if self._current_player == self._player1:
@@ -235,22 +344,28 @@ class GameLogicController:
             self._current_player = self._player1
             self._player_attacked = self._player2
 
-        self._phase = constants.BLACKSCREEN_PHASE
+        self.change_phase(constants.BLACKSCREEN_PHASE)
 
     def game_mode_selected(self, gamemode):
         """trigged when user(s) have selected gamemode, initializes players
         and in case of PVC bot places ships"""
         # initializing players
         self._player1 = Player(
-            board_height=self._board_height, board_width=self._board_width
+            board_height=self._board_height,
+            board_width=self._board_width,
+            fleet_spec=self._fleet_spec,
         )
         if gamemode == constants.PVP:
             self._player2 = Player(
-                board_height=self._board_height, board_width=self._board_width
+                board_height=self._board_height,
+                board_width=self._board_width,
+                fleet_spec=self._fleet_spec,
             )
         else:
             self._player2 = BotPlayer(
-                board_height=self._board_height, board_width=self._board_width
+                board_height=self._board_height,
+                board_width=self._board_width,
+                fleet_spec=self._fleet_spec,
             )
             # bot places ships
             self._player2.position_ships()
@@ -261,9 +376,54 @@ class GameLogicController:
 
         # setting phase and gamemode
         self._gamemode = gamemode
-        self._phase = constants.POSITIONING_PHASE
+        self._game_start_time = self._clock()
+        self.record_game_start()
+        self.change_phase(constants.POSITIONING_PHASE)
+
+    def bots_selected(self, bot1, bot2):
+        """starts game of two bots (CVC), both bots position ships
+        and game phase starts immediately"""
+        self._player1 = bot1
+        self._player2 = bot2
+        self._player1.position_ships()
+        self._player2.position_ships()
+
+        self._current_player = self._player1
+        self._player_attacked = self._player2
+
+        self._gamemode = constants.CVC
+        self._phase_to_return = constants.GAME_PHASE
+        self._game_start_time = self._clock()
+        self.record_game_start()
+        self.change_phase(constants.GAME_PHASE)
+
+    def play_bot_round(self):
+        """handles single attack of current bot in CVC game, returns
+        attack status"""
+        if self._phase != constants.GAME_PHASE:
+            return None
+
+        attack_status = self._current_player.perform_attack(self._player_attacked)
+        self._rounds_played += 1
+        if attack_status is not None:
+            target_row, target_column = self._current_player.last_target
+            self.record_shot(
+                self._current_player, target_row, target_column, attack_status
+            )
 
-        self._game_start_time = pygame.time.get_ticks()
+        # check if current bot has won
+        if self._player_attacked.is_defeated:
+            self._game_play_time = self._clock() - self._game_start_time
+            self._winner = self._current_player
+            self.change_phase(constants.GAME_RESULT_PHASE)
+            return attack_status
+
+        # bots do not need blackscreen phase to switch
+        self._current_player, self._player_attacked = (
+            self._player_attacked,
+            self._current_player,
+        )
+        return attack_status
 
     def player_positions_ships(
         self, player, start_row, start_column, end_row, end_column
@@ -289,8 +449,18 @@ class GameLogicController:
             )
         except NotSuchShipToPlaceError:
             self._prompts.append("Not such ship to place")
+            return
         except ShipPlacingError:
             self._prompts.append("Cannot place ship here")
+            return
+        self.record_event(
+            SHIP_PLACED_EVENT,
+            player=self.get_player_index(player),
+            length=new_ship_length,
+            orientation=new_ship_orientation,
+            x=min(start_column, end_column),
+            y=min(start_row, end_row),
+        )
 
     def position_ships_phase(self, start_row, start_column, end_row, end_column):
         """handles game positioning phase"""
@@ -302,15 +472,15 @@ class GameLogicController:
         # switch phase if all players have placed ships
         if (not self._player1.ships_to_place) and (not self._player2.ships_to_place):
             self._prompts.append("All ships positioned")
-            self._phase = constants.GAME_PHASE
             self._phase_to_return = constants.GAME_PHASE
+            self.change_phase(constants.GAME_PHASE)
             return
 
         # current player has placed all the ships and other player has not
         elif (
             not self._current_player.ships_to_place
         ) and self._gamemode == constants.PVP:
-            self._phase = constants.READY_TO_SWITCH_PHASE
+            self.change_phase(constants.READY_TO_SWITCH_PHASE)
             self._prompts.append("All ships positioned")
 
     def play_game_phase(self, shot_row, shot_column):
@@ -328,13 +498,14 @@ class GameLogicController:
             return
 
         self._rounds_played += 1
+        self.record_shot(self._current_player, shot_row, shot_column, attack_status)
 
         # check if current player has won
         if self._player_attacked.is_defeated:
             # current player has won
-            self._game_play_time = pygame.time.get_ticks() - self._game_start_time
+            self._game_play_time = self._clock() - self._game_start_time
             self._winner = self._current_player
-            self._phase = constants.GAME_RESULT_PHASE
+            self.change_phase(constants.GAME_RESULT_PHASE)
             return
 
         # prompting user attack status
@@ -347,23 +518,28 @@ class GameLogicController:
 
         # swithcing current player or computer attacks
         if self._gamemode == constants.PVP:
-            self._phase = constants.READY_TO_SWITCH_PHASE
+            self.change_phase(constants.READY_TO_SWITCH_PHASE)
         else:
             # computer performs attack
-            self._player2.perform_attack(self._player1)
+            attack_status = self._player2.perform_attack(self._player1)
             # increment round counter
             self._rounds_played += 1
+            if attack_status is not None:
+                target_row, target_column = self._player2.last_target
+                self.record_shot(
+                    self._player2, target_row, target_column, attack_status
+                )
             # check if bot has won
             if self._current_player.is_defeated:
                 self._winner = self._player2
-                self._phase = constants.GAME_RESULT_PHASE
-                self._game_play_time = pygame.time.get_ticks() - self._game_start_time
+                self.change_phase(constants.GAME_RESULT_PHASE)
+                self._game_play_time = self._clock() - self._game_start_time
                 return
 
     def exit_black_screen_phase(self):
         """method trigged when user have switch in real world
         and current user is ready to proceed"""
-        self._phase = self._phase_to_return
+        self.change_phase(self._phase_to_return)
 
     def players_cells_selected(self, start_row, start_column, end_row, end_column):
         """method trigger when user has selected cells on his own(left) board"""
@@ -383,3 +559,136 @@ class GameLogicController:
     def exit_game(self):
         """method triggered to exit game"""
         self._game_is_running = False
+
+    def clone(self):
+        """returns independent copy of game for exploring moves, players
+        are cloned, fleet spec and clock are shared, moves of clone
+        are not recorded in event log of the game"""
+        game_controller = object.__new__(type(self))
+        game_controller.__dict__.update(self.__dict__)
+        game_controller._event_log = None
+        game_controller._prompts = self._prompts.copy()
+        game_controller._shot_statistics = [
+            shot_statistics.clone() for shot_statistics in self._shot_statistics
+        ]
+
+        # references to players have to point to their clones
+        player_clones = {None: None}
+        for player in (self._player1, self._player2):
+            if player is not None:
+                player_clones[player] = player.clone()
+        game_controller._player1 = player_clones[self._player1]
+        game_controller._player2 = player_clones[self._player2]
+        game_controller._current_player = player_clones[self._current_player]
+        game_controller._player_attacked = player_clones[self._player_attacked]
+        game_controller._winner = player_clones[self._winner]
+        return game_controller
+
+    def snapshot(self):
+        """returns bytes with whole state of game (see Snapshot), timers are
+        stored as time elapsed since start of game"""
+        writer = SnapshotWriter()
+        writer.write_int(self._board_height)
+        writer.write_int(self._board_width)
+        self._fleet_spec.write_snapshot(writer)
+
+        writer.write_bool(self._game_is_running)
+        writer.write_int(-1 if self._gamemode is None else self._gamemode)
+        writer.write_int(self._phase)
+        writer.write_int(self._phase_to_return)
+        writer.write_int(len(self._prompts))
+        for prompt in self._prompts:
+            writer.write_str(prompt)
+
+        game_play_time = self._game_play_time
+        if isinstance(game_play_time, timedelta):
+            game_play_time = game_play_time // timedelta(milliseconds=1)
+        writer.write_int(self._clock() - self._game_start_time)
+        writer.write_int(game_play_time)
+        writer.write_int(self._rounds_played)
+
+        players = [self._player1, self._player2]
+        for player in players:
+            if player is None:
+                writer.write_int(-1)
+            else:
+                writer.write_int(SNAPSHOT_PLAYER_CLASSES.index(type(player)))
+                player.write_snapshot(writer)
+        # players are stored as 1 and 2, 0 is None
+        writer.write_int(([None] + players).index(self._current_player))
+        writer.write_int(([None] + players).index(self._winner))
+        return writer.getvalue()
+
+    @classmethod
+    def restore(cls, data, clock=get_ticks):
+        """returns game controller restored from snapshot() bytes, time
+        elapsed since start of game is counted from now on clock,
+        raises GameErrors.SnapshotError if data is not valid snapshot"""
+        reader = SnapshotReader(data)
+        board_height, board_width = reader.read_board_size()
+        cells_count = board_height * board_width
+        fleet_spec = FleetSpec.read_snapshot(reader, cells_count)
+        game_controller = cls(
+            board_height=board_height,
+            board_width=board_width,
+            ship_configuration=fleet_spec,
+            clock=clock,
+        )
+
+        game_controller._game_is_running = reader.read_bool()
+        gamemode = reader.read_int()
+        if gamemode not in (-1, constants.PVP, constants.PVC, constants.CVC):
+            raise SnapshotError(f"unknown gamemode {gamemode}")
+        game_controller._gamemode = None if gamemode == -1 else gamemode
+        game_controller._phase = reader.read_int()
+        game_controller._phase_to_return = reader.read_int()
+        for phase in (game_controller._phase, game_controller._phase_to_return):
+            if phase not in SNAPSHOT_PHASES:
+                raise SnapshotError(f"unknown phase {phase}")
+        # every prompt takes at least 4 bytes
+        prompts_count = reader.read_count(len(data) // 4)
+        game_controller._prompts = [reader.read_str() for _ in range(prompts_count)]
+
+        max_time = timedelta.max // timedelta(milliseconds=1)
+        game_controller._game_start_time = clock() - reader.read_count(max_time)
+        game_play_time = reader.read_count(max_time)
+        if game_controller._phase != constants.GAME_RESULT_PHASE:
+            game_play_time = timedelta(milliseconds=game_play_time)
+        game_controller._game_play_time = game_play_time
+        game_controller._rounds_played = reader.read_count(2 * cells_count)
+
+        players = []
+        for _ in range(2):
+            # -1 is stored when there is no player
+            player_kind = reader.read_int()
+            if not -1 <= player_kind < len(SNAPSHOT_PLAYER_CLASSES):
+                raise SnapshotError(f"unknown kind of player {player_kind}")
+            if player_kind == -1:
+                players.append(None)
+                continue
+            player = SNAPSHOT_PLAYER_CLASSES[player_kind].read_snapshot(reader)
+            if (player.board_height, player.board_width) != (
+                board_height,
+                board_width,
+            ) or player.fleet_spec.ship_kinds != fleet_spec.ship_kinds:
+                raise SnapshotError("player has different board or fleet than game")
+            players.append(player)
+        game_controller._player1, game_controller._player2 = players
+        if None not in players:
+            game_controller._player1.finish_restore(game_controller._player2)
+            game_controller._player2.finish_restore(game_controller._player1)
+            # counters are not stored, shots can be counted on boards
+            game_controller._shot_statistics = [
+                ShotStatistics.from_opponent(game_controller._player2),
+                ShotStatistics.from_opponent(game_controller._player1),
+            ]
+
+        game_controller._current_player = ([None] + players)[reader.read_index(3)]
+        game_controller._player_attacked = None
+        if game_controller._current_player is not None:
+            game_controller._player_attacked = players[
+                1 - players.index(game_controller._current_player)
+            ]
+        game_controller._winner = ([None] + players)[reader.read_index(3)]
+        reader.check_end()
+        return game_controller
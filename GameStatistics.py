@@ -0,0 +1,243 @@
+""" numeric statistics of games, they are turned into text only when displayed"""
+import constants
+
+from datetime import timedelta
+
+
+class ShotStatistics:
+    """counters of shots of single player, updated after every shot
+
+    :param _shots: how many shots player has performed
+    :type _shots: int
+    :param _hits: how many shots have hit a ship (including sinking shots)
+    :type _hits: int
+    :param _ships_sunk: how many ships player has sunk
+    :type _ships_sunk: int
+    """
+
+    __slots__ = ("_shots", "_hits", "_ships_sunk")
+
+    def __init__(self, shots=0, hits=0, ships_sunk=0):
+        self._shots = shots
+        self._hits = hits
+        self._ships_sunk = ships_sunk
+
+    @classmethod
+    def from_opponent(cls, opponent):
+        """returns counters of shots performed at opponent so far,
+        used when there is no record of single shots (restored games),
+        sunk ships are not in fleet any more, so placements are used"""
+        placed_segments = sum(length for length, _, _, _ in opponent.placements)
+        return cls(
+            shots=int(opponent.board.shots.sum()),
+            hits=placed_segments - opponent.alive_segments,
+            ships_sunk=len(opponent.placements) - opponent.alive_ships_count,
+        )
+
+    @property
+    def shots(self):
+        return self._shots
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._shots - self._hits
+
+    @property
+    def ships_sunk(self):
+        return self._ships_sunk
+
+    @property
+    def accuracy(self):
+        """returns part of shots which have hit a ship (0.0 - 1.0)"""
+        if self._shots == 0:
+            return 0.0
+        return self._hits / self._shots
+
+    def add_shot(self, attack_status):
+        """counts single shot with its status"""
+        self._shots += 1
+        if attack_status in (constants.SHIP_HIT, constants.SHIP_SUNK):
+            self._hits += 1
+        if attack_status == constants.SHIP_SUNK:
+            self._ships_sunk += 1
+
+    def clone(self):
+        return ShotStatistics(self._shots, self._hits, self._ships_sunk)
+
+    def as_dict(self):
+        return {
+            "shots": self.shots,
+            "hits": self.hits,
+            "misses": self.misses,
+            "accuracy": self.accuracy,
+            "ships_sunk": self.ships_sunk,
+        }
+
+
+class GameStatistics:
+    """numeric statistics of a game at the moment they were taken,
+    shot counters of both players are added up by shots, hits etc.
+
+    :param _play_time: time of gameplay in milliseconds
+    :type _play_time: int
+    :param _rounds_played: how many rounds have been played
+    :type _rounds_played: int
+    :param _players_shots: ShotStatistics of player 1 and 2
+    :type _players_shots: tuple
+    :param _winner_index: 1 or 2 if player has won, otherwise None
+    :type _winner_index: int
+    :param _winner_alive_segments: alive ship segments of winner, None
+        if nobody has won
+    :type _winner_alive_segments: int
+    :param _total_segments: how many segments fleet of a player has
+    :type _total_segments: int
+    """
+
+    __slots__ = (
+        "_play_time",
+        "_rounds_played",
+        "_players_shots",
+        "_winner_index",
+        "_winner_alive_segments",
+        "_total_segments",
+    )
+
+    def __init__(
+        self,
+        play_time,
+        rounds_played,
+        players_shots,
+        winner_index,
+        winner_alive_segments,
+        total_segments,
+    ):
+        self._play_time = play_time
+        self._rounds_played = rounds_played
+        self._players_shots = tuple(shots.clone() for shots in players_shots)
+        self._winner_index = winner_index
+        self._winner_alive_segments = winner_alive_segments
+        self._total_segments = total_segments
+
+    @property
+    def play_time(self):
+        """returns time of gameplay as timedelta"""
+        return timedelta(milliseconds=self._play_time)
+
+    @property
+    def play_time_seconds(self):
+        return self._play_time / 1000
+
+    @property
+    def rounds_played(self):
+        return self._rounds_played
+
+    @property
+    def winner_index(self):
+        return self._winner_index
+
+    @property
+    def total_segments(self):
+        return self._total_segments
+
+    @property
+    def winner_alive_segments(self):
+        return self._winner_alive_segments
+
+    @property
+    def shots(self):
+        return sum(shots.shots for shots in self._players_shots)
+
+    @property
+    def hits(self):
+        return sum(shots.hits for shots in self._players_shots)
+
+    @property
+    def misses(self):
+        return self.shots - self.hits
+
+    @property
+    def ships_sunk(self):
+        return sum(shots.ships_sunk for shots in self._players_shots)
+
+    @property
+    def accuracy(self):
+        """returns part of all shots which have hit a ship (0.0 - 1.0)"""
+        if self.shots == 0:
+            return 0.0
+        return self.hits / self.shots
+
+    @property
+    def winner_fleet_intact(self):
+        """returns part of winners fleet which has not been hit (0.0 - 1.0),
+        None if nobody has won"""
+        if self._winner_alive_segments is None:
+            return None
+        if self._total_segments == 0:
+            return 0.0
+        return self._winner_alive_segments / self._total_segments
+
+    @property
+    def winner_fleet_intact_percentage(self):
+        """returns whole percentage of winners fleet which has not been hit,
+        None if nobody has won"""
+        if self._winner_alive_segments is None:
+            return None
+        if self._total_segments == 0:
+            return 0
+        return (self._winner_alive_segments * 100) // self._total_segments
+
+    def get_player_shots(self, player_index):
+        """returns ShotStatistics of player 1 or 2"""
+        return self._players_shots[player_index - 1]
+
+    def as_dict(self):
+        """returns statistics as a dictionary of numbers"""
+        return {
+            "play_time_seconds": self.play_time_seconds,
+            "rounds_played": self.rounds_played,
+            "shots": self.shots,
+            "hits": self.hits,
+            "misses": self.misses,
+            "accuracy": self.accuracy,
+            "ships_sunk": self.ships_sunk,
+            "winner": self.winner_index,
+            "winner_fleet_intact": self.winner_fleet_intact,
+            "players": [shots.as_dict() for shots in self._players_shots],
+        }
+
+
+def format_quantity(quantity, unit):
+    """returns quantity with unit in singular or plural"""
+    if quantity == 1:
+        return f"{quantity} {unit}"
+    return f"{quantity} {unit}s"
+
+
+def format_play_time(play_time):
+    """returns play time (timedelta) as text, e.g. 1 hour, 2 minutes, 1 second"""
+    time_played = int(play_time.total_seconds())
+    minutes, seconds = divmod(time_played, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    parts = []
+    if hours != 0:
+        parts.append(format_quantity(hours, "hour"))
+    if minutes != 0:
+        parts.append(format_quantity(minutes, "minute"))
+    parts.append(format_quantity(seconds, "second"))
+    return ", ".join(parts)
+
+
+def format_statistics(statistics):
+    """returns dictionary of texts shown on game result screen"""
+    return {
+        "Time of gameplay": format_play_time(statistics.play_time),
+        "Rounds played": str(statistics.rounds_played),
+        "Percentage of winners fleet intact": str(
+            statistics.winner_fleet_intact_percentage
+        ),
+    }
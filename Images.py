@@ -1,5 +1,58 @@
 import constants
+from MemoryAccess import prepare_image, SEE_IMAGE_PATHS
+from collections import OrderedDict
 from copy import copy
+import pygame
+
+
+class TextCache:
+    """least recently used cache of rendered texts, texts displayed on screen
+    almost never change, so they are rendered only once
+
+    :param _max_size: how many texts can be stored
+    :type _max_size: int
+    :param _surfaces: maps (text, font, color) to rendered text, the least
+        recently used one is first
+    :type _surfaces: collections.OrderedDict
+    :param _hits: how many times rendered text was found in cache
+    :type _hits: int
+    :param _misses: how many times text had to be rendered
+    :type _misses: int
+    """
+
+    def __init__(self, max_size=constants.TEXT_CACHE_SIZE):
+        self._max_size = max_size
+        self._surfaces = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def get(self, text, font, text_color):
+        """returns rendered text, renders it only if it is not in cache"""
+        # colors can be given as tuples, lists or ints
+        key = (text, font, tuple(pygame.Color(text_color)))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self._misses += 1
+        surface = font.render(text, True, text_color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._max_size:
+            self._surfaces.popitem(last=False)
+        return surface
 
 
 class ImageHandler:
@@ -15,6 +68,8 @@ class ImageHandler:
     :type _blackscreen_prompt: pygame.Surface
     :param _logo_image: image of game logo presented on strart screen
     :type _logo_image: pygame.Surface
+    :param _text_cache: rendered texts
+    :type _text_cache: TextCache
     """
 
     def __init__(self, asset_loader, game_controller):
@@ -24,11 +79,20 @@ class ImageHandler:
 
         self._blackscreen_prompt = None
         self._logo_image = None
+        self._text_cache = TextCache()
 
     @property
     def see_images(self):
         return copy(self._assets.see_images)
 
+    @property
+    def see_images_count(self):
+        return len(SEE_IMAGE_PATHS)
+
+    def get_see_image(self, index):
+        """returns single see image, others can be still loading"""
+        return self._assets.get_see_image(index)
+
     @property
     def table_image(self):
         return copy(self._assets.table_image)
@@ -57,6 +121,43 @@ class ImageHandler:
     def status_bar_background(self):
         return copy(self._assets.status_bar_background)
 
+    @property
+    def cell_size(self):
+        """returns size of cell to which cell images are pre-scaled"""
+        return self._assets.cell_size
+
+    def get_cell_images(self, images, cell_size):
+        """returns list of images scaled to cell_size x cell_size
+        (copies if they already have this size, e.g. were pre-scaled)"""
+        scaled_images = []
+        for image in images:
+            if image.get_size() == (cell_size, cell_size):
+                scaled_images.append(copy(image))
+            else:
+                scaled_images.append(prepare_image(image, (cell_size, cell_size)))
+        return scaled_images
+
+    def get_table_image(self, board_layout):
+        """returns image of table grid for board_layout, image from assets
+        is used if its grid fits the board, otherwise grid is drawn"""
+        table_size = (board_layout.table_width, board_layout.table_height)
+        cell_size = board_layout.cell_size
+        if (
+            cell_size == constants.CELL_SIZE
+            and self._assets.table_image.get_size() == table_size
+        ):
+            return copy(self._assets.table_image)
+
+        image = pygame.Surface(table_size, pygame.SRCALPHA)
+        width, height = table_size
+        for column in range(board_layout.board_width + 1):
+            x = min(column * cell_size, width - 1)
+            pygame.draw.line(image, constants.TABLE_GRID_COLOR, (x, 0), (x, height))
+        for row in range(board_layout.board_height + 1):
+            y = min(row * cell_size, height - 1)
+            pygame.draw.line(image, constants.TABLE_GRID_COLOR, (0, y), (width, y))
+        return prepare_image(image)
+
     @property
     def logo_image(self):
         """returns game logo image (generates on if needed)"""
@@ -102,9 +203,14 @@ class ImageHandler:
         x = (outer_image.get_width() - inner_image.get_width()) // 2
         return (x, y)
 
+    @property
+    def text_cache(self):
+        return self._text_cache
+
     def get_image_from_text(self, text, font, text_color):
-        """returns pygame.Surface created from text"""
-        return font.render(text, True, text_color)
+        """returns pygame.Surface created from text, surface is shared with
+        cache, so it has to be copied before it is changed"""
+        return self._text_cache.get(text, font, text_color)
 
     def get_button_image(self, button_text):
         """returns right button image with button_text"""
@@ -148,8 +254,11 @@ class ImageHandler:
     def get_prompt_image(self, text):
         """returns text image used in prompts"""
         font = self._assets.pixel_font_for_prompt
-        return self.get_image_from_text(
-            text=text, font=font, text_color=constants.PROMPT_COLOR
+        # prompt changes alpha of its image
+        return copy(
+            self.get_image_from_text(
+                text=text, font=font, text_color=constants.PROMPT_COLOR
+            )
         )
 
     def generate_logo_image(self):
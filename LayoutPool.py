@@ -0,0 +1,248 @@
+"""pre-generated bot fleet layouts stored in memory-mapped files"""
+
+from GameErrors import LayoutPoolError
+from Player import BotPlayer
+from Ships import FleetSpec
+import constants
+
+import hashlib
+import os
+import random
+import struct
+import tempfile
+import numpy as np
+
+# layouts are generated and written to file in batches of this size
+LAYOUT_POOL_BATCH_SIZE = 10000
+# header is (magic, version, board height, board width, number of ships,
+# number of layouts, bytes per number), it is followed by lengths of ships
+# (the longest first) and layouts
+LAYOUT_POOL_MAGIC = b"BSLP"
+LAYOUT_POOL_VERSION = 1
+LAYOUT_POOL_HEADER = struct.Struct("<4sIIIIII")
+LAYOUT_POOL_SHIP_LENGTH = struct.Struct("<I")
+# layouts start at offset divisible by this
+LAYOUT_POOL_ALIGNMENT = 16
+
+
+def layout_pool_path(directory, board_height, board_width, ship_lengths):
+    """returns path of file with layouts for given board and fleet"""
+    fleet = "-".join(str(length) for length in sorted(ship_lengths, reverse=True))
+    fleet_hash = hashlib.sha1(fleet.encode()).hexdigest()[:12]
+    return os.path.join(
+        directory, f"layouts_{board_height}x{board_width}_{fleet_hash}.pool"
+    )
+
+
+def layouts_start(ships_count):
+    """returns offset of layouts in file of pool with ships_count ships"""
+    header_size = LAYOUT_POOL_HEADER.size + ships_count * LAYOUT_POOL_SHIP_LENGTH.size
+    return -(-header_size // LAYOUT_POOL_ALIGNMENT) * LAYOUT_POOL_ALIGNMENT
+
+
+class LayoutPool:
+    """pool of valid fleet layouts, each layout is array of shape
+    (ships, 4) with rows (length, orientation, coordinate_x, coordinate_y),
+    so they can be passed straight to Player.add_ship
+
+    layouts are kept in file opened as read only memory map, so drawing
+    layout is O(1) and pool can be shared by many processes, file starts
+    with size of the board and lengths of ships the layouts were generated
+    for, so pool cannot be used for other board or fleet
+
+    :param _path: path of file with layouts
+    :type _path: str
+    :param _board_height: height of the board of layouts
+    :type _board_height: int
+    :param _board_width: width of the board of layouts
+    :type _board_width: int
+    :param _ship_lengths: lengths of ships in every layout, the longest first
+    :type _ship_lengths: list
+    :param _layouts: array of shape (layouts, ships, 4)
+    :type _layouts: numpy.memmap
+    """
+
+    def __init__(self, path):
+        """raises LayoutPoolError if path is not complete layout pool"""
+        self._path = path
+        with open(path, "rb") as pool_file:
+            header = pool_file.read(LAYOUT_POOL_HEADER.size)
+            if len(header) < LAYOUT_POOL_HEADER.size:
+                raise LayoutPoolError(path, "file is too short")
+            (
+                magic,
+                version,
+                self._board_height,
+                self._board_width,
+                ships_count,
+                count,
+                item_size,
+            ) = LAYOUT_POOL_HEADER.unpack(header)
+            if magic != LAYOUT_POOL_MAGIC:
+                raise LayoutPoolError(path, "it is not layout pool")
+            if version != LAYOUT_POOL_VERSION:
+                raise LayoutPoolError(path, f"unsupported version {version}")
+            if item_size not in (1, 2):
+                raise LayoutPoolError(path, f"unsupported number size {item_size}")
+            lengths_data = pool_file.read(ships_count * LAYOUT_POOL_SHIP_LENGTH.size)
+            if len(lengths_data) < ships_count * LAYOUT_POOL_SHIP_LENGTH.size:
+                raise LayoutPoolError(path, "file is too short")
+            self._ship_lengths = [
+                length for length, in LAYOUT_POOL_SHIP_LENGTH.iter_unpack(lengths_data)
+            ]
+            start = layouts_start(ships_count)
+            # interrupted copy of the file must not be drawn from
+            if os.fstat(pool_file.fileno()).st_size != (
+                start + count * ships_count * 4 * item_size
+            ):
+                raise LayoutPoolError(path, "size of file does not match layouts")
+
+        dtype = np.uint8 if item_size == 1 else np.dtype("<u2")
+        if count * ships_count == 0:
+            # empty file region cannot be mapped
+            self._layouts = np.zeros((count, ships_count, 4), dtype=dtype)
+        else:
+            self._layouts = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                offset=start,
+                shape=(count, ships_count, 4),
+            )
+
+    @classmethod
+    def create(cls, path, count, board_height, board_width, ship_lengths, seed=None):
+        """generates count layouts, saves them in path and returns pool,
+        raises FleetDoesNotFitError if fleet cannot be placed. Layouts are
+        written to temporary file which replaces path when it is complete,
+        so failed generation does not leave invalid pool and processes which
+        have old file mapped keep reading it"""
+        ship_lengths = sorted(ship_lengths, reverse=True)
+        item_size = 1 if max(board_height, board_width) <= 255 else 2
+        dtype = np.uint8 if item_size == 1 else np.dtype("<u2")
+
+        # bot is used only to generate layouts on its empty board
+        bot = BotPlayer(board_height, board_width, rng=random.Random(seed))
+        bot.check_if_fleet_fits(ship_lengths)
+
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix=".pool", dir=os.path.dirname(path) or None
+        )
+        try:
+            start = layouts_start(len(ship_lengths))
+            with os.fdopen(file_descriptor, "wb") as pool_file:
+                pool_file.write(
+                    LAYOUT_POOL_HEADER.pack(
+                        LAYOUT_POOL_MAGIC,
+                        LAYOUT_POOL_VERSION,
+                        board_height,
+                        board_width,
+                        len(ship_lengths),
+                        count,
+                        item_size,
+                    )
+                )
+                for length in ship_lengths:
+                    pool_file.write(LAYOUT_POOL_SHIP_LENGTH.pack(length))
+                pool_file.truncate(start + count * len(ship_lengths) * 4 * item_size)
+            if count * len(ship_lengths) > 0:
+                layouts = np.memmap(
+                    temporary_path,
+                    dtype=dtype,
+                    mode="r+",
+                    offset=start,
+                    shape=(count, len(ship_lengths), 4),
+                )
+                for batch_start in range(0, count, LAYOUT_POOL_BATCH_SIZE):
+                    batch_end = min(count, batch_start + LAYOUT_POOL_BATCH_SIZE)
+                    batch = []
+                    for _ in range(batch_start, batch_end):
+                        batch.append(bot.generate_valid_fleet_layout(ship_lengths))
+                    layouts[batch_start:batch_end] = batch
+                layouts.flush()
+                del layouts
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        return cls(path)
+
+    @classmethod
+    def load_or_create(
+        cls,
+        directory,
+        count,
+        board_height=constants.BOARD_CELL_SIZE,
+        board_width=constants.BOARD_CELL_SIZE,
+        ship_lengths=None,
+        seed=None,
+    ):
+        """returns pool cached in directory, generates it if there is no
+        such file or it has fewer than count layouts. Standard fleet is used
+        if ship_lengths is None"""
+        if ship_lengths is None:
+            ship_lengths = FleetSpec().ship_lengths
+        path = layout_pool_path(directory, board_height, board_width, ship_lengths)
+        if os.path.exists(path):
+            try:
+                pool = cls(path)
+                pool.check_fleet(board_height, board_width, ship_lengths)
+            except LayoutPoolError:
+                # file of older version or interrupted copy is generated again
+                pool = None
+            if pool is not None and len(pool) >= count:
+                return pool
+
+        os.makedirs(directory, exist_ok=True)
+        return cls.create(path, count, board_height, board_width, ship_lengths, seed)
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def board_height(self):
+        return self._board_height
+
+    @property
+    def board_width(self):
+        return self._board_width
+
+    @property
+    def ship_lengths(self):
+        return self._ship_lengths.copy()
+
+    def check_fleet(self, board_height, board_width, ship_lengths):
+        """raises LayoutPoolError if layouts were not generated for board of
+        given size and fleet of ships of ship_lengths, such layouts would
+        place ships outside the board or leave some of them unplaced"""
+        if (self._board_height, self._board_width) != (board_height, board_width):
+            raise LayoutPoolError(
+                self._path,
+                f"layouts are for board {self._board_height}x{self._board_width},"
+                + f" not {board_height}x{board_width}",
+            )
+        if self._ship_lengths != sorted(ship_lengths, reverse=True):
+            raise LayoutPoolError(
+                self._path,
+                f"layouts are for ships {self._ship_lengths},"
+                + f" not {sorted(ship_lengths, reverse=True)}",
+            )
+
+    def __len__(self):
+        return len(self._layouts)
+
+    def __getitem__(self, index):
+        """returns layout as list of (length, orientation, x, y)"""
+        return self._layouts[index].tolist()
+
+    def draw(self, rng):
+        """returns random layout"""
+        return self[rng.randrange(len(self._layouts))]
+
+    def __getstate__(self):
+        # memory map is not sent to other processes, only path
+        return {"_path": self._path}
+
+    def __setstate__(self, state):
+        self.__init__(state["_path"])
@@ -1,70 +1,260 @@
 """ memory access layer of programm"""
 import pygame
+from AssetBundle import AssetBundle, write_asset_bundle
+from GameErrors import AssetBundleError
 import constants
 
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+
+# assets are found relative to this file, not to working directory
+ASSETS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+ASSET_BUNDLE_PATH = os.path.join(ASSETS_DIRECTORY, "assets.bundle")
+
+# paths of assets relative to ASSETS_DIRECTORY, they are also keys in bundle
+SEE_IMAGE_PATHS = [f"see/background{i}.png" for i in range(1, 6)]
+CLOUD_IMAGE_PATHS = [f"clouds/Cloud{i}.png" for i in range(1, 6)]
+SHIP_IMAGE_PATHS = [f"ships/Ship{i}.png" for i in range(1, 6)]
+TABLE_IMAGE_PATH = "table/table.png"
+GAME_RESULT_BACKGROUND_PATH = "Game_result_backround.png"
+LOGO_BACKGROUND_PATH = "Logo.png"
+STATUS_BAR_BACKGROUND_PATH = "StatusBar.png"
+SMALL_SHIP_ICON_PATH = "ships/SmallShipIcon.png"
+BUTTON_IMAGE_PATH = "Button.png"
+FONT_PATH = "fonts/PixelifySans-Regular.ttf"
+
+# images needed by start screen, they are decoded first
+START_SCREEN_IMAGE_PATHS = [SEE_IMAGE_PATHS[0], LOGO_BACKGROUND_PATH, BUTTON_IMAGE_PATH]
+# images decoded in background while start screen is shown
+OTHER_IMAGE_PATHS = (
+    SEE_IMAGE_PATHS[1:]
+    + CLOUD_IMAGE_PATHS
+    + SHIP_IMAGE_PATHS
+    + [
+        TABLE_IMAGE_PATH,
+        GAME_RESULT_BACKGROUND_PATH,
+        STATUS_BAR_BACKGROUND_PATH,
+        SMALL_SHIP_ICON_PATH,
+    ]
+)
+
+
+def asset_path(path):
+    """returns absolute path of asset file"""
+    return os.path.join(ASSETS_DIRECTORY, path)
+
+
+def build_asset_bundle(bundle_path=ASSET_BUNDLE_PATH):
+    """packs all images and fonts into single bundle file"""
+    write_asset_bundle(
+        bundle_path,
+        ASSETS_DIRECTORY,
+        START_SCREEN_IMAGE_PATHS + OTHER_IMAGE_PATHS,
+        [FONT_PATH],
+    )
+
+
+def load_asset_bundle(bundle_path=ASSET_BUNDLE_PATH):
+    """returns AssetBundle if bundle_path has all assets and none of asset
+    files is newer than it, otherwise returns None"""
+    if not os.path.exists(bundle_path):
+        return None
+    bundle_time = os.path.getmtime(bundle_path)
+    for path in START_SCREEN_IMAGE_PATHS + OTHER_IMAGE_PATHS + [FONT_PATH]:
+        # bundle can be shipped without asset files
+        file_path = asset_path(path)
+        if os.path.exists(file_path) and os.path.getmtime(file_path) > bundle_time:
+            return None
+
+    try:
+        bundle = AssetBundle(bundle_path)
+    except AssetBundleError:
+        return None
+    if not all(
+        path in bundle
+        for path in START_SCREEN_IMAGE_PATHS + OTHER_IMAGE_PATHS + [FONT_PATH]
+    ):
+        return None
+    return bundle
+
+
+def prepare_image(image, size=None):
+    """scales image to size (width, height) and converts it to pixel format
+    of display, so blitting it does not need conversion. Images without
+    transparent pixels are converted without alpha, which blits faster"""
+    if size is not None and image.get_size() != size:
+        image = pygame.transform.scale(image, size)
+    if pygame.display.get_surface() is None:
+        # pixel format of display is not known before display mode is set
+        return image
+
+    # mask has pixels with alpha above threshold set
+    opaque_pixels = pygame.mask.from_surface(image, 254).count()
+    if opaque_pixels < image.get_width() * image.get_height():
+        return image.convert_alpha()
+    return image.convert()
+
 
 class AssetLoader:
-    """loads all assets"""
+    """loads assets lazily, if there is up to date asset bundle images are
+    created straight from its memory-mapped pixels, otherwise they are decoded
+    from files by pool of threads in the background (start screen images
+    first). Images are prepared on main thread when they are used for the
+    first time, using asset which is not decoded yet waits for it. Images are
+    converted to display format and cell images (clouds, ships) are scaled to
+    cell_size
+
+    :param cell_size: size of board cell in pixels
+    :type cell_size: int
+    :param _bundle: bundle with pre-decoded assets, None if it is not used
+    :type _bundle: AssetBundle.AssetBundle
+    :param _decoded_images: maps path to future of decoded image
+    :type _decoded_images: dict
+    :param _images: maps (path, size) to prepared image
+    :type _images: dict
+    :param _font_data: content of font file, it is read only once
+    :type _font_data: bytes
+    :param _fonts: maps font size to font
+    :type _fonts: dict
+    """
 
-    def __init__(self):
-        # loading see images
-        self.see_images = []
-        for i in range(1, 6):
-            temp = pygame.image.load(f"assets/see/background{i}.png")
-            self.see_images.append(temp)
+    def __init__(self, cell_size=constants.CELL_SIZE, bundle_path=ASSET_BUNDLE_PATH):
+        self.cell_size = cell_size
+        self._images = {}
+        self._fonts = {}
+        self._font_data = None
+        self._decoded_images = {}
 
-        # loading table image
-        self.table_image = pygame.image.load("assets/table/table.png")
+        self._bundle = load_asset_bundle(bundle_path)
+        if self._bundle is not None:
+            # nothing has to be decoded
+            return
 
-        # loading backround for game result
-        self.game_result_background = pygame.image.load(
-            "assets/Game_result_backround.png"
+        # decoding runs in background, pool closes itself when it is done
+        executor = ThreadPoolExecutor(max_workers=constants.ASSET_LOADING_WORKERS)
+        self._decoded_images = {
+            path: executor.submit(pygame.image.load, asset_path(path))
+            for path in START_SCREEN_IMAGE_PATHS + OTHER_IMAGE_PATHS
+        }
+        executor.shutdown(wait=False)
+
+    @property
+    def uses_bundle(self):
+        return self._bundle is not None
+
+    @property
+    def loading_progress(self):
+        """returns part of images which have been decoded (0.0 - 1.0)"""
+        if self._bundle is not None:
+            return 1.0
+        decoded = sum(future.done() for future in self._decoded_images.values())
+        return decoded / len(self._decoded_images)
+
+    @property
+    def start_screen_loaded(self):
+        """returns True if images needed by start screen are decoded"""
+        if self._bundle is not None:
+            return True
+        return all(
+            self._decoded_images[path].done() for path in START_SCREEN_IMAGE_PATHS
         )
 
-        # loading logo image
-        self.logo_background = pygame.image.load("assets/Logo.png")
+    @property
+    def is_loaded(self):
+        """returns True if all images are decoded"""
+        return all(future.done() for future in self._decoded_images.values())
 
-        # load status bar background
-        self.status_bar_background = pygame.image.load("assets/StatusBar.png")
+    def get_image(self, path, size=None):
+        """returns image prepared for fast blitting, waits for decoding
+        if it has not finished yet, image is prepared once for every size"""
+        if (path, size) not in self._images:
+            if self._bundle is not None:
+                decoded_image = self._bundle.get_image(path)
+            else:
+                decoded_image = self._decoded_images[path].result()
+            self._images[(path, size)] = prepare_image(decoded_image, size)
+        return self._images[(path, size)]
 
-        # load small ship icon
-        self.small_ship_icon = pygame.image.load("assets/ships/SmallShipIcon.png")
+    def get_font(self, font_size):
+        """returns pixel font of font_size, font file is read only once"""
+        if font_size not in self._fonts:
+            if self._font_data is None and self._bundle is not None:
+                self._font_data = self._bundle.get_bytes(FONT_PATH)
+            elif self._font_data is None:
+                with open(asset_path(FONT_PATH), "rb") as font_file:
+                    self._font_data = font_file.read()
+            self._fonts[font_size] = pygame.font.Font(
+                io.BytesIO(self._font_data), font_size
+            )
+        return self._fonts[font_size]
 
-        # loading cloud images
-        self.cloud_images = []
-        for i in range(1, 6):
-            temp = pygame.image.load(f"assets/clouds/Cloud{i}.png")
-            self.cloud_images.append(temp)
+    @property
+    def see_images(self):
+        return [self.get_image(path) for path in SEE_IMAGE_PATHS]
 
-        # loading ship images
-        self.ship_images = []
-        for i in range(1, 6):
-            temp = pygame.image.load(f"assets/ships/Ship{i}.png")
-            self.ship_images.append(temp)
+    def get_see_image(self, index):
+        """returns single see image, so others don't have to be loaded"""
+        return self.get_image(SEE_IMAGE_PATHS[index])
 
-        # loading button images
-        self.button_image = pygame.image.load("assets/Button.png")
+    @property
+    def table_image(self):
+        return self.get_image(TABLE_IMAGE_PATH)
 
-        # loading fonts
-        self.pixel_font_for_buttons = pygame.font.Font(
-            "assets/fonts/PixelifySans-Regular.ttf", constants.BUTTON_TEXT_SIZE
-        )
-        self.pixel_font_for_logo = pygame.font.Font(
-            "assets/fonts/PixelifySans-Regular.ttf", constants.LOGO_TEXT_SIZE
-        )
-        self.pixel_font_for_status_bar = pygame.font.Font(
-            "assets/fonts/PixelifySans-Regular.ttf", constants.STATUS_BAR_FONT_SIZE
-        )
-        self.pixel_font_for_message_to_switch = pygame.font.Font(
-            "assets/fonts/PixelifySans-Regular.ttf",
-            constants.MESSAGE_TO_SWITCH_FONT_SIZE,
-        )
-        self.pixel_font_for_prompt = pygame.font.Font(
-            "assets/fonts/PixelifySans-Regular.ttf", constants.PROMPT_TEXT_SIZE
-        )
-        self.pixel_font_for_statistics = pygame.font.Font(
-            "assets/fonts/PixelifySans-Regular.ttf", constants.STATISTICS_TEXT_SIZE
-        )
-        self.pixel_font_for_winner = pygame.font.Font(
-            "assets/fonts/PixelifySans-Regular.ttf", constants.WINNER_TEXT_SIZE
-        )
+    @property
+    def game_result_background(self):
+        return self.get_image(GAME_RESULT_BACKGROUND_PATH)
+
+    @property
+    def logo_background(self):
+        return self.get_image(LOGO_BACKGROUND_PATH)
+
+    @property
+    def status_bar_background(self):
+        return self.get_image(STATUS_BAR_BACKGROUND_PATH)
+
+    @property
+    def small_ship_icon(self):
+        return self.get_image(SMALL_SHIP_ICON_PATH)
+
+    @property
+    def cloud_images(self):
+        cell_image_size = (self.cell_size, self.cell_size)
+        return [self.get_image(path, cell_image_size) for path in CLOUD_IMAGE_PATHS]
+
+    @property
+    def ship_images(self):
+        cell_image_size = (self.cell_size, self.cell_size)
+        return [self.get_image(path, cell_image_size) for path in SHIP_IMAGE_PATHS]
+
+    @property
+    def button_image(self):
+        return self.get_image(BUTTON_IMAGE_PATH)
+
+    @property
+    def pixel_font_for_buttons(self):
+        return self.get_font(constants.BUTTON_TEXT_SIZE)
+
+    @property
+    def pixel_font_for_logo(self):
+        return self.get_font(constants.LOGO_TEXT_SIZE)
+
+    @property
+    def pixel_font_for_status_bar(self):
+        return self.get_font(constants.STATUS_BAR_FONT_SIZE)
+
+    @property
+    def pixel_font_for_message_to_switch(self):
+        return self.get_font(constants.MESSAGE_TO_SWITCH_FONT_SIZE)
+
+    @property
+    def pixel_font_for_prompt(self):
+        return self.get_font(constants.PROMPT_TEXT_SIZE)
+
+    @property
+    def pixel_font_for_statistics(self):
+        return self.get_font(constants.STATISTICS_TEXT_SIZE)
+
+    @property
+    def pixel_font_for_winner(self):
+        return self.get_font(constants.WINNER_TEXT_SIZE)
@@ -0,0 +1,241 @@
+"""vectorized calculations of ship placement probabilities, used by bots"""
+
+import constants
+
+from collections import Counter
+import numpy as np
+
+
+def axis_slice(axis, start, stop):
+    """returns index selecting start:stop along axis of 2d array"""
+    index = [slice(None), slice(None)]
+    index[axis] = slice(start, stop)
+    return tuple(index)
+
+
+def window_sums(array, length, axis):
+    """returns sums of all windows of length along axis, result is
+    shorter by length - 1 along that axis"""
+    cumulative_shape = list(array.shape)
+    cumulative_shape[axis] += 1
+    cumulative = np.zeros(cumulative_shape, dtype=np.int32)
+    np.cumsum(array, axis=axis, out=cumulative[axis_slice(axis, 1, None)])
+    return (
+        cumulative[axis_slice(axis, length, None)]
+        - cumulative[axis_slice(axis, 0, -length)]
+    )
+
+
+def spread_windows(window_weights, length, axis):
+    """adds weight of every window to all cells window covers, returns
+    array of board shape"""
+    windows_count = window_weights.shape[axis]
+    padded_shape = list(window_weights.shape)
+    padded_shape[axis] += 2 * (length - 1)
+    padded = np.zeros(padded_shape, dtype=np.int32)
+    padded[axis_slice(axis, length - 1, length - 1 + windows_count)] = window_weights
+    return window_sums(padded, length, axis)
+
+
+def placement_heatmap(blocked, hits, ship_lengths):
+    """returns array with weighted number of possible ship placements
+    covering every cell
+
+    :param blocked: 1 where no ship can be (missed shots and sunk ships)
+    :type blocked: numpy.ndarray
+    :param hits: 1 where ship was hit, but not sunk yet
+    :type hits: numpy.ndarray
+    :param ship_lengths: maps length of ship to how many such ships are left
+    :type ship_lengths: dict
+    """
+    height, width = blocked.shape
+    heatmap = np.zeros((height, width), dtype=np.int32)
+    for length, quantity in ship_lengths.items():
+        if quantity <= 0:
+            continue
+        for axis in (0, 1):
+            if length > blocked.shape[axis]:
+                continue
+            # window is possible if it does not cover any blocked cell
+            possible = window_sums(blocked, length, axis) == 0
+            # placements covering hits are much more probable
+            weights = possible * (
+                1 + constants.HEATMAP_HIT_WEIGHT * window_sums(hits, length, axis)
+            )
+            heatmap += quantity * spread_windows(weights, length, axis)
+    return heatmap
+
+
+def window_weights(blocked_counts, hit_counts):
+    """returns weight of windows, windows with blocked cell have weight 0"""
+    return (blocked_counts == 0) * (1 + constants.HEATMAP_HIT_WEIGHT * hit_counts)
+
+
+class PlacementIndex:
+    """heatmap of possible placements maintained incrementally, every shot
+    updates only windows crossing shot cell instead of whole board
+
+    :param _height: how many rows does the board have
+    :type _height: int
+    :param _width: how many columns does the board have
+    :type _width: int
+    :param _blocked: 1 where no ship can be (missed shots and sunk ships)
+    :type _blocked: numpy.ndarray(uint8)
+    :param _hits: 1 where ship was hit, but not sunk yet
+    :type _hits: numpy.ndarray(uint8)
+    :param _ship_lengths: maps length of ship to how many such ships are left
+    :type _ship_lengths: collections.Counter
+    :param _blocked_counts: maps (length, axis) to number of blocked cells
+        in every window
+    :type _blocked_counts: dict
+    :param _hit_counts: maps (length, axis) to number of hits in every window
+    :type _hit_counts: dict
+    :param _layers: maps length to heatmap of single ship of that length
+    :type _layers: dict
+    :param _heatmap: sum of layers multiplied by ship quantities
+    :type _heatmap: numpy.ndarray(int32)
+    :param _target_heatmap: _heatmap with 0 where ship was hit, so only
+        cells which have not been shot have non zero value
+    :type _target_heatmap: numpy.ndarray(int32)
+    """
+
+    def __init__(self, height, width, ship_lengths):
+        self._height = height
+        self._width = width
+        self._blocked = np.zeros((height, width), dtype=np.uint8)
+        self._hits = np.zeros((height, width), dtype=np.uint8)
+        self._ship_lengths = Counter(
+            {length: quantity for length, quantity in ship_lengths.items() if quantity}
+        )
+
+        self._blocked_counts = {}
+        self._hit_counts = {}
+        self._layers = {}
+        self._heatmap = np.zeros((height, width), dtype=np.int32)
+        for length, quantity in self._ship_lengths.items():
+            layer = np.zeros((height, width), dtype=np.int32)
+            for axis in (0, 1):
+                if length > self._blocked.shape[axis]:
+                    continue
+                blocked_counts = window_sums(self._blocked, length, axis)
+                hit_counts = window_sums(self._hits, length, axis)
+                self._blocked_counts[(length, axis)] = blocked_counts
+                self._hit_counts[(length, axis)] = hit_counts
+                weights = window_weights(blocked_counts, hit_counts)
+                layer += spread_windows(weights, length, axis)
+            self._layers[length] = layer
+            self._heatmap += quantity * layer
+        # there are no hits yet
+        self._target_heatmap = self._heatmap.copy()
+
+    def clone(self):
+        """returns independent copy of index"""
+        index = object.__new__(PlacementIndex)
+        index._height = self._height
+        index._width = self._width
+        index._blocked = self._blocked.copy()
+        index._hits = self._hits.copy()
+        index._ship_lengths = self._ship_lengths.copy()
+        index._blocked_counts = {
+            key: counts.copy() for key, counts in self._blocked_counts.items()
+        }
+        index._hit_counts = {
+            key: counts.copy() for key, counts in self._hit_counts.items()
+        }
+        index._layers = {length: layer.copy() for length, layer in self._layers.items()}
+        index._heatmap = self._heatmap.copy()
+        index._target_heatmap = self._target_heatmap.copy()
+        return index
+
+    @property
+    def heatmap(self):
+        return self._heatmap
+
+    @property
+    def target_heatmap(self):
+        """returns heatmap where cells which have been shot are 0, it is
+        updated in place, so it must not be changed"""
+        return self._target_heatmap
+
+    @property
+    def blocked(self):
+        return self._blocked
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def ship_lengths(self):
+        return self._ship_lengths
+
+    def update_cell(self, row, column, blocked_change, hit_change):
+        """changes state of single cell and updates all windows crossing it"""
+        self._blocked[row, column] = int(self._blocked[row, column]) + blocked_change
+        self._hits[row, column] = int(self._hits[row, column]) + hit_change
+
+        for (length, axis), blocked_counts in self._blocked_counts.items():
+            hit_counts = self._hit_counts[(length, axis)]
+            position = column if axis == 1 else row
+            # windows starting between first and last contain the cell
+            first = max(0, position - length + 1)
+            last = min(position, blocked_counts.shape[axis] - 1)
+            if axis == 1:
+                windows = (row, slice(first, last + 1))
+                cells = (row, slice(first, last + length))
+            else:
+                windows = (slice(first, last + 1), column)
+                cells = (slice(first, last + length), column)
+
+            old_weights = window_weights(blocked_counts[windows], hit_counts[windows])
+            blocked_counts[windows] += blocked_change
+            hit_counts[windows] += hit_change
+            new_weights = window_weights(blocked_counts[windows], hit_counts[windows])
+
+            change = np.convolve(new_weights - old_weights, np.ones(length, np.int32))
+            self._layers[length][cells] += change
+            self._heatmap[cells] += self._ship_lengths[length] * change
+
+        # only cells of row and column of the cell up to the longest ship
+        # away have changed
+        reach = max(self._layers, default=1)
+        for cells in (
+            (row, slice(max(0, column - reach + 1), column + reach)),
+            (slice(max(0, row - reach + 1), row + reach), column),
+        ):
+            self._target_heatmap[cells] = self._heatmap[cells] * (
+                self._hits[cells] == 0
+            )
+
+    def add_miss(self, row, column):
+        """handles missed shot"""
+        self.update_cell(row, column, blocked_change=1, hit_change=0)
+
+    def add_hit(self, row, column):
+        """handles shot which hit ship, but did not sink it"""
+        self.update_cell(row, column, blocked_change=0, hit_change=1)
+
+    def add_sunk_ship(self, ship_cells, length):
+        """handles sinking ship of length which occupied ship_cells
+        (list of (row, column)), its cells become blocked"""
+        for row, column in ship_cells:
+            hit_change = -1 if self._hits[row, column] else 0
+            self.update_cell(row, column, blocked_change=1, hit_change=hit_change)
+
+        if self._ship_lengths[length] <= 0:
+            return
+        self._ship_lengths[length] -= 1
+        # one ship less changes weight of every placement of this length,
+        # so it is the only update of whole board (once per sunk ship)
+        layer = self._layers[length]
+        self._heatmap -= layer
+        np.subtract(
+            self._target_heatmap, layer, out=self._target_heatmap, where=self._hits == 0
+        )
+        if self._ship_lengths[length] == 0:
+            # no more ships of this length, their windows don't matter
+            del self._ship_lengths[length]
+            del self._layers[length]
+            for axis in (0, 1):
+                self._blocked_counts.pop((length, axis), None)
+                self._hit_counts.pop((length, axis), None)
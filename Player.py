@@ -1,10 +1,20 @@
-from GameErrors import CellAlreadyShotError, ShipPlacingError, NotSuchShipToPlaceError
-from BoardCell import BoardCell
+from GameErrors import (
+    CellAlreadyShotError,
+    ShipPlacingError,
+    NotSuchShipToPlaceError,
+    FleetDoesNotFitError,
+    SnapshotError,
+    FleetStoreMismatchError,
+)
+from Board import Board
+from TargetPool import TargetPool
 import constants
-from Ships import Carrier, Battleship, Cruiser, PatrolShip
+from Ships import FleetSpec
+from PlacementHeatmap import PlacementIndex, window_sums
+from Snapshot import index_dtype
 
+from collections import Counter
 import numpy as np
-import copy
 import random
 
 
@@ -13,18 +23,34 @@ class Player:
     top left corner has coordinates equal to zero,
     they grow to the right and down
 
-    :param _board: stores array of BoardCell 's
-    :type _board: numpy array
+    :param _board: stores state of board cells in numpy arrays
+    :type _board: Board.Board
     :param _board_width: represents how many columns does the board have
     :type _board_width: int
     :param _board_height: represent how many rows does the board have
     :type _board_height: int
-    :param _potential_targets: list of (row, colum) where player didn't shoot
-    :type _potential_targets: list
-    :param _fleet: list of ships that player has currently on the board
-    :type _fleet: list
-    :param _ships_to_place: list of ships that user should place
-    :type _ships_to_place: list
+    :param _potential_targets: pool of (row, colum) where player didn't shoot
+    :type _potential_targets: TargetPool.TargetPool
+    :param _fleet: maps ship_id to ship that player has currently on the board
+    :type _fleet: dict
+    :param _fleet_spec: describes ships player has to place
+    :type _fleet_spec: Ships.FleetSpec
+    :param _ships_to_place: maps ship length to list of ships of that length
+        that user should place
+    :type _ships_to_place: dict
+    :param _alive_ships_by_length: maps ship length to number of ships of
+        that length which are on the board and not sunk
+    :type _alive_ships_by_length: collections.Counter
+    :param _alive_segments: how many segments of ships on the board are not hit
+    :type _alive_segments: int
+    :param _fleet_store: arrays with state of ships of many fleets or None
+        if player's ships are separate objects
+    :type _fleet_store: Ships.FleetStore
+    :param _fleet_index: index of player's fleet in _fleet_store
+    :type _fleet_index: int
+    :param _placements: (length, orientation, coordinate_x, coordinate_y) of
+        ships in order of placing
+    :type _placements: list
 
 
     """
@@ -33,40 +59,40 @@ class Player:
         self,
         board_height=constants.BOARD_CELL_SIZE,
         board_width=constants.BOARD_CELL_SIZE,
+        fleet_spec=None,
+        fleet_store=None,
+        fleet_index=0,
     ):
+        """if fleet_store is given state of player's ships is kept in its
+        fleet of fleet_index, store has to be created by the same fleet spec,
+        otherwise FleetStoreMismatchError is raised"""
         self._board_height = board_height
         self._board_width = board_width
-        self._potential_targets = []
-        self._fleet = []
-        self._ships_to_place = []
-
-        # initializing board array - can be done neeter???
-        boardcell = BoardCell()
-        self._board = np.full((board_height, board_width), boardcell)
-        for row in range(board_height):
-            for column in range(board_width):
-                self._board[row][column] = copy.deepcopy(boardcell)
-
-        # initializing potential targets
-        for y_it in range(board_height):
-            for x_it in range(board_width):
-                self._potential_targets.append((y_it, x_it))
-
-        # initializing ships to place
-        for ship_name in constants.STANDARD_SHIP_QUANTITIES:
-            quantity = constants.STANDARD_SHIP_QUANTITIES[ship_name]
-            if ship_name == "Carrier":
-                for _ in range(quantity):
-                    self._ships_to_place.append(Carrier())
-            elif ship_name == "Battleship":
-                for _ in range(quantity):
-                    self._ships_to_place.append(Battleship())
-            elif ship_name == "Cruiser":
-                for _ in range(quantity):
-                    self._ships_to_place.append(Cruiser())
-            elif ship_name == "PatrolShip":
-                for _ in range(quantity):
-                    self._ships_to_place.append(PatrolShip())
+        self._potential_targets = TargetPool(board_height, board_width)
+        self._fleet = {}
+        self._placements = []
+        self._fleet_spec = fleet_spec if fleet_spec is not None else FleetSpec()
+        # fleet status is updated on every change, so it is never counted
+        self._alive_ships_by_length = Counter()
+        self._alive_segments = 0
+
+        # initializing board arrays
+        self._board = Board(board_height, board_width)
+
+        # initializing ships to place, indexed by length
+        self._fleet_store = fleet_store
+        self._fleet_index = fleet_index
+        if fleet_store is not None:
+            if not 0 <= fleet_index < fleet_store.fleets_count or sorted(
+                fleet_store.lengths[fleet_index].tolist()
+            ) != sorted(self._fleet_spec.ship_lengths):
+                raise FleetStoreMismatchError(fleet_index)
+            ships = fleet_store.create_ships(fleet_index)
+        else:
+            ships = self._fleet_spec.create_ships()
+        self._ships_to_place = {}
+        for ship in ships:
+            self._ships_to_place.setdefault(ship.length, []).append(ship)
 
     @property
     def potential_targets(self):
@@ -87,16 +113,62 @@ class Player:
     @property
     def fleet(self):
         """returns list of player's ships"""
-        return self._fleet
+        return list(self._fleet.values())
+
+    def get_ship(self, ship_id):
+        """returns ship with ship_id, which is on the board and not sunk"""
+        return self._fleet[ship_id]
+
+    @property
+    def alive_ships_count(self):
+        """returns how many ships player has on the board"""
+        return len(self._fleet)
+
+    @property
+    def fleet_spec(self):
+        return self._fleet_spec
+
+    @property
+    def placements(self):
+        """returns list of (length, orientation, coordinate_x, coordinate_y)
+        of placed ships in order of placing"""
+        return self._placements
+
+    @property
+    def fleet_store(self):
+        return self._fleet_store
+
+    @property
+    def fleet_index(self):
+        return self._fleet_index
 
     @property
     def ships_to_place(self):
-        return self._ships_to_place
+        """returns list of ships that user should place"""
+        return [ship for ships in self._ships_to_place.values() for ship in ships]
+
+    @property
+    def alive_segments(self):
+        """returns how many segments of player's ships are not hit"""
+        return self._alive_segments
+
+    def count_alive_ships(self, length):
+        """returns how many ships of length player has on the board"""
+        return self._alive_ships_by_length[length]
+
+    @property
+    def fleet_summary(self):
+        """returns tuple of (length, alive ships, quantity) for every kind
+        of ship in fleet spec, it does not depend on size of fleet"""
+        return tuple(
+            (length, self._alive_ships_by_length[length], quantity)
+            for length, quantity in self._fleet_spec.quantities_by_length.items()
+        )
 
     @property
     def is_defeated(self):
         """returns True if player is defeated"""
-        return False if self._fleet else True
+        return self.alive_ships_count == 0
 
     def Check_if_ship_can_be_placed(
         self, new_ship_length, orientation, coordinate_x, coordinate_y
@@ -110,7 +182,7 @@ class Player:
         # check if ship fits on the board
         if orientation == constants.SHIP_VERTICAL and (
             coordinate_x < 0
-            or coordinate_x > self.board_width
+            or coordinate_x >= self.board_width
             or coordinate_y < 0
             or coordinate_y + new_ship_length > self.board_height
         ):
@@ -120,33 +192,23 @@ class Player:
             coordinate_x < 0
             or coordinate_x + new_ship_length > self.board_width
             or coordinate_y < 0
-            or coordinate_y > self.board_height
+            or coordinate_y >= self.board_height
         ):
             raise ShipPlacingError()
 
         # check if there aren't any colisions with other ships
-        if orientation == constants.SHIP_HORIZONTAL:
-            for cell in self.board[
-                coordinate_y, coordinate_x : coordinate_x + new_ship_length
-            ]:
-                if not cell.is_free:
-                    raise ShipPlacingError()
-        else:  # orientation vertical
-            for cell in self.board[
-                coordinate_y : coordinate_y + new_ship_length, coordinate_x
-            ]:
-                if not cell.is_free:
-                    raise ShipPlacingError()
+        if not self._board.is_area_free(
+            coordinate_y, coordinate_x, new_ship_length, orientation
+        ):
+            raise ShipPlacingError()
 
         # chcecks if player has such ship to place
-        new_ship = None
-        for ship in self._ships_to_place:
-            if ship.length == new_ship_length:
-                new_ship = ship
-                self._ships_to_place.remove(ship)
-                break
-        if new_ship is None:
+        ships_of_length = self._ships_to_place.get(new_ship_length)
+        if not ships_of_length:
             raise NotSuchShipToPlaceError(new_ship_length)
+        new_ship = ships_of_length.pop()
+        if not ships_of_length:
+            del self._ships_to_place[new_ship_length]
 
         return new_ship
 
@@ -162,21 +224,21 @@ class Player:
             length, orientation, coordinate_x, coordinate_y
         )
 
-        new_ship_length = new_ship.length
-        if orientation == constants.SHIP_HORIZONTAL:
-            for cell in self.board[
-                coordinate_y, coordinate_x : coordinate_x + new_ship_length
-            ]:
-                cell.position_ship(new_ship=new_ship)
-
-        else:  # orientation vertical
-            for cell in self.board[
-                coordinate_y : coordinate_y + new_ship_length, coordinate_x
-            ]:
-                cell.position_ship(new_ship=new_ship)
+        self._board.place_ship(new_ship, coordinate_y, coordinate_x, orientation)
 
         new_ship.position_ship()
-        self._fleet.append(new_ship)
+        if self._fleet_store is not None:
+            self._fleet_store.set_position(
+                self._fleet_index,
+                new_ship.ship_id,
+                coordinate_y,
+                coordinate_x,
+                orientation,
+            )
+        self._fleet[new_ship.ship_id] = new_ship
+        self._placements.append((length, orientation, coordinate_x, coordinate_y))
+        self._alive_ships_by_length[length] += 1
+        self._alive_segments += length
 
     def take_attack(self, coordinate_x, coordinate_y):
         """
@@ -185,10 +247,13 @@ class Player:
         constants.SHIP_HIT - when ship was hit, but not sunk
         constants.SHIP_SUNK - when ship was hit and sunk
         """
-        cell = self._board[coordinate_y, coordinate_x]
-        attack_status = cell.handle_attack()
+        attack_status = self._board.handle_attack(coordinate_y, coordinate_x)
+        if attack_status != constants.ATTACK_UNSUCCESSFUL:
+            self._alive_segments -= 1
         if attack_status == constants.SHIP_SUNK:
-            self._fleet.remove(cell.ship_handle)
+            sunk_ship = self._board.ship_handle(coordinate_y, coordinate_x)
+            del self._fleet[sunk_ship.ship_id]
+            self._alive_ships_by_length[sunk_ship.length] -= 1
         return attack_status
 
     def perform_attack(self, opponent, target_x, target_y):
@@ -199,51 +264,183 @@ class Player:
         attack_status = opponent.take_attack(target_x, target_y)
         return attack_status
 
+    def write_snapshot(self, writer):
+        """writes state of player to Snapshot.SnapshotWriter, ships are
+        stored as placements and board as shot cells"""
+        cells_count = self._board_height * self._board_width
+        writer.write_int(self._board_height)
+        writer.write_int(self._board_width)
+        self._fleet_spec.write_snapshot(writer)
+        writer.write_array(np.array(self._placements, dtype=np.int32).reshape(-1, 4))
+        writer.write_array(
+            np.flatnonzero(self._board.shots).astype(index_dtype(cells_count))
+        )
+        writer.write_array(
+            np.array(
+                self._potential_targets.flat_indices(), dtype=index_dtype(cells_count)
+            )
+        )
+
+    @classmethod
+    def read_snapshot(cls, reader):
+        """returns player restored from Snapshot.SnapshotReader"""
+        board_height, board_width = reader.read_board_size()
+        fleet_spec = FleetSpec.read_snapshot(reader, board_height * board_width)
+        player = cls(
+            board_height=board_height, board_width=board_width, fleet_spec=fleet_spec
+        )
+        player.read_snapshot_state(reader)
+        return player
+
+    def read_snapshot_state(self, reader):
+        """restores ships, shots and targets, placing ships and shots again
+        rebuilds board, fleet and its counters, raises SnapshotError
+        if ships cannot be placed"""
+        cells_count = self._board_height * self._board_width
+        placements = reader.read_array(ndim=2, columns=4).tolist()
+        for length, orientation, coordinate_x, coordinate_y in placements:
+            if orientation not in (constants.SHIP_HORIZONTAL, constants.SHIP_VERTICAL):
+                raise SnapshotError(f"invalid ship orientation {orientation}")
+            try:
+                self.add_ship(length, orientation, coordinate_x, coordinate_y)
+            except (ShipPlacingError, NotSuchShipToPlaceError) as error:
+                raise SnapshotError(f"ship cannot be placed ({error})")
+        for flat_index in reader.read_indices(cells_count):
+            coordinate_y, coordinate_x = divmod(flat_index, self._board_width)
+            self.take_attack(coordinate_x, coordinate_y)
+        self._potential_targets = TargetPool.from_flat_indices(
+            self._board_height, self._board_width, reader.read_indices(cells_count)
+        )
+
+    def finish_restore(self, opponent):
+        """called when opponent has been restored too"""
+        pass
+
+    def clone(self):
+        """returns independent copy of player, arrays and ships are copied,
+        fleet spec is shared. Ships kept in fleet store are copied as
+        separate Ship objects, so copy does not use the store"""
+        player = object.__new__(type(self))
+        self.clone_state(player)
+        return player
+
+    def clone_state(self, player):
+        """copies state of this player to new player object"""
+        ship_copies = {ship: ship.clone() for ship in self._board.ships}
+        for ships in self._ships_to_place.values():
+            for ship in ships:
+                ship_copies[ship] = ship.clone()
+
+        player._board_height = self._board_height
+        player._board_width = self._board_width
+        player._potential_targets = self._potential_targets.clone()
+        player._fleet = {
+            ship_id: ship_copies[ship] for ship_id, ship in self._fleet.items()
+        }
+        player._placements = self._placements.copy()
+        player._fleet_spec = self._fleet_spec
+        player._alive_ships_by_length = self._alive_ships_by_length.copy()
+        player._alive_segments = self._alive_segments
+        player._fleet_store = None
+        player._fleet_index = 0
+        player._board = self._board.clone(ship_copies)
+        player._ships_to_place = {
+            length: [ship_copies[ship] for ship in ships]
+            for length, ships in self._ships_to_place.items()
+        }
+
 
 class BotPlayer(Player):
     """automates some functionality of Player class, to create a game Bot
 
     Inherited from player class:
-    :param _board: stores array of BoardCell 's
-    :type _board: numpy array
+    :param _board: stores state of board cells in numpy arrays
+    :type _board: Board.Board
     :param _board_width: represents how many columns does the board have
     :type _board_width: int
     :param _board_height: represent how many rows does the board have
     :type _board_height: int
-    :param _potential_targets: list of (row, colum) where player didn't shoot
-    :type _potential_targets: list
-    :param _fleet: list of ships that player has currently on the board
-    :type _fleet: list
-    :param _ships_to_place: list of ships that user should place
-    :type _ships_to_place: list
+    :param _potential_targets: pool of (row, colum) where player didn't shoot
+    :type _potential_targets: TargetPool.TargetPool
+    :param _fleet: maps ship_id to ship that player has currently on the board
+    :type _fleet: dict
+    :param _fleet_spec: describes ships player has to place
+    :type _fleet_spec: Ships.FleetSpec
+    :param _ships_to_place: maps ship length to list of ships of that length
+        that user should place
+    :type _ships_to_place: dict
+    :param _alive_ships_by_length: maps ship length to number of ships of
+        that length which are on the board and not sunk
+    :type _alive_ships_by_length: collections.Counter
+    :param _alive_segments: how many segments of ships on the board are not hit
+    :type _alive_segments: int
+    :param _fleet_store: arrays with state of ships of many fleets or None
+        if player's ships are separate objects
+    :type _fleet_store: Ships.FleetStore
+    :param _fleet_index: index of player's fleet in _fleet_store
+    :type _fleet_index: int
+    :param _placements: (length, orientation, coordinate_x, coordinate_y) of
+        ships in order of placing
+    :type _placements: list
 
     Bot specyfic:
     :param _first_hit_of_ship_position: stores (row, column) of first ship hit
     :type _first_hit_of_ship_position: tuple
     :param _next_targets: list of next targets of bot - there will attack
     :type _next_targets: list
+    :param _rng: random number generator used by this bot only
+    :type _rng: random.Random
+    :param _layout_pool: pool of pre-generated fleet layouts or None, it
+        has to be generated for board and fleet of bot (LayoutPoolError
+        is raised otherwise)
+    :type _layout_pool: LayoutPool.LayoutPool
+    :param _last_target: (row, column) of the last attack or None
+    :type _last_target: tuple
     """
 
     def __init__(
         self,
         board_height=constants.BOARD_CELL_SIZE,
         board_width=constants.BOARD_CELL_SIZE,
+        rng=None,
+        layout_pool=None,
+        fleet_spec=None,
+        fleet_store=None,
+        fleet_index=0,
     ):
-        super().__init__(board_height=board_height, board_width=board_width)
+        super().__init__(
+            board_height=board_height,
+            board_width=board_width,
+            fleet_spec=fleet_spec,
+            fleet_store=fleet_store,
+            fleet_index=fleet_index,
+        )
         self._first_hit_of_ship_position = None
         self._next_targets = []
+        self._rng = rng if rng is not None else random.Random()
+        if layout_pool is not None:
+            # layouts for other board or fleet would fail in the middle of game
+            layout_pool.check_fleet(
+                board_height, board_width, self._fleet_spec.ship_lengths
+            )
+        self._layout_pool = layout_pool
+        self._last_target = None
 
     @property
     def next_targets(self):
         return self._next_targets
 
+    @property
+    def last_target(self):
+        return self._last_target
+
     def find_new_target(self):
         """returns (y,x) coordinates of next targeted BoardCell"""
 
         if self._next_targets:
-            return random.choice(self._next_targets)
+            return self._rng.choice(self._next_targets)
 
-        new_target_y, new_target_x = random.choice(self._potential_targets)
+        new_target_y, new_target_x = self._rng.choice(self._potential_targets)
         return (new_target_y, new_target_x)
 
     def add_next_target(self, next_target):
@@ -258,7 +455,7 @@ class BotPlayer(Player):
             if (new_target_y, target_x) in self._potential_targets:
                 self._next_targets.append((new_target_y, target_x))
                 return
-            elif opponents_board[new_target_y, target_x].is_free:
+            elif opponents_board.is_free(new_target_y, target_x):
                 # we shot here and it is see
                 return
 
@@ -269,7 +466,7 @@ class BotPlayer(Player):
             if (new_target_y, target_x) in self._potential_targets:
                 self._next_targets.append((new_target_y, target_x))
                 return
-            elif opponents_board[new_target_y, target_x].is_free:
+            elif opponents_board.is_free(new_target_y, target_x):
                 # we shot here and it is see
                 return
 
@@ -280,7 +477,7 @@ class BotPlayer(Player):
             if (target_y, new_target_x) in self._potential_targets:
                 self._next_targets.append((target_y, new_target_x))
                 return
-            elif opponents_board[target_y, new_target_x].is_free:
+            elif opponents_board.is_free(target_y, new_target_x):
                 # we shot here and it is see
                 return
 
@@ -291,7 +488,7 @@ class BotPlayer(Player):
             if (target_y, new_target_x) in self._potential_targets:
                 self._next_targets.append((target_y, new_target_x))
                 return
-            elif opponents_board[target_y, new_target_x].is_free:
+            elif opponents_board.is_free(target_y, new_target_x):
                 # we shot here and it is see
                 return
 
@@ -353,7 +550,7 @@ class BotPlayer(Player):
     def perform_attack(self, opponent):
         """
         if previous attack was success full, bot will shoot
-        at surrounding cells
+        at surrounding cells, returns attack status
         """
 
         # bot has no potential targes, so it cannot perform
@@ -361,6 +558,7 @@ class BotPlayer(Player):
             return
 
         new_target_y, new_target_x = self.find_new_target()
+        self._last_target = (new_target_y, new_target_x)
 
         # performing an attack
         attack_status = opponent.take_attack(
@@ -368,24 +566,306 @@ class BotPlayer(Player):
         )
 
         self.handle_next_targets(attack_status, new_target_y, new_target_x, opponent)
+        return attack_status
+
+    def write_snapshot(self, writer):
+        """writes state of bot to Snapshot.SnapshotWriter, layout pool
+        is not stored, because it is used only before the game"""
+        super().write_snapshot(writer)
+        writer.write_array(np.array(self._next_targets, dtype=np.int32).reshape(-1, 2))
+        writer.write_bool(self._first_hit_of_ship_position is not None)
+        if self._first_hit_of_ship_position is not None:
+            writer.write("2q", *self._first_hit_of_ship_position)
+
+        version, internal_state, gauss_next = self._rng.getstate()
+        writer.write_int(version)
+        writer.write_array(np.array(internal_state, dtype=np.uint32))
+        writer.write_bool(gauss_next is not None)
+        if gauss_next is not None:
+            writer.write("d", gauss_next)
+
+    def read_snapshot_state(self, reader):
+        """restores state of bot including state of its random generator"""
+        super().read_snapshot_state(reader)
+        self._next_targets = [
+            tuple(target) for target in reader.read_array(ndim=2, columns=2).tolist()
+        ]
+        self._first_hit_of_ship_position = None
+        self._last_target = None
+        if reader.read_bool():
+            self._first_hit_of_ship_position = reader.read("2q")
+        for target_y, target_x in self._next_targets + [
+            self._first_hit_of_ship_position or (0, 0)
+        ]:
+            if not (
+                0 <= target_y < self._board_height and 0 <= target_x < self._board_width
+            ):
+                raise SnapshotError("target of bot is outside the board")
+
+        version = reader.read_int()
+        internal_state = tuple(reader.read_array(ndim=1).tolist())
+        gauss_next = reader.read("d")[0] if reader.read_bool() else None
+        try:
+            self._rng.setstate((version, internal_state, gauss_next))
+        except (TypeError, ValueError, OverflowError):
+            raise SnapshotError("invalid state of random generator")
+
+    def clone_state(self, player):
+        """copies state of bot, copy gets random generator in the same state,
+        layout pool is shared"""
+        super().clone_state(player)
+        player._first_hit_of_ship_position = self._first_hit_of_ship_position
+        player._next_targets = self._next_targets.copy()
+        # new generator is not seeded, its whole state is set
+        player._rng = type(self._rng).__new__(type(self._rng))
+        player._rng.setstate(self._rng.getstate())
+        player._layout_pool = self._layout_pool
+        player._last_target = self._last_target
+
+    def check_if_fleet_fits(self, ship_lengths):
+        """raises FleetDoesNotFitError if ships of ship_lengths certainly
+        cannot be placed on the free cells of the board"""
+        if not ship_lengths:
+            return
+        free_cells = int(self._board_height * self._board_width)
+        free_cells -= int(self._board.occupancy.sum())
+        longest_line = max(self._board_height, self._board_width)
+        if max(ship_lengths) > longest_line or sum(ship_lengths) > free_cells:
+            raise FleetDoesNotFitError()
+
+    def draw_random_placement(self, occupancy, length):
+        """returns (row, column, orientation) of placement of ship of length
+        drawn uniformly from placements inside the board, which does not
+        cover occupied cells. Returns None if few draws were not enough"""
+        windows_in_row = self._board_width - length + 1
+        windows_in_column = self._board_height - length + 1
+        horizontal_count = self._board_height * max(0, windows_in_row)
+        vertical_count = max(0, windows_in_column) * self._board_width
+        if horizontal_count + vertical_count == 0:
+            return None
+
+        for _ in range(constants.FLEET_PLACEMENT_QUICK_DRAWS):
+            placement = self._rng.randrange(horizontal_count + vertical_count)
+            if placement < horizontal_count:
+                orientation = constants.SHIP_HORIZONTAL
+                row, column = divmod(placement, windows_in_row)
+            else:
+                orientation = constants.SHIP_VERTICAL
+                row, column = divmod(placement - horizontal_count, self._board_width)
+            if not occupancy[
+                self._board.ship_area(row, column, length, orientation)
+            ].any():
+                return (row, column, orientation)
+        return None
+
+    def find_possible_placements(self, occupancy, length):
+        """returns bool array of shape (2, board_height, board_width), where
+        [0, row, column] is True if vertical ship of length can have top left
+        corner at (row, column) and [1, row, column] the same for horizontal"""
+        possible = np.zeros((2, self._board_height, self._board_width), dtype=bool)
+        if length <= self._board_height:
+            windows = window_sums(occupancy, length, axis=0)
+            possible[0, : self._board_height - length + 1] = windows == 0
+        if length <= self._board_width:
+            windows = window_sums(occupancy, length, axis=1)
+            possible[1, :, : self._board_width - length + 1] = windows == 0
+        return possible
+
+    def draw_from_possible_placements(self, occupancy, ship_lengths):
+        """returns list of (length, orientation, coordinate_x, coordinate_y)
+        drawn uniformly from all possible placements on free cells of
+        occupancy, or None if there was no place left for some ship"""
+        remaining_ships = Counter(ship_lengths)
+        possible = {
+            length: self.find_possible_placements(occupancy, length)
+            for length in remaining_ships
+        }
+
+        layout = []
+        for length in ship_lengths:
+            placements = np.flatnonzero(possible[length])
+            if len(placements) == 0:
+                return None
+
+            placement = int(placements[self._rng.randrange(len(placements))])
+            axis, cell = divmod(placement, self._board_height * self._board_width)
+            row, column = divmod(cell, self._board_width)
+            if axis == 1:
+                orientation = constants.SHIP_HORIZONTAL
+                last_row, last_column = row, column + length - 1
+            else:
+                orientation = constants.SHIP_VERTICAL
+                last_row, last_column = row + length - 1, column
+            layout.append((length, orientation, column, row))
+
+            remaining_ships[length] -= 1
+            if remaining_ships[length] == 0:
+                del possible[length]
+
+            # placements overlapping new ship are not possible anymore
+            for other_length, other_possible in possible.items():
+                first_row = max(0, row - other_length + 1)
+                first_column = max(0, column - other_length + 1)
+                other_possible[
+                    0, first_row : last_row + 1, column : last_column + 1
+                ] = False
+                other_possible[
+                    1, row : last_row + 1, first_column : last_column + 1
+                ] = False
+        return layout
+
+    def generate_fleet_layout(self, ship_lengths):
+        """returns list of (length, orientation, coordinate_x, coordinate_y)
+        with random placements of ships that do not collide, or None if
+        there was no place left for some ship"""
+        occupancy = self._board.occupancy.copy()
+        layout = []
+        for ship_index, length in enumerate(ship_lengths):
+            # on free board a few random draws are the fastest
+            placement = self.draw_random_placement(occupancy, length)
+            if placement is None:
+                # board is crowded, rest of ships is drawn from all placements
+                rest_of_layout = self.draw_from_possible_placements(
+                    occupancy, ship_lengths[ship_index:]
+                )
+                if rest_of_layout is None:
+                    return None
+                return layout + rest_of_layout
+
+            row, column, orientation = placement
+            occupancy[self._board.ship_area(row, column, length, orientation)] = 1
+            layout.append((length, orientation, column, row))
+        return layout
+
+    def generate_valid_fleet_layout(self, ship_lengths):
+        """returns fleet layout (see generate_fleet_layout), raises
+        FleetDoesNotFitError if no layout was found"""
+        # random choices may leave no space for last ships, then we start over
+        for _ in range(constants.FLEET_PLACEMENT_ATTEMPTS):
+            layout = self.generate_fleet_layout(ship_lengths)
+            if layout is not None:
+                return layout
+        raise FleetDoesNotFitError()
 
     def position_ships(self):
-        """handles positioning ships on the board"""
-        while self._ships_to_place:
-            ship_to_position = self._ships_to_place[0]
-            is_positioned = False
-            while not is_positioned:
-                try:
-                    rand_x = random.randint(0, self.board_width - 1)
-                    rand_y = random.randint(0, self.board_height - 1)
-                    rand_orientation = random.choice(
-                        [constants.SHIP_VERTICAL, constants.SHIP_HORIZONTAL]
-                    )
-                    self.add_ship(
-                        ship_to_position.length, rand_orientation, rand_x, rand_y
-                    )
-                    is_positioned = True
-                except Exception:
-                    """we do not want to do anything, when bot cannot place ship
-                    where it can't"""
-                    pass
+        """handles positioning ships on the board, layout is drawn from
+        layout pool if bot has one, otherwise it is generated with longest
+        ships placed first, raises FleetDoesNotFitError if fleet cannot
+        be placed"""
+        if self._layout_pool is not None:
+            layout = self._layout_pool.draw(self._rng)
+        else:
+            ship_lengths = sorted(
+                (ship.length for ship in self.ships_to_place), reverse=True
+            )
+            self.check_if_fleet_fits(ship_lengths)
+            layout = self.generate_valid_fleet_layout(ship_lengths)
+
+        for length, orientation, coordinate_x, coordinate_y in layout:
+            self.add_ship(length, orientation, coordinate_x, coordinate_y)
+
+
+class ProbabilityBotPlayer(BotPlayer):
+    """bot which shoots at cell covered by the biggest number of possible
+    placements of opponent's remaining ships (probability density heatmap)
+
+    Inherited from BotPlayer class - see BotPlayer
+
+    ProbabilityBotPlayer specyfic:
+    :param _placement_index: heatmap of placements updated after every shot
+    :type _placement_index: PlacementHeatmap.PlacementIndex
+    """
+
+    def __init__(
+        self,
+        board_height=constants.BOARD_CELL_SIZE,
+        board_width=constants.BOARD_CELL_SIZE,
+        rng=None,
+        layout_pool=None,
+        fleet_spec=None,
+        fleet_store=None,
+        fleet_index=0,
+    ):
+        super().__init__(
+            board_height=board_height,
+            board_width=board_width,
+            rng=rng,
+            layout_pool=layout_pool,
+            fleet_spec=fleet_spec,
+            fleet_store=fleet_store,
+            fleet_index=fleet_index,
+        )
+
+        # opponent has the same fleet as bot
+        self._placement_index = PlacementIndex(
+            board_height, board_width, self._fleet_spec.quantities_by_length
+        )
+
+    @property
+    def remaining_ship_lengths(self):
+        return self._placement_index.ship_lengths
+
+    def calculate_heatmap(self):
+        """returns heatmap of possible placements, cells that have already
+        been shot have value 0, heatmap is kept up to date by placement
+        index (it is not copied), so it must not be changed"""
+        return self._placement_index.target_heatmap
+
+    def find_new_target(self):
+        """returns (y,x) coordinates of cell with the highest probability,
+        ties are broken randomly"""
+        heatmap = self.calculate_heatmap()
+        highest_probability = heatmap.max()
+        if highest_probability == 0:
+            # no placement is possible anymore, shooting anywhere
+            return super().find_new_target()
+
+        best_cells = np.flatnonzero(heatmap == highest_probability)
+        target = int(self._rng.choice(best_cells))
+        return divmod(target, self._board_width)
+
+    def clone_state(self, player):
+        """copies state of bot including its placement index"""
+        super().clone_state(player)
+        player._placement_index = self._placement_index.clone()
+
+    def finish_restore(self, opponent):
+        """placement index is rebuilt from shots on opponent's board"""
+        self._placement_index = PlacementIndex(
+            self._board_height,
+            self._board_width,
+            self._fleet_spec.quantities_by_length,
+        )
+        opponents_board = opponent.board
+        sunk_ship_ids = set()
+        for row, column in np.argwhere(opponents_board.shots).tolist():
+            ship = opponents_board.ship_handle(row, column)
+            if ship is None:
+                self._placement_index.add_miss(row, column)
+            elif not ship.is_down():
+                self._placement_index.add_hit(row, column)
+            elif opponents_board.ship_ids[row, column] not in sunk_ship_ids:
+                ship_id = opponents_board.ship_ids[row, column]
+                sunk_ship_ids.add(ship_id)
+                ship_cells = np.argwhere(opponents_board.ship_ids == ship_id).tolist()
+                self._placement_index.add_sunk_ship(ship_cells, ship.length)
+
+    def handle_next_targets(self, attack_status, target_y, target_x, opponent):
+        """updates bot's knowledge about opponent's board"""
+        if attack_status == constants.ATTACK_UNSUCCESSFUL:
+            self._placement_index.add_miss(target_y, target_x)
+        elif attack_status == constants.SHIP_HIT:
+            self._placement_index.add_hit(target_y, target_x)
+        elif attack_status == constants.SHIP_SUNK:
+            # opponent tells which ship was sunk, so its cells are known
+            opponents_board = opponent.board
+            ship_id = opponents_board.ship_ids[target_y, target_x]
+            ship_cells = np.argwhere(opponents_board.ship_ids == ship_id).tolist()
+            sunk_ship = opponents_board.ship_handle(target_y, target_x)
+            self._placement_index.add_sunk_ship(ship_cells, sunk_ship.length)
+
+        self._potential_targets.remove((target_y, target_x))
+
+
+# classes of players which can be restored from snapshot, index is stored
+SNAPSHOT_PLAYER_CLASSES = [Player, BotPlayer, ProbabilityBotPlayer]
@@ -1,19 +1,28 @@
+from GameErrors import SnapshotError
 import constants
 
+import numpy as np
+
 
 class Ship:
     """represents single ship on gameboard
 
     :param _length: represents how many board cells does this ship occupy
     :type _length: int
+    :param _ship_id: number of ship in its fleet, None if it is not in fleet
+    :type _ship_id: int
     :param _hit_counter: stores information how many times ship has been hit
     :type _hit_counter: int
     :param _is_positioned: is True if this ship has been placed on the board
     :type _is_positioned: bool
     """
 
-    def __init__(self, length):
+    # ships are created for every game, slots make them smaller
+    __slots__ = ("_length", "_ship_id", "_hit_counter", "_is_positioned")
+
+    def __init__(self, length, ship_id=None):
         self._length = length
+        self._ship_id = ship_id
         self._hit_counter = 0
         self._is_positioned = False
 
@@ -21,6 +30,10 @@ class Ship:
     def length(self):
         return self._length
 
+    @property
+    def ship_id(self):
+        return self._ship_id
+
     @property
     def hit_counter(self):
         return self._hit_counter
@@ -45,22 +58,321 @@ class Ship:
         """positions ship on game board"""
         self._is_positioned = True
 
+    def clone(self):
+        """returns independent copy of ship"""
+        ship = object.__new__(type(self))
+        ship._length = self._length
+        ship._ship_id = self._ship_id
+        ship._hit_counter = self._hit_counter
+        ship._is_positioned = self._is_positioned
+        return ship
+
 
 class Carrier(Ship):
-    def __init__(self):
-        super().__init__(length=constants.CARRIER_LENGTH)
+    __slots__ = ()
+
+    def __init__(self, ship_id=None):
+        super().__init__(length=constants.CARRIER_LENGTH, ship_id=ship_id)
 
 
 class Battleship(Ship):
-    def __init__(self):
-        super().__init__(length=constants.BATTLESHIP_LENGTH)
+    __slots__ = ()
+
+    def __init__(self, ship_id=None):
+        super().__init__(length=constants.BATTLESHIP_LENGTH, ship_id=ship_id)
 
 
 class Cruiser(Ship):
-    def __init__(self):
-        super().__init__(length=constants.CRUISER_LENGTH)
+    __slots__ = ()
+
+    def __init__(self, ship_id=None):
+        super().__init__(length=constants.CRUISER_LENGTH, ship_id=ship_id)
 
 
 class PatrolShip(Ship):
-    def __init__(self):
-        super().__init__(length=constants.PATROL_SHIP_LENGTH)
+    __slots__ = ()
+
+    def __init__(self, ship_id=None):
+        super().__init__(length=constants.PATROL_SHIP_LENGTH, ship_id=ship_id)
+
+
+# classes of standard ships, other ships are instances of Ship
+SHIP_CLASSES = {
+    "Carrier": Carrier,
+    "Battleship": Battleship,
+    "Cruiser": Cruiser,
+    "PatrolShip": PatrolShip,
+}
+
+
+class FleetSpec:
+    """describes fleet every player has to place - kinds of ships, their
+    lengths and quantities. It is not changed after creation, so it can be
+    shared by players and games
+
+    :param _ship_kinds: tuple of (ship name, length, quantity)
+    :type _ship_kinds: tuple
+    :param _quantities_by_length: maps ship length to how many such ships
+        are in the fleet
+    :type _quantities_by_length: dict
+    """
+
+    def __init__(self, ship_configuration=None, ship_lengths=None):
+        """ship_configuration maps ship name to quantity and ship_lengths
+        maps ship name to length, if they are None standard values
+        from constants are used"""
+        if ship_configuration is None:
+            ship_configuration = constants.STANDARD_SHIP_QUANTITIES
+        if ship_lengths is None:
+            ship_lengths = constants.SHIP_LENGTHS
+
+        self._ship_kinds = tuple(
+            (ship_name, ship_lengths[ship_name], quantity)
+            for ship_name, quantity in ship_configuration.items()
+        )
+        self._quantities_by_length = {}
+        for _, length, quantity in self._ship_kinds:
+            self._quantities_by_length[length] = (
+                self._quantities_by_length.get(length, 0) + quantity
+            )
+
+    @classmethod
+    def from_length_quantities(cls, length_quantities):
+        """returns fleet spec created from dict mapping ship length
+        to quantity, ships are named Ship<length>"""
+        ship_configuration = {}
+        ship_lengths = {}
+        for length, quantity in length_quantities.items():
+            ship_configuration[f"Ship{length}"] = quantity
+            ship_lengths[f"Ship{length}"] = length
+        return cls(ship_configuration, ship_lengths)
+
+    def write_snapshot(self, writer):
+        """writes fleet spec to Snapshot.SnapshotWriter"""
+        writer.write_int(len(self._ship_kinds))
+        for ship_name, length, quantity in self._ship_kinds:
+            writer.write_str(ship_name)
+            writer.write_int(length)
+            writer.write_int(quantity)
+
+    @classmethod
+    def read_snapshot(cls, reader, max_segments):
+        """returns fleet spec read from Snapshot.SnapshotReader, raises
+        GameErrors.SnapshotError if ships have more than max_segments
+        segments in total (they would not fit on the board)"""
+        ship_configuration = {}
+        ship_lengths = {}
+        total_segments = 0
+        for _ in range(reader.read_count(max_segments)):
+            ship_name = reader.read_str()
+            ship_lengths[ship_name] = reader.read_count(max_segments)
+            ship_configuration[ship_name] = reader.read_count(max_segments)
+            if ship_lengths[ship_name] == 0:
+                raise SnapshotError(f"ship {ship_name} has no segments")
+            total_segments += ship_lengths[ship_name] * ship_configuration[ship_name]
+            if total_segments > max_segments:
+                raise SnapshotError("fleet does not fit on the board")
+        return cls(ship_configuration, ship_lengths)
+
+    @property
+    def ship_kinds(self):
+        return self._ship_kinds
+
+    @property
+    def quantities_by_length(self):
+        return self._quantities_by_length
+
+    @property
+    def ship_lengths(self):
+        """returns list of lengths of all ships, the longest first"""
+        return sorted(
+            (
+                length
+                for length, quantity in self._quantities_by_length.items()
+                for _ in range(quantity)
+            ),
+            reverse=True,
+        )
+
+    @property
+    def ships_count(self):
+        return sum(self._quantities_by_length.values())
+
+    @property
+    def total_segments(self):
+        """returns how many segments all ships of the fleet have"""
+        return sum(
+            length * quantity for length, quantity in self._quantities_by_length.items()
+        )
+
+    def create_fleet_store(self, fleets_count=1):
+        """returns FleetStore for fleets_count fleets of this spec, ship_id-s
+        are the same as in create_ships"""
+        ship_lengths = [
+            length for _, length, quantity in self._ship_kinds for _ in range(quantity)
+        ]
+        return FleetStore(ship_lengths, fleets_count)
+
+    def create_ships(self):
+        """returns list of new ship instances of the whole fleet, ship_id
+        of every ship is its index in the list"""
+        ships = []
+        for ship_name, length, quantity in self._ship_kinds:
+            ship_class = SHIP_CLASSES.get(ship_name)
+            for _ in range(quantity):
+                if ship_class is not None and length == constants.SHIP_LENGTHS.get(
+                    ship_name
+                ):
+                    ships.append(ship_class(ship_id=len(ships)))
+                else:
+                    ships.append(Ship(length, ship_id=len(ships)))
+        return ships
+
+
+class FleetStore:
+    """state of ships of many fleets with the same ship lengths kept in numpy
+    arrays of shape (fleets, ships) indexed by (fleet_index, ship_id) (struct
+    of arrays), ships are StoredShip views of it. Games kept in memory at once
+    can share one store, so state of all their fleets is in a few arrays
+    and can be read without looping over ships
+
+    :param _lengths: length of every ship
+    :type _lengths: numpy.ndarray(uint8 or uint16)
+    :param _hit_counters: how many times every ship has been hit
+    :type _hit_counters: numpy.ndarray(uint8 or uint16)
+    :param _positioned: True for ships placed on the board
+    :type _positioned: numpy.ndarray(bool)
+    :param _rows: row of top left segment of ship, -1 if it is not placed
+    :type _rows: numpy.ndarray(int16)
+    :param _columns: column of top left segment of ship, -1 if it is not placed
+    :type _columns: numpy.ndarray(int16)
+    :param _orientations: orientation of placed ship
+    :type _orientations: numpy.ndarray(uint8)
+    """
+
+    def __init__(self, ship_lengths, fleets_count=1):
+        shape = (fleets_count, len(ship_lengths))
+        dtype = np.uint8 if max(ship_lengths, default=0) <= 255 else np.uint16
+        self._lengths = np.tile(np.array(ship_lengths, dtype=dtype), (fleets_count, 1))
+        self._hit_counters = np.zeros(shape, dtype=dtype)
+        self._positioned = np.zeros(shape, dtype=bool)
+        self._rows = np.full(shape, -1, dtype=np.int16)
+        self._columns = np.full(shape, -1, dtype=np.int16)
+        self._orientations = np.zeros(shape, dtype=np.uint8)
+
+    @property
+    def fleets_count(self):
+        return self._lengths.shape[0]
+
+    @property
+    def ships_count(self):
+        """returns how many ships every fleet has"""
+        return self._lengths.shape[1]
+
+    @property
+    def lengths(self):
+        return self._lengths
+
+    @property
+    def hit_counters(self):
+        return self._hit_counters
+
+    @property
+    def positioned(self):
+        return self._positioned
+
+    @property
+    def rows(self):
+        return self._rows
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def orientations(self):
+        return self._orientations
+
+    @property
+    def alive(self):
+        """returns mask of ships which are placed and not sunk"""
+        return self._positioned & (self._hit_counters < self._lengths)
+
+    def count_alive_ships(self):
+        """returns array with number of alive ships of every fleet"""
+        return self.alive.sum(axis=1)
+
+    def create_ships(self, fleet_index=0):
+        """returns list of StoredShip views of ships of one fleet,
+        indexed by ship_id"""
+        return [
+            StoredShip(self, fleet_index, ship_id)
+            for ship_id in range(self.ships_count)
+        ]
+
+    def set_position(self, fleet_index, ship_id, row, column, orientation):
+        """stores position of ship placed on the board"""
+        self._rows[fleet_index, ship_id] = row
+        self._columns[fleet_index, ship_id] = column
+        self._orientations[fleet_index, ship_id] = orientation
+
+
+class StoredShip:
+    """ship which keeps its state in FleetStore, it has the same interface
+    as Ship
+
+    :param _store: fleet store with state of ship
+    :type _store: FleetStore
+    :param _fleet_index: index of ship's fleet in store
+    :type _fleet_index: int
+    :param _ship_id: index of ship in its fleet
+    :type _ship_id: int
+    """
+
+    __slots__ = ("_store", "_fleet_index", "_ship_id")
+
+    def __init__(self, store, fleet_index, ship_id):
+        self._store = store
+        self._fleet_index = fleet_index
+        self._ship_id = ship_id
+
+    @property
+    def length(self):
+        return int(self._store.lengths[self._fleet_index, self._ship_id])
+
+    @property
+    def ship_id(self):
+        return self._ship_id
+
+    @property
+    def fleet_index(self):
+        return self._fleet_index
+
+    @property
+    def hit_counter(self):
+        return int(self._store.hit_counters[self._fleet_index, self._ship_id])
+
+    @property
+    def is_positioned(self):
+        return bool(self._store.positioned[self._fleet_index, self._ship_id])
+
+    def is_down(self):
+        """return True if all parts of ship have been hit"""
+        return self.hit_counter == self.length
+
+    def take_damage(self):
+        """handles attack of ship, returns True if whole ship is down"""
+        if not self.is_down():
+            self._store.hit_counters[self._fleet_index, self._ship_id] += 1
+        return self.is_down()
+
+    def position_ship(self):
+        """positions ship on game board"""
+        self._store.positioned[self._fleet_index, self._ship_id] = True
+
+    def clone(self):
+        """returns Ship with the same state, copy is not kept in store"""
+        ship = Ship(self.length, self._ship_id)
+        ship._hit_counter = self.hit_counter
+        ship._is_positioned = self.is_positioned
+        return ship
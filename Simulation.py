@@ -0,0 +1,192 @@
+""" headless simulation of bot vs bot games (does not need pygame)"""
+from GameLogicController import GameLogicController
+from Player import BotPlayer
+from Ships import FleetSpec
+import constants
+
+from collections import Counter
+import random
+
+
+class SimulationClock:
+    """clock used instead of pygame clock in headless games,
+    time moves only when advance() is called
+
+    :param _ticks: current time in milliseconds
+    :type _ticks: int
+    """
+
+    def __init__(self):
+        self._ticks = 0
+
+    def __call__(self):
+        return self._ticks
+
+    def advance(self, milliseconds):
+        """moves time forward"""
+        self._ticks += milliseconds
+
+
+class SimulationResults:
+    """aggregated results of simulated games, index 0 is bot_a and 1 is bot_b
+
+    :param _games_played: how many games have been simulated
+    :type _games_played: int
+    :param _wins: how many games each bot has won
+    :type _wins: list
+    :param _shots_to_win: sum of shots each bot needed in games it has won
+    :type _shots_to_win: list
+    :param _rounds_distribution: maps rounds played to number of such games
+    :type _rounds_distribution: collections.Counter
+    """
+
+    def __init__(self):
+        self._games_played = 0
+        self._wins = [0, 0]
+        self._shots_to_win = [0, 0]
+        self._rounds_distribution = Counter()
+
+    @property
+    def games_played(self):
+        return self._games_played
+
+    @property
+    def wins(self):
+        return tuple(self._wins)
+
+    @property
+    def rounds_distribution(self):
+        return self._rounds_distribution
+
+    @property
+    def win_rates(self):
+        """returns tuple of (bot_a win rate, bot_b win rate)"""
+        if self._games_played == 0:
+            return (0.0, 0.0)
+        return tuple(wins / self._games_played for wins in self._wins)
+
+    @property
+    def mean_shots_to_win(self):
+        """returns tuple of mean shots each bot needed to win a game"""
+        return tuple(
+            shots / wins if wins else 0.0
+            for shots, wins in zip(self._shots_to_win, self._wins)
+        )
+
+    @property
+    def mean_rounds(self):
+        """returns mean number of rounds played in a game"""
+        if self._games_played == 0:
+            return 0.0
+        total_rounds = sum(
+            rounds * games for rounds, games in self._rounds_distribution.items()
+        )
+        return total_rounds / self._games_played
+
+    def add_game(self, winner_index, rounds_played, winner_shots):
+        """adds result of single game"""
+        self._games_played += 1
+        self._wins[winner_index] += 1
+        self._shots_to_win[winner_index] += winner_shots
+        self._rounds_distribution[rounds_played] += 1
+
+    def merge(self, other):
+        """adds results of other SimulationResults to this one"""
+        self._games_played += other._games_played
+        for index in range(2):
+            self._wins[index] += other._wins[index]
+            self._shots_to_win[index] += other._shots_to_win[index]
+        self._rounds_distribution.update(other._rounds_distribution)
+
+    def as_dict(self):
+        """returns results as a dictionary"""
+        return {
+            "games_played": self.games_played,
+            "wins": self.wins,
+            "win_rates": self.win_rates,
+            "mean_shots_to_win": self.mean_shots_to_win,
+            "mean_rounds": self.mean_rounds,
+            "rounds_distribution": dict(self._rounds_distribution),
+        }
+
+
+def play_bot_game(
+    bot1,
+    bot2,
+    board_height=constants.BOARD_CELL_SIZE,
+    board_width=constants.BOARD_CELL_SIZE,
+    clock=None,
+    event_log=None,
+):
+    """plays single game of two bot instances through GameLogicController,
+    returns finished controller, game is recorded if event_log is given"""
+    game_controller = GameLogicController(
+        board_height=board_height,
+        board_width=board_width,
+        ship_configuration=bot1.fleet_spec,
+        clock=clock if clock is not None else SimulationClock(),
+        event_log=event_log,
+    )
+    game_controller.bots_selected(bot1, bot2)
+    while game_controller.phase == constants.GAME_PHASE:
+        game_controller.play_bot_round()
+    return game_controller
+
+
+def simulate_games(
+    n,
+    bot_a=BotPlayer,
+    bot_b=BotPlayer,
+    seed=None,
+    board_height=constants.BOARD_CELL_SIZE,
+    board_width=constants.BOARD_CELL_SIZE,
+    layout_pool=None,
+    fleet_spec=None,
+    event_log=None,
+):
+    """simulates n games of bot_a against bot_b (bot classes), bots take
+    turns in starting the game, returns SimulationResults
+
+    each bot gets its own random.Random seeded from seed, so results
+    are reproducible and do not depend on global random state,
+    if layout_pool is given bots draw their fleets from it, fleet_spec
+    is standard fleet if None, all games are recorded in event_log
+    if it is given"""
+    rng = random.Random(seed)
+    if fleet_spec is None:
+        fleet_spec = FleetSpec()
+
+    results = SimulationResults()
+    for game_index in range(n):
+        bots = [
+            bot_a(
+                board_height=board_height,
+                board_width=board_width,
+                rng=random.Random(rng.getrandbits(64)),
+                layout_pool=layout_pool,
+                fleet_spec=fleet_spec,
+            ),
+            bot_b(
+                board_height=board_height,
+                board_width=board_width,
+                rng=random.Random(rng.getrandbits(64)),
+                layout_pool=layout_pool,
+                fleet_spec=fleet_spec,
+            ),
+        ]
+        # bot_a starts even games, bot_b odd ones
+        first_index = game_index % 2
+        game_controller = play_bot_game(
+            bots[first_index],
+            bots[1 - first_index],
+            board_height=board_height,
+            board_width=board_width,
+            event_log=event_log,
+        )
+
+        winner = game_controller.winner
+        winner_index = bots.index(winner)
+        winner_shots = board_height * board_width - len(winner.potential_targets)
+        results.add_game(winner_index, game_controller.rounds_played, winner_shots)
+
+    return results
@@ -0,0 +1,172 @@
+""" compact versioned binary format of game snapshots"""
+from GameErrors import SnapshotError
+
+import math
+import struct
+import numpy as np
+
+# snapshot starts with (magic, version)
+SNAPSHOT_MAGIC = b"BSGS"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sH")
+# restored boards can have at most this many cells, so corrupted size
+# cannot make restoring allocate huge boards
+SNAPSHOT_MAX_BOARD_CELLS = 2**20
+# kinds of numpy arrays which can be stored (bool, integers, floats)
+SNAPSHOT_ARRAY_KINDS = "biuf"
+
+
+def index_dtype(values_count):
+    """returns the smallest unsigned dtype which can store indices
+    of values_count values"""
+    return np.uint16 if values_count <= 2**16 else np.uint32
+
+
+class SnapshotWriter:
+    """writes values of snapshot one after another, little endian
+
+    :param _chunks: encoded values
+    :type _chunks: list
+    """
+
+    def __init__(self):
+        self._chunks = [SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION)]
+
+    def getvalue(self):
+        """returns whole snapshot as bytes"""
+        return b"".join(self._chunks)
+
+    def write(self, value_format, *values):
+        """writes values packed with struct format (without byte order)"""
+        self._chunks.append(struct.pack("<" + value_format, *values))
+
+    def write_int(self, value):
+        self.write("q", value)
+
+    def write_bool(self, value):
+        self.write("?", value)
+
+    def write_str(self, text):
+        data = text.encode()
+        self.write("I", len(data))
+        self._chunks.append(data)
+
+    def write_array(self, array):
+        """writes numpy array with its dtype and shape"""
+        array = np.ascontiguousarray(array)
+        self.write_str(array.dtype.str)
+        self.write("B", array.ndim)
+        self.write(f"{array.ndim}I", *array.shape)
+        self._chunks.append(array.tobytes())
+
+
+class SnapshotReader:
+    """reads values written by SnapshotWriter in the same order,
+    raises SnapshotError if data is not valid snapshot
+
+    :param _data: whole snapshot
+    :type _data: bytes
+    :param _offset: position of next value in _data
+    :type _offset: int
+    """
+
+    def __init__(self, data):
+        self._data = data
+        self._offset = 0
+        magic, version = self.read(SNAPSHOT_HEADER.format.lstrip("<"))
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError("data is not a game snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"unsupported snapshot version {version}")
+
+    def _take(self, size):
+        """returns next size bytes"""
+        if self._offset + size > len(self._data):
+            raise SnapshotError("snapshot is truncated")
+        chunk = self._data[self._offset : self._offset + size]
+        self._offset += size
+        return chunk
+
+    def read(self, value_format):
+        """returns tuple of values packed with struct format"""
+        value_format = "<" + value_format
+        return struct.unpack(value_format, self._take(struct.calcsize(value_format)))
+
+    def read_int(self):
+        return self.read("q")[0]
+
+    def read_bool(self):
+        return self.read("?")[0]
+
+    def read_str(self):
+        (size,) = self.read("I")
+        try:
+            return self._take(size).decode()
+        except UnicodeDecodeError:
+            raise SnapshotError("text is not valid UTF-8")
+
+    def read_count(self, maximum):
+        """returns int which is number of items, raises SnapshotError if it
+        is negative or bigger than maximum"""
+        count = self.read_int()
+        if not 0 <= count <= maximum:
+            raise SnapshotError(f"count {count} is out of range 0-{maximum}")
+        return count
+
+    def read_index(self, values_count):
+        """returns int which is index of one of values_count values"""
+        index = self.read_int()
+        if not 0 <= index < values_count:
+            raise SnapshotError(f"index {index} is out of range")
+        return index
+
+    def read_board_size(self):
+        """returns (board height, board width)"""
+        board_height = self.read_int()
+        board_width = self.read_int()
+        if (
+            board_height < 1
+            or board_width < 1
+            or board_height * board_width > SNAPSHOT_MAX_BOARD_CELLS
+        ):
+            raise SnapshotError(f"invalid board size {board_height}x{board_width}")
+        return board_height, board_width
+
+    def read_array(self, ndim=None, columns=None):
+        """returns numpy array written by write_array, raises SnapshotError
+        if it has not ndim dimensions or its rows have not columns values
+        (when they are given)"""
+        try:
+            dtype = np.dtype(self.read_str())
+        except (TypeError, ValueError):
+            raise SnapshotError("invalid array type")
+        if dtype.kind not in SNAPSHOT_ARRAY_KINDS or dtype.itemsize == 0:
+            raise SnapshotError(f"unsupported array type {dtype}")
+        (array_ndim,) = self.read("B")
+        shape = self.read(f"{array_ndim}I")
+        if ndim is not None and array_ndim != ndim:
+            raise SnapshotError(f"array has {array_ndim} dimensions, not {ndim}")
+        if columns is not None and shape[-1] != columns:
+            raise SnapshotError(f"array rows have {shape[-1]} values, not {columns}")
+        data = self._take(math.prod(shape) * dtype.itemsize)
+        return np.frombuffer(data, dtype=dtype).reshape(shape).copy()
+
+    def read_indices(self, values_count):
+        """returns list of distinct indices of values_count values,
+        stored as 1d array"""
+        indices = self.read_array(ndim=1)
+        if indices.size and (
+            indices.dtype.kind not in "iu"
+            or indices.min() < 0
+            or indices.max() >= values_count
+        ):
+            raise SnapshotError("index in array is out of range")
+        indices = indices.tolist()
+        if len(set(indices)) != len(indices):
+            raise SnapshotError("array has repeated indices")
+        return indices
+
+    def check_end(self):
+        """raises SnapshotError if there is unread data"""
+        if self._offset != len(self._data):
+            raise SnapshotError("snapshot has unexpected data at the end")
@@ -0,0 +1,98 @@
+""" pool of cells that have not been shot yet"""
+# value stored in _positions for cells which are not in the pool
+NOT_IN_POOL = -1
+
+
+class TargetPool:
+    """set of (row, column) targets with O(1) membership test, removal
+    and random choice. Behaves like a list of targets (len, in, iteration,
+    indexing), so random.choice() can be used on it directly
+
+    :param _board_height: how many rows does the board have
+    :type _board_height: int
+    :param _board_width: how many columns does the board have
+    :type _board_width: int
+    :param _targets: targets in the pool, order changes on removal
+    :type _targets: list
+    :param _positions: index of each cell (row * width + column) in _targets
+        or NOT_IN_POOL, works as membership bitmap
+    :type _positions: list
+    """
+
+    def __init__(self, board_height, board_width):
+        self._board_height = board_height
+        self._board_width = board_width
+        self._targets = [
+            (row, column)
+            for row in range(board_height)
+            for column in range(board_width)
+        ]
+        self._positions = list(range(board_height * board_width))
+
+    def _flat_index(self, target):
+        """returns index of target in _positions or None if target
+        is outside the board"""
+        row, column = target
+        if 0 <= row < self._board_height and 0 <= column < self._board_width:
+            return row * self._board_width + column
+        return None
+
+    def __len__(self):
+        return len(self._targets)
+
+    def __iter__(self):
+        return iter(self._targets)
+
+    def __getitem__(self, index):
+        return self._targets[index]
+
+    def __contains__(self, target):
+        flat_index = self._flat_index(target)
+        if flat_index is None:
+            return False
+        return self._positions[flat_index] != NOT_IN_POOL
+
+    def remove(self, target):
+        """removes target from pool by swapping it with the last one,
+        raises ValueError if target is not in the pool"""
+        flat_index = self._flat_index(target)
+        if flat_index is None or self._positions[flat_index] == NOT_IN_POOL:
+            raise ValueError(f"{target} is not in target pool")
+
+        position = self._positions[flat_index]
+        last_target = self._targets.pop()
+        if position < len(self._targets):
+            # moving last target into the gap
+            self._targets[position] = last_target
+            self._positions[self._flat_index(last_target)] = position
+        self._positions[flat_index] = NOT_IN_POOL
+
+    def discard(self, target):
+        """removes target from pool if it is there"""
+        if target in self:
+            self.remove(target)
+
+    def clone(self):
+        """returns independent copy of pool"""
+        pool = object.__new__(TargetPool)
+        pool._board_height = self._board_height
+        pool._board_width = self._board_width
+        pool._targets = self._targets.copy()
+        pool._positions = self._positions.copy()
+        return pool
+
+    def flat_indices(self):
+        """returns list of targets as row * board_width + column,
+        in order of the pool"""
+        return [row * self._board_width + column for row, column in self._targets]
+
+    @classmethod
+    def from_flat_indices(cls, board_height, board_width, flat_indices):
+        """returns pool of targets given as row * board_width + column,
+        order of targets is kept"""
+        pool = cls(board_height, board_width)
+        pool._targets = [divmod(int(index), board_width) for index in flat_indices]
+        pool._positions = [NOT_IN_POOL] * (board_height * board_width)
+        for position, flat_index in enumerate(flat_indices):
+            pool._positions[int(flat_index)] = position
+        return pool
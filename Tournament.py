@@ -0,0 +1,92 @@
+""" runs large numbers of simulated bot games on all processor cores"""
+from Simulation import SimulationResults, simulate_games
+from Player import BotPlayer
+import constants
+
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# number of games played by worker in one task, even so that bots start
+# the same number of games in each shard
+TOURNAMENT_SHARD_SIZE = 1000
+
+
+def generate_shard_seeds(seed, shards_count):
+    """returns list of independent seeds derived from seed, one per shard"""
+    seed_sequences = np.random.SeedSequence(seed).spawn(shards_count)
+    return [int(sequence.generate_state(1)[0]) for sequence in seed_sequences]
+
+
+def play_shard(shard):
+    """plays single shard of tournament, runs in worker process"""
+    (
+        games_count,
+        bot_a,
+        bot_b,
+        seed,
+        board_height,
+        board_width,
+        layout_pool,
+        fleet_spec,
+    ) = shard
+    return simulate_games(
+        games_count,
+        bot_a=bot_a,
+        bot_b=bot_b,
+        seed=seed,
+        board_height=board_height,
+        board_width=board_width,
+        layout_pool=layout_pool,
+        fleet_spec=fleet_spec,
+    )
+
+
+def run_tournament(
+    n,
+    bot_a=BotPlayer,
+    bot_b=BotPlayer,
+    seed=0,
+    workers=None,
+    shard_size=TOURNAMENT_SHARD_SIZE,
+    board_height=constants.BOARD_CELL_SIZE,
+    board_width=constants.BOARD_CELL_SIZE,
+    layout_pool=None,
+    fleet_spec=None,
+):
+    """plays n games of bot_a against bot_b split into shards of shard_size
+    games, shards are played by a pool of worker processes (workers=None
+    uses all cores, workers=1 plays in current process)
+
+    every shard has its own seed derived from seed, so results depend only
+    on seed and shard_size, not on number of workers or order of finishing,
+    layout_pool is passed to workers as path of its file, fleet_spec
+    is standard fleet if None,
+    returns merged SimulationResults"""
+    shards_count = -(-n // shard_size)
+    shard_seeds = generate_shard_seeds(seed, shards_count)
+    shards = []
+    for shard_index, shard_seed in enumerate(shard_seeds):
+        games_count = min(shard_size, n - shard_index * shard_size)
+        shards.append(
+            (
+                games_count,
+                bot_a,
+                bot_b,
+                shard_seed,
+                board_height,
+                board_width,
+                layout_pool,
+                fleet_spec,
+            )
+        )
+
+    results = SimulationResults()
+    if workers == 1:
+        for shard in shards:
+            results.merge(play_shard(shard))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard_results in executor.map(play_shard, shards):
+            results.merge(shard_results)
+    return results
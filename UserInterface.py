@@ -1,13 +1,12 @@
 """ this file handles interaction with user"""
 import pygame
+import numpy as np
 
 # modules created for this game
 from GameErrors import OutOfTableError
+from GameStatistics import format_statistics
 import constants
-from BoardPositionCalculations import (
-    calculate_row_and_column,
-    calculate_x_y_cooridantes,
-)
+from BoardPositionCalculations import BoardLayout
 from Buttons import (
     PlayPVPButton,
     PlayPVCButton,
@@ -23,11 +22,51 @@ class UIObject:
         self._screen = screen
         self._game_controller = game_controller
         self._image_handler = image_handler
+        self._dirty_rects = []
 
     @property
     def phase(self):
         return self._game_controller.phase
 
+    def dirty_rects(self):
+        """returns list of areas of screen changed since last call,
+        only these areas have to be drawn again"""
+        dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        return dirty_rects
+
+    def next_update_time(self):
+        """returns time (ms) when animation will change without any input,
+        None if nothing changes by itself"""
+        return None
+
+
+class LoadingScreenVisualizer:
+    """minimal screen shown until images needed by start screen are decoded,
+    it draws only progress bar, so it does not need any assets
+
+    :param _screen: screen where elements will be displayed
+    :type _screen: pygame.Surface
+    :param _asset_loader: loader which is decoding images
+    :type _asset_loader: MemoryAccess.AssetLoader
+    """
+
+    def __init__(self, screen, asset_loader):
+        self._screen = screen
+        self._asset_loader = asset_loader
+
+    def draw(self):
+        """draws progress bar in the middle of screen"""
+        self._screen.fill(constants.LOADING_SCREEN_COLOR)
+
+        bar_rect = pygame.Rect((0, 0), constants.LOADING_BAR_SIZE)
+        bar_rect.center = self._screen.get_rect().center
+        pygame.draw.rect(self._screen, constants.LOADING_BAR_COLOR, bar_rect, width=2)
+
+        progress_rect = bar_rect.copy()
+        progress_rect.width = int(bar_rect.width * self._asset_loader.loading_progress)
+        pygame.draw.rect(self._screen, constants.LOADING_BAR_COLOR, progress_rect)
+
 
 class ScreenVisualizer(UIObject):
     """handles static elements - background, logo, prompt in blackscreen phase
@@ -39,15 +78,15 @@ class ScreenVisualizer(UIObject):
     :type _screen: pygame.Surface
     :param _game_controller: controlls game - used for getting phases
     :type _game_controller: GameLogicController.GameLogicController
-    :param _see_images: list of see images
-    :type _see_images: list
+    :param _see_images_count: how many see images are there
+    :type _see_images_count: int
     :param _logo: image of logo displayed on start screen
     :type _logo: pygame.Surface
     :param _blackscreen_prompt: image of prompt to switch users
     :type _blackscreen_prompt: pygame.Surface
     :param _blackscreen_prompt_position: stores position of this prompt
     :type _blackscreen_prompt_position: tuple
-    :param _background_idx: index of image in self._see_images for animations
+    :param _background_idx: index of current see image for animations
     :type _background_idx: int
     :param _current_background: this background will be displed when draw() is called
     :type _current_background: pygame.Surface
@@ -55,13 +94,15 @@ class ScreenVisualizer(UIObject):
     :type _game_result_image: pygame.Surface
     :param _last_background_change: moment when background has changed
     :type _last_background_change: int
+    :param _drawn_phase: phase for which screen was drawn last time
+    :type _drawn_phase: int
     """
 
     def __init__(self, screen, game_controller, image_handler):
         super().__init__(screen, game_controller, image_handler)
 
-        # loading right images
-        self._see_images = image_handler.see_images
+        # loading right images, see images are loaded when they are shown
+        self._see_images_count = image_handler.see_images_count
         self._logo = image_handler.logo_image
         self._blackscreen_prompt = image_handler.blackscreen_prompt
 
@@ -74,9 +115,10 @@ class ScreenVisualizer(UIObject):
         self._game_result_image = None
 
         self._background_idx = 0
-        self._current_background = self._image_handler.see_images[0]
+        self._current_background = self._image_handler.get_see_image(0)
         self._game_result_image = None
         self._last_background_change = pygame.time.get_ticks()
+        self._drawn_phase = None
 
     def update(self):
         """updates animations"""
@@ -87,9 +129,12 @@ class ScreenVisualizer(UIObject):
             >= constants.BACKGROUND_COOLDOWN
         ):
             # incrementing idx, after exceeding array's length, going back to 0
-            self._background_idx = (self._background_idx + 1) % len(self._see_images)
-            self._current_background = self._see_images[self._background_idx]
+            self._background_idx = (self._background_idx + 1) % self._see_images_count
+            self._current_background = self._image_handler.get_see_image(
+                self._background_idx
+            )
             self._last_background_change = pygame.time.get_ticks()
+            self._dirty_rects.append(self._screen.get_rect())
 
         # resets game result image if neccessary
         if (
@@ -98,6 +143,15 @@ class ScreenVisualizer(UIObject):
         ):
             self._game_result_image = None
 
+        # background is under everything, new phase changes whole screen
+        if self.phase != self._drawn_phase:
+            self._drawn_phase = self.phase
+            self._dirty_rects.append(self._screen.get_rect())
+
+    def next_update_time(self):
+        """returns time of next background change"""
+        return self._last_background_change + constants.BACKGROUND_COOLDOWN
+
     def draw_backroung(self):
         """draws background on screen"""
         self._screen.blit(self._current_background, (0, 0))
@@ -126,7 +180,7 @@ class ScreenVisualizer(UIObject):
         y = winner_image.get_height() + constants.STATISTICS_VERTICAL_OFFSET
         x = constants.STATISTICS_HORIZONTAL_OFFSET
 
-        statistics = self._game_controller.generate_statistics()
+        statistics = format_statistics(self._game_controller.statistics)
         for statistic_key in statistics:
             statistic_value = statistics[statistic_key]
             statistic_text = statistic_key + ": " + statistic_value
@@ -175,61 +229,90 @@ class StatusBarVisualizer(UIObject):
     :param _game_controller: controlls game - used for getting phases
     :type _game_controller: GameLogicController.GameLogicController
     :param _background: image used as background for status bar
+        (None until it is needed)
     :type _background: pygame.Surface
     :param _small_ship_icon: image representing on segment of ship
+        (None until it is needed)
     :type _small_ship_icon: pygame.Surface
+    :param _board_layout: positions of tables on screen
+    :type _board_layout: BoardPositionCalculations.BoardLayout
+    :param _drawn_status: information shown on status bar when it was drawn
+    :type _drawn_status: tuple
 
     """
 
-    def __init__(self, screen, game_controller, image_handler):
+    def __init__(self, screen, game_controller, image_handler, board_layout=None):
         super().__init__(screen, game_controller, image_handler)
+        if board_layout is None:
+            board_layout = BoardLayout(
+                game_controller.board_height, game_controller.board_width
+            )
+        self._board_layout = board_layout
 
-        # load background
-        self._background = image_handler.status_bar_background
+        # images are loaded when status bar is shown for the first time
+        self._background = None
+        self._small_ship_icon = None
 
-        # load small ship icon
-        self._small_ship_icon = image_handler.small_ship_icon
+        self._drawn_status = None
+
+    @property
+    def background(self):
+        if self._background is None:
+            self._background = self._image_handler.status_bar_background
+        return self._background
+
+    @property
+    def small_ship_icon(self):
+        if self._small_ship_icon is None:
+            self._small_ship_icon = self._image_handler.small_ship_icon
+        return self._small_ship_icon
+
+    def get_status(self):
+        """returns tuple of information shown on status bar
+        or None if it is not visible"""
+        if self.phase not in [
+            constants.GAME_PHASE,
+            constants.POSITIONING_PHASE,
+            constants.READY_TO_SWITCH_PHASE,
+        ]:
+            return None
+        current_player = self._game_controller.current_player
+        player_attacked = self._game_controller.player_attacked
+        return (
+            self._game_controller.get_player_names(),
+            current_player.fleet_summary,
+            player_attacked.fleet_summary,
+        )
 
     def update(self):
-        pass
+        """checks if information on status bar has changed"""
+        status = self.get_status()
+        if status != self._drawn_status:
+            self._drawn_status = status
+            self._dirty_rects.append(self.background.get_rect())
 
     def draw_background(self):
         """draws backround of status bar"""
-        self._screen.blit(self._background, (0, 0))
+        self._screen.blit(self.background, (0, 0))
 
     def draw_fleet_of_player(self, player, on_the_left):
         """draws fleet of one player above corresponding
         table"""
 
-        # start drawing over corresponding table and end 600 px
-        x = constants.TABLE_HORIZONTAL_OFFSET
+        # start drawing over corresponding table
+        x = self._board_layout.table_x(from_left_table=on_the_left)
         y = constants.FLEET_STATUS_VERTICAL_OFFSET
-        if not on_the_left:
-            x = (
-                constants.SCREEN_WIDTH
-                - constants.TABLE_SIZE
-                - constants.TABLE_HORIZONTAL_OFFSET
-            )
-
-        for ship_name in constants.STANDARD_SHIP_QUANTITIES:
-            quantity = constants.STANDARD_SHIP_QUANTITIES[ship_name]
-            length = constants.SHIP_LENGTHS[ship_name]
 
+        for length, ship_counter, quantity in player.fleet_summary:
             # drawing ship icon
             for i in range(length):
-                self._screen.blit(self._small_ship_icon, (x, y))
+                self._screen.blit(self.small_ship_icon, (x, y))
                 x += (
                     constants.SMALL_SHIP_ICON_SIZE
                     - constants.SMALL_SHIP_ICON_OFFSET_TO_OVERLAP
                 )
                 # subtracting to make icons overlap = looks better
 
-            # calculate player's amount of this kind of ship
-            ship_counter = 0
-            for ship in player.fleet:
-                if ship.length == length:
-                    ship_counter += 1
-
             # generate image of text representing how many ships of kind are on board
             text = f"{ship_counter}/{quantity}"
             text_image = self._image_handler.get_status_bar_image_from_text(text)
@@ -256,16 +339,9 @@ class StatusBarVisualizer(UIObject):
         if for_left_table is True is's above left table
         """
         image_width = image.get_width()
-        board_width = constants.TABLE_SIZE
+        board_width = self._board_layout.table_width
         x = (board_width - image_width) // 2
-        if for_left_table:
-            x += constants.TABLE_HORIZONTAL_OFFSET
-        else:
-            x += (
-                constants.SCREEN_WIDTH
-                - constants.TABLE_HORIZONTAL_OFFSET
-                - constants.TABLE_SIZE
-            )
+        x += self._board_layout.table_x(from_left_table=for_left_table)
 
         return x
 
@@ -336,9 +412,19 @@ class Prompt(pygame.sprite.Sprite):
             self._image
         )
 
+    @property
+    def rect(self):
+        """returns area of screen covered by prompt"""
+        return pygame.Rect(self._position, self._image.get_size())
+
+    @property
+    def next_update_time(self):
+        """returns time of next fade step"""
+        return self._last_update_time + self._cooldown
+
     def update(self):
         """if enough time has passed updates fade of image or removes itself
-        from list if it's gone"""
+        from list if it's gone, returns True if image has changed"""
         current_time = pygame.time.get_ticks()
         if current_time - self._last_update_time >= self._cooldown:
             self._alpha -= 10
@@ -347,6 +433,8 @@ class Prompt(pygame.sprite.Sprite):
                 # remove prompt from sprite list
                 self.kill()
             self._image.set_alpha(self._alpha)
+            return True
+        return False
 
     def draw(self):
         """draw prompt on screen"""
@@ -382,9 +470,18 @@ class PromptVisualizer(UIObject):
                 image_handler=self._image_handler,
             )
             self._active_prompts.add([prompt])
+            self._dirty_rects.append(prompt.rect)
         # udpate existing prompts
         for prompt in self._active_prompts:
-            prompt.update()
+            if prompt.update():
+                self._dirty_rects.append(prompt.rect)
+
+    def next_update_time(self):
+        """returns time of the nearest fade step of visible prompts"""
+        return min(
+            (prompt.next_update_time for prompt in self._active_prompts),
+            default=None,
+        )
 
     def draw(self):
         """draws prommpts on screen"""
@@ -392,6 +489,125 @@ class PromptVisualizer(UIObject):
             prompt.draw()
 
 
+class BoardLayer:
+    """pre-rendered surface of one table showing one view of player's board,
+    after it is drawn only cells changed on the board are redrawn
+
+    :param _board: board which is shown
+    :type _board: Board.Board
+    :param _for_left_table: True for player's fleet (ships), False for what
+        player's opponent sees (clouds and shot ships)
+    :type _for_left_table: bool
+    :param _board_layout: positions of tables and cells on screen
+    :type _board_layout: BoardPositionCalculations.BoardLayout
+    :param _table_image: image of table grid drawn over cells
+    :type _table_image: pygame.Surface
+    :param _ship_images: list of ship images of cell size
+    :type _ship_images: list
+    :param _cloud_images: list of cloud images of cell size
+    :type _cloud_images: list
+    :param _surface: rendered table, transparent where sea is visible
+    :type _surface: pygame.Surface
+    :param _drawn_changes: how many changes of board are already drawn
+    :type _drawn_changes: int
+    """
+
+    def __init__(
+        self,
+        board,
+        for_left_table,
+        board_layout,
+        table_image,
+        ship_images,
+        cloud_images,
+    ):
+        self._board = board
+        self._for_left_table = for_left_table
+        self._board_layout = board_layout
+        self._table_image = table_image
+        self._ship_images = ship_images
+        self._cloud_images = cloud_images
+        self._surface = pygame.Surface(
+            (board_layout.table_width, board_layout.table_height), pygame.SRCALPHA
+        )
+        self._drawn_changes = 0
+        self.redraw()
+
+    @property
+    def board(self):
+        return self._board
+
+    @property
+    def surface(self):
+        return self._surface
+
+    def cells_to_draw(self):
+        """returns list of (cells, image) where cells is array
+        of (row, column) of all cells with this image"""
+        occupancy = self._board.occupancy
+        shots = self._board.shots
+        if self._for_left_table:
+            # left table (normal ship or hit ship)
+            return [
+                (np.argwhere(occupancy & (shots ^ 1)), self._ship_images[0]),
+                (np.argwhere(occupancy & shots), self._ship_images[3]),
+            ]
+        # right table (cloud or shot ship)
+        return [
+            (np.argwhere(shots == 0), self._cloud_images[0]),
+            (np.argwhere(occupancy & shots), self._ship_images[3]),
+        ]
+
+    def cell_image(self, row, column):
+        """returns image of single cell or None if sea is visible"""
+        is_occupied = self._board.occupancy[row, column]
+        was_shot = self._board.shots[row, column]
+        if self._for_left_table:
+            if is_occupied:
+                return self._ship_images[3] if was_shot else self._ship_images[0]
+            return None
+        if not was_shot:
+            return self._cloud_images[0]
+        return self._ship_images[3] if is_occupied else None
+
+    def redraw(self):
+        """draws whole table"""
+        self._surface.fill((0, 0, 0, 0))
+        table_x, table_y = self._board_layout.table_position(self._for_left_table)
+        for cells, image in self.cells_to_draw():
+            positions = self._board_layout.cell_positions(
+                cells[:, 0], cells[:, 1], from_left_table=self._for_left_table
+            )
+            positions -= (table_x, table_y)
+            self._surface.blits(
+                [(image, position) for position in positions.tolist()],
+                doreturn=False,
+            )
+        self._surface.blit(self._table_image, (0, 0))
+        self._drawn_changes = self._board.changes_count
+
+    def redraw_cell(self, row, column):
+        """draws single cell and grid over it"""
+        cell_size = self._board_layout.cell_size
+        cell_rect = pygame.Rect(
+            column * cell_size, row * cell_size, cell_size, cell_size
+        )
+        self._surface.fill((0, 0, 0, 0), cell_rect)
+        image = self.cell_image(row, column)
+        if image is not None:
+            self._surface.blit(image, cell_rect)
+        self._surface.blit(self._table_image, cell_rect, area=cell_rect)
+
+    def update(self):
+        """redraws cells changed since last update, returns set of their
+        (row, column)"""
+        changed_cells = set(self._board.changed_cells(since=self._drawn_changes))
+        for row, column in changed_cells:
+            self.redraw_cell(row, column)
+        self._drawn_changes = self._board.changes_count
+        return changed_cells
+
+
 class GameBoardVisualizer(UIObject):
     """handles visualising game situation on boards/tables
 
@@ -401,20 +617,34 @@ class GameBoardVisualizer(UIObject):
     :type _screen: pygame.Surface
     :param _game_controller: controlls game - used for getting phases
     :type _game_controller: GameLogicController.GameLogicController
-    :param _cloud_images: list of cloud images
+    :param _cloud_images: list of cloud images (None until they are needed)
     :type _cloud_images: list
-    :param _ship_images: list of ship images
+    :param _ship_images: list of ship images (None until they are needed)
     :type _ship_images: list
-    :param _table_image: stores image of table
+    :param _table_image: stores image of table (None until it is needed)
     :type _table_image: pygame.Surface
+    :param _board_layout: positions of tables and cells on screen
+    :type _board_layout: BoardPositionCalculations.BoardLayout
+    :param _board_layers: maps (board, for_left_table) to its BoardLayer
+    :type _board_layers: dict
+    :param _shown_layers: maps for_left_table to BoardLayer shown there
+    :type _shown_layers: dict
     """
 
-    def __init__(self, screen, game_controller, image_handler):
+    def __init__(self, screen, game_controller, image_handler, board_layout=None):
         super().__init__(screen, game_controller, image_handler)
+        if board_layout is None:
+            board_layout = BoardLayout(
+                game_controller.board_height, game_controller.board_width
+            )
+        self._board_layout = board_layout
 
-        self._cloud_images = image_handler.cloud_images
-        self._ship_images = image_handler.ship_images
-        self._table_image = image_handler.table_image
+        # images are loaded when board is shown for the first time
+        self._cloud_images = None
+        self._ship_images = None
+        self._table_image = None
+        self._board_layers = {}
+        self._shown_layers = {}
 
     @property
     def player1(self):
@@ -425,23 +655,71 @@ class GameBoardVisualizer(UIObject):
         return self._game_controller.player2
 
     def update(self):
-        """updates animations of ships and clouds"""
-        # @TODO
-        pass
-
-    def draw_table(self, is_left):
-        """draws single table either on the left or right"""
-        y = constants.TABLE_VERTICAL_OFFSET
-        x = 0
-        if is_left:
-            x = constants.TABLE_HORIZONTAL_OFFSET
-        else:
-            x = (
-                constants.SCREEN_WIDTH
-                - constants.TABLE_HORIZONTAL_OFFSET
-                - constants.TABLE_SIZE
+        """redraws changed cells of shown boards and marks their areas
+        of screen as changed"""
+        # @TODO animations of ships and clouds
+        if self.phase not in [
+            constants.GAME_PHASE,
+            constants.POSITIONING_PHASE,
+            constants.READY_TO_SWITCH_PHASE,
+        ]:
+            self._shown_layers = {}
+            return
+
+        shown_players = [
+            (self._game_controller.current_player, True),
+            (self._game_controller.player_attacked, False),
+        ]
+        for player, for_left_table in shown_players:
+            board_layer = self.get_board_layer(player, for_left_table)
+            changed_cells = board_layer.update()
+            if self._shown_layers.get(for_left_table) is not board_layer:
+                # other board is shown on this table now
+                self._shown_layers[for_left_table] = board_layer
+                self._dirty_rects.append(self._board_layout.table_rect(for_left_table))
+                continue
+            for row, column in changed_cells:
+                self._dirty_rects.append(
+                    self._board_layout.cell_rect(row, column, for_left_table)
+                )
+
+    def load_images(self):
+        """loads images of cells and table, cell images are scaled
+        to size of cells of this board"""
+        cell_size = self._board_layout.cell_size
+        self._cloud_images = self._image_handler.get_cell_images(
+            self._image_handler.cloud_images, cell_size
+        )
+        self._ship_images = self._image_handler.get_cell_images(
+            self._image_handler.ship_images, cell_size
+        )
+        self._table_image = self._image_handler.get_table_image(self._board_layout)
+
+    def get_board_layer(self, player, for_left_table):
+        """returns BoardLayer of player's view,
+        creates one if it does not exist yet"""
+        key = (player.board, for_left_table)
+        board_layer = self._board_layers.get(key)
+        if board_layer is None:
+            if self._table_image is None:
+                self.load_images()
+            # layers of boards from previous games are not needed anymore
+            current_boards = {self.player1.board, self.player2.board}
+            self._board_layers = {
+                key: board_layer
+                for key, board_layer in self._board_layers.items()
+                if key[0] in current_boards
+            }
+            board_layer = BoardLayer(
+                board=player.board,
+                for_left_table=for_left_table,
+                board_layout=self._board_layout,
+                table_image=self._table_image,
+                ship_images=self._ship_images,
+                cloud_images=self._cloud_images,
             )
-        self._screen.blit(self._table_image, (x, y))
+            self._board_layers[key] = board_layer
+        return board_layer
 
     def draw_one_player(self, player, for_left_table):
         """draws view of player on the board
@@ -450,40 +728,10 @@ class GameBoardVisualizer(UIObject):
         """
         # @TODO add animation support for this methods
 
-        # draw game situation
-        board_height = player.board_height
-        board_width = player.board_width
-
-        for row_index in range(board_height):
-            for column_index in range(board_width):
-                # calculate ship image position
-                position = calculate_x_y_cooridantes(
-                    row=row_index,
-                    column=column_index,
-                    from_left_table=for_left_table,
-                )
-                board_cell = player.board[row_index, column_index]
-
-                # left table (normal ship or hit ship)
-                if for_left_table:
-                    if not board_cell.is_free:
-                        if board_cell.was_shot:
-                            # drawing shot ship
-                            self._screen.blit(self._ship_images[3], position)
-                        else:
-                            # drawing normal ship
-                            self._screen.blit(self._ship_images[0], position)
-
-                # right (cloud or shot ship)
-                else:
-                    if not board_cell.was_shot:
-                        # drawing cloud
-                        self._screen.blit(self._cloud_images[0], position)
-                    elif not board_cell.is_free:
-                        # drawing hit ship
-                        self._screen.blit(self._ship_images[3], position)
-        # draw table image
-        self.draw_table(for_left_table)
+        # table is drawn from cached layer, changed cells are redrawn in update
+        board_layer = self.get_board_layer(player, for_left_table)
+        position = self._board_layout.table_position(from_left_table=for_left_table)
+        self._screen.blit(board_layer.surface, position)
 
     def draw(self):
         """draws current player's view on the board"""
@@ -519,11 +767,18 @@ class InputHandler:
     :type _mouse_press_phase: int
     :param _mouse_press_position: position of mouse press
     :type _mouse_press_position: tuple
+    :param _board_layout: positions of tables and cells on screen
+    :type _board_layout: BoardPositionCalculations.BoardLayout
     """
 
-    def __init__(self, game_controller, button_handler):
+    def __init__(self, game_controller, button_handler, board_layout=None):
         self._game_controller = game_controller
         self._button_handler = button_handler
+        if board_layout is None:
+            board_layout = BoardLayout(
+                game_controller.board_height, game_controller.board_width
+            )
+        self._board_layout = board_layout
         self._mouse_press_start_column = None
         self._mouse_press_start_row = None
         self._mouse_press_phase = None
@@ -545,7 +800,7 @@ class InputHandler:
             return False
 
         try:
-            row_and_column = calculate_row_and_column(
+            row_and_column = self._board_layout.cell_at(
                 coordinates=mouse_position, from_left_table=True
             )
 
@@ -568,7 +823,7 @@ class InputHandler:
             return False
 
         try:
-            row_and_column = calculate_row_and_column(
+            row_and_column = self._board_layout.cell_at(
                 coordinates=mouse_position, from_left_table=True
             )
             # mouse on player's board has been released and press
@@ -602,7 +857,7 @@ class InputHandler:
             return False
 
         try:
-            row_and_column = calculate_row_and_column(
+            row_and_column = self._board_layout.cell_at(
                 coordinates=mouse_position, from_left_table=False
             )
             # enemy's board is pressed
@@ -651,7 +906,7 @@ class InputHandler:
         elif isinstance(button, ExitEndScreenButton):
             self._game_controller.exit_game()
         elif isinstance(button, MainMenuButton):
-            self._game_controller.__init__()
+            self._game_controller.reset()
 
         return True
 
@@ -672,3 +927,100 @@ class InputHandler:
                 pass
             elif self.button_was_pressed(mouse_position):
                 pass
+
+
+class ScreenRenderer:
+    """draws visualizers only in areas of screen they have reported
+    as changed and updates only these areas on display
+
+    :param _screen: screen where elements will be displayed
+    :type _screen: pygame.Surface
+    :param _visualizers: visualizers in order of drawing (background first)
+    :type _visualizers: list
+    """
+
+    def __init__(self, screen, visualizers):
+        self._screen = screen
+        self._visualizers = visualizers
+
+    def collect_dirty_rects(self):
+        """returns list of changed areas reported by visualizers, areas
+        inside other areas are skipped, too many areas are merged into one"""
+        screen_rect = self._screen.get_rect()
+        reported_rects = []
+        for visualizer in self._visualizers:
+            for rect in visualizer.dirty_rects():
+                rect = pygame.Rect(rect).clip(screen_rect)
+                if rect.width and rect.height:
+                    reported_rects.append(rect)
+
+        # the biggest areas first, so smaller ones inside them can be skipped
+        reported_rects.sort(key=lambda rect: rect.width * rect.height, reverse=True)
+        dirty_rects = []
+        for rect in reported_rects:
+            if not any(dirty_rect.contains(rect) for dirty_rect in dirty_rects):
+                dirty_rects.append(rect)
+
+        if len(dirty_rects) > constants.DIRTY_RECTS_LIMIT:
+            return [dirty_rects[0].unionall(dirty_rects[1:])]
+        return dirty_rects
+
+    def render(self):
+        """draws changed areas of screen and updates them on display,
+        returns list of these areas"""
+        dirty_rects = self.collect_dirty_rects()
+        for dirty_rect in dirty_rects:
+            # everything is drawn, but only inside of changed area
+            self._screen.set_clip(dirty_rect)
+            for visualizer in self._visualizers:
+                visualizer.draw()
+        self._screen.set_clip(None)
+
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        return dirty_rects
+
+
+class IdleScheduler:
+    """lets main loop sleep until user does something or until the nearest
+    animation deadline, so static screens are not redrawn at full FPS
+
+    :param _visualizers: objects with next_update_time() method
+    :type _visualizers: list
+    """
+
+    def __init__(self, visualizers):
+        self._visualizers = visualizers
+
+    def next_update_time(self):
+        """returns the nearest animation deadline or None"""
+        return min(
+            (
+                update_time
+                for update_time in (
+                    visualizer.next_update_time() for visualizer in self._visualizers
+                )
+                if update_time is not None
+            ),
+            default=None,
+        )
+
+    def get_timeout(self):
+        """returns how many milliseconds loop can wait for events,
+        0 if some animation should be updated right now"""
+        update_time = self.next_update_time()
+        if update_time is None:
+            return constants.IDLE_MAX_TIMEOUT
+        timeout = update_time - pygame.time.get_ticks()
+        return max(0, min(timeout, constants.IDLE_MAX_TIMEOUT))
+
+    def wait_for_events(self):
+        """waits for events or the nearest deadline, returns list of events"""
+        timeout = self.get_timeout()
+        if timeout == 0:
+            return pygame.event.get()
+
+        event = pygame.event.wait(timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
@@ -30,6 +30,11 @@ STANDARD_SHIP_QUANTITIES = {
 # table configurations
 BOARD_CELL_SIZE = 10  # how many cells in a row or a column
 
+# bot settings
+HEATMAP_HIT_WEIGHT = 20  # how much more probable are placements covering hits
+FLEET_PLACEMENT_ATTEMPTS = 100  # bot tries this many random fleet layouts
+FLEET_PLACEMENT_QUICK_DRAWS = 8  # random draws before enumerating placements
+
 # game phases
 GAME_START_SCREEN = 3
 POSITIONING_PHASE = 10
@@ -41,6 +46,7 @@ GAME_RESULT_PHASE = 15
 # gamemodes
 PVP = 10  # player vs player
 PVC = 50  # player vs computer
+CVC = 90  # computer vs computer (headless simulations)
 
 # screen dimensions
 SCREEN_WIDTH = 1600
@@ -51,8 +57,21 @@ TABLE_HORIZONTAL_OFFSET = 150
 TABLE_VERTICAL_OFFSET = 150
 TABLE_SIZE = 600  # board is  600px x 600px
 CELL_SIZE = 60  # each cell of table is 60px x 60px
+TABLE_GRID_COLOR = (0, 0, 0)  # grid drawn for boards other than 10x10
 
 FPS = 60
+DIRTY_RECTS_LIMIT = 16  # more changed areas in one frame are merged into one
+IDLE_MAX_TIMEOUT = 1000  # the longest time (ms) main loop sleeps waiting for events
+
+# asset loading
+ASSET_LOADING_WORKERS = 4  # threads decoding images in background
+LOADING_SCREEN_COLOR = (40, 200, 240)
+LOADING_BAR_COLOR = (255, 255, 255)
+LOADING_BAR_SIZE = (600, 30)  # progress bar in the middle of loading screen
+TEXT_CACHE_SIZE = 128  # how many rendered texts are kept in memory
+
+# JSON lines file where played games are recorded, None disables recording
+GAME_LOG_PATH = None
 
 # button id-s
 PLAY_AGAIN_BUTTON = 5
@@ -3,6 +3,7 @@ import pygame
 # modules created for this project
 from MemoryAccess import AssetLoader
 from GameLogicController import GameLogicController
+from GameLog import GameEventLog
 from Images import ImageHandler
 from UserInterface import (
     GameBoardVisualizer,
@@ -10,8 +11,12 @@ from UserInterface import (
     ScreenVisualizer,
     StatusBarVisualizer,
     InputHandler,
+    ScreenRenderer,
+    IdleScheduler,
+    LoadingScreenVisualizer,
 )
 from Buttons import ButtonHandler
+from BoardPositionCalculations import BoardLayout
 import constants
 
 
@@ -25,14 +30,43 @@ def main():
     )
     pygame.display.set_caption("Battleships")
 
-    # initializing controllers
-    game_controller = GameLogicController()
-    asset_loader = AssetLoader()
+    # initializing controllers, games are recorded if log path is set
+    event_log = None
+    if constants.GAME_LOG_PATH is not None:
+        event_log = GameEventLog(constants.GAME_LOG_PATH)
+    game_controller = GameLogicController(event_log=event_log)
+    # positions of tables and cells are computed once for the board size
+    board_layout = BoardLayout(
+        board_height=game_controller.board_height,
+        board_width=game_controller.board_width,
+        screen_width=constants.SCREEN_WIDTH,
+        screen_height=constants.SCREEN_HEIGHT,
+    )
+    # cell images are pre-scaled to cells of this board, images are
+    # decoded in background
+    asset_loader = AssetLoader(cell_size=board_layout.cell_size)
+
+    # minimal screen is shown until start screen images are decoded
+    loading_screen = LoadingScreenVisualizer(
+        screen=game_screen, asset_loader=asset_loader
+    )
+    while not asset_loader.start_screen_loaded:
+        clock.tick(constants.FPS)
+        loading_screen.draw()
+        pygame.display.update()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+
     image_handler = ImageHandler(
         asset_loader=asset_loader, game_controller=game_controller
     )
     game_board_visualizer = GameBoardVisualizer(
-        screen=game_screen, game_controller=game_controller, image_handler=image_handler
+        screen=game_screen,
+        game_controller=game_controller,
+        image_handler=image_handler,
+        board_layout=board_layout,
     )
     screen_visualizer = ScreenVisualizer(
         screen=game_screen, game_controller=game_controller, image_handler=image_handler
@@ -44,15 +78,33 @@ def main():
         screen=game_screen, game_controller=game_controller, image_handler=image_handler
     )
     status_bar_visualizer = StatusBarVisualizer(
-        screen=game_screen, game_controller=game_controller, image_handler=image_handler
+        screen=game_screen,
+        game_controller=game_controller,
+        image_handler=image_handler,
+        board_layout=board_layout,
     )
     input_handler = InputHandler(
-        game_controller=game_controller, button_handler=button_handler
+        game_controller=game_controller,
+        button_handler=button_handler,
+        board_layout=board_layout,
     )
+    # visualizers in order of drawing, background first
+    visualizers = [
+        screen_visualizer,
+        game_board_visualizer,
+        button_handler,
+        prompt_visualizer,
+        status_bar_visualizer,
+    ]
+    screen_renderer = ScreenRenderer(screen=game_screen, visualizers=visualizers)
+    idle_scheduler = IdleScheduler(visualizers=visualizers)
+
+    # mouse motion is not used, it would only wake up the loop
+    pygame.event.set_blocked(pygame.MOUSEMOTION)
 
     # main game loop, checks for event
     while game_controller.game_is_running:
-        # setting frames per second
+        # limiting frames per second when events come quickly
         clock.tick(constants.FPS)
 
         # UPDATE ELEMENTS
@@ -62,17 +114,11 @@ def main():
         prompt_visualizer.update()
         status_bar_visualizer.update()
 
-        # DRAW ELEMENTS
-        screen_visualizer.draw()
-        game_board_visualizer.draw()
-        button_handler.draw()
-        prompt_visualizer.draw()
-        status_bar_visualizer.draw()
+        # DRAW ELEMENTS, only changed areas of screen are drawn
+        screen_renderer.render()
 
-        pygame.display.update()
-
-        # EVENT HANDLER
-        for event in pygame.event.get():
+        # EVENT HANDLER, sleeps until event or next animation deadline
+        for event in idle_scheduler.wait_for_events():
             if event.type == pygame.QUIT:
                 game_controller.exit_game()
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -83,6 +129,8 @@ def main():
                 input_handler.mouse_button_interaction(
                     mouse_position=pygame.mouse.get_pos(), is_pressed=False
                 )
+    if event_log is not None:
+        event_log.close()
     pygame.quit()
 
 
@@ -0,0 +1,97 @@
+from AssetBundle import ASSET_BUNDLE_HEADER, AssetBundle, write_asset_bundle
+from GameErrors import AssetBundleError
+
+import os
+import pygame
+import pytest
+
+
+def test_asset_bundle_round_trip(tmp_path):
+    transparent_image = pygame.Surface((3, 2), pygame.SRCALPHA)
+    transparent_image.fill((10, 20, 30, 100))
+    opaque_image = pygame.Surface((4, 5))
+    opaque_image.fill((200, 100, 50))
+    pygame.image.save(transparent_image, str(tmp_path / "transparent.png"))
+    pygame.image.save(opaque_image, str(tmp_path / "opaque.png"))
+    (tmp_path / "font.ttf").write_bytes(b"font data")
+
+    bundle_path = str(tmp_path / "assets.bundle")
+    write_asset_bundle(
+        bundle_path, str(tmp_path), ["transparent.png", "opaque.png"], ["font.ttf"]
+    )
+    bundle = AssetBundle(bundle_path)
+
+    assert sorted(bundle.names) == ["font.ttf", "opaque.png", "transparent.png"]
+    image = bundle.get_image("transparent.png")
+    assert image.get_size() == (3, 2)
+    assert image.get_at((2, 1)) == (10, 20, 30, 100)
+    image = bundle.get_image("opaque.png")
+    assert image.get_size() == (4, 5)
+    assert image.get_at((3, 4)) == (200, 100, 50, 255)
+    assert bundle.get_bytes("font.ttf") == b"font data"
+
+
+def test_asset_bundle_invalid_file(tmp_path):
+    bundle_path = tmp_path / "assets.bundle"
+    bundle_path.write_bytes(b"not a bundle at all")
+    with pytest.raises(AssetBundleError):
+        AssetBundle(str(bundle_path))
+
+
+def test_asset_bundle_rejects_repeated_names(tmp_path):
+    (tmp_path / "font.ttf").write_bytes(b"font data")
+    bundle_path = tmp_path / "assets.bundle"
+    with pytest.raises(AssetBundleError):
+        write_asset_bundle(str(bundle_path), str(tmp_path), [], ["font.ttf"] * 2)
+    assert not bundle_path.exists()
+
+
+def write_font_bundle(tmp_path):
+    (tmp_path / "font.ttf").write_bytes(b"font data" * 10)
+    bundle_path = tmp_path / "assets.bundle"
+    write_asset_bundle(str(bundle_path), str(tmp_path), [], ["font.ttf"])
+    return bundle_path
+
+
+def test_asset_bundle_empty_file(tmp_path):
+    bundle_path = tmp_path / "assets.bundle"
+    bundle_path.write_bytes(b"")
+    with pytest.raises(AssetBundleError):
+        AssetBundle(str(bundle_path))
+
+
+def test_asset_bundle_garbled_index(tmp_path):
+    bundle_path = write_font_bundle(tmp_path)
+    data = bytearray(bundle_path.read_bytes())
+    data[ASSET_BUNDLE_HEADER.size] = ord("#")
+    bundle_path.write_bytes(bytes(data))
+    with pytest.raises(AssetBundleError):
+        AssetBundle(str(bundle_path))
+
+
+def test_asset_bundle_truncated_file(tmp_path):
+    bundle_path = write_font_bundle(tmp_path)
+    data = bundle_path.read_bytes()
+    # index is cut in the middle
+    bundle_path.write_bytes(data[: ASSET_BUNDLE_HEADER.size + 5])
+    with pytest.raises(AssetBundleError):
+        AssetBundle(str(bundle_path))
+    # data of the font is cut in the middle
+    bundle_path.write_bytes(data[:-5])
+    with pytest.raises(AssetBundleError):
+        AssetBundle(str(bundle_path))
+
+
+def test_interrupted_build_keeps_old_bundle(tmp_path, monkeypatch):
+    bundle_path = write_font_bundle(tmp_path)
+    data = bundle_path.read_bytes()
+    (tmp_path / "font.ttf").write_bytes(b"new font data")
+
+    def interrupt(source, destination):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(os, "replace", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        write_asset_bundle(str(bundle_path), str(tmp_path), [], ["font.ttf"])
+    assert bundle_path.read_bytes() == data
+    assert sorted(os.listdir(tmp_path)) == ["assets.bundle", "font.ttf"]
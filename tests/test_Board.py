@@ -0,0 +1,104 @@
+import pytest
+import numpy as np
+
+from Board import Board, BoardCell, NO_SHIP
+from Ships import Ship
+import constants
+from GameErrors import OcupiedCellError, CellAlreadyShotError
+
+
+def test_Board_init():
+    board = Board(3, 4)
+    assert board.height == 3
+    assert board.width == 4
+    assert len(board) == 3
+    assert len(board[0]) == 4
+
+    assert board.occupancy.shape == (3, 4)
+    assert board.occupancy.dtype == np.uint8
+    assert board.shots.dtype == np.uint8
+    assert board.ship_ids.dtype == np.int16
+    assert not board.occupancy.any()
+    assert not board.shots.any()
+    assert (board.ship_ids == NO_SHIP).all()
+
+
+def test_Board_cell_views_share_state():
+    board = Board(2, 2)
+    s = Ship(1)
+
+    assert isinstance(board[1, 0], BoardCell)
+    board[1, 0].position_ship(s)
+
+    assert not board[1, 0].is_free
+    assert board[1, 0].ship_handle is s
+    assert board[0, 0].is_free
+    assert board.occupancy[1, 0] == 1
+
+
+def test_Board_place_ship():
+    board = Board(5, 5)
+    s1 = Ship(3)
+    s2 = Ship(2)
+
+    board.place_ship(s1, row=1, column=1, orientation=constants.SHIP_HORIZONTAL)
+    assert board.occupancy[1, 1:4].all()
+    assert board.occupancy.sum() == 3
+    assert board.ship_handle(1, 3) is s1
+
+    assert not board.is_area_free(0, 2, 2, constants.SHIP_VERTICAL)
+    assert board.is_area_free(2, 2, 2, constants.SHIP_VERTICAL)
+
+    with pytest.raises(OcupiedCellError):
+        board.place_ship(s2, row=0, column=2, orientation=constants.SHIP_VERTICAL)
+    # nothing was written on colision
+    assert board.occupancy.sum() == 3
+
+    board.place_ship(s2, row=2, column=2, orientation=constants.SHIP_VERTICAL)
+    assert board.ship_handle(3, 2) is s2
+    assert board.ship_ids[3, 2] != board.ship_ids[1, 2]
+
+
+def test_Board_handle_attack():
+    board = Board(3, 3)
+    s = Ship(2)
+    board.place_ship(s, row=0, column=0, orientation=constants.SHIP_VERTICAL)
+
+    assert board.handle_attack(2, 2) == constants.ATTACK_UNSUCCESSFUL
+    assert board.handle_attack(0, 0) == constants.SHIP_HIT
+    assert board.handle_attack(1, 0) == constants.SHIP_SUNK
+    assert board.shots.sum() == 3
+    assert board[1, 0].was_shot
+
+    with pytest.raises(CellAlreadyShotError):
+        board.handle_attack(2, 2)
+
+
+def test_Board_changed_cells():
+    board = Board(4, 4)
+    assert board.changes_count == 0
+
+    board.place_ship(Ship(3), row=1, column=0, orientation=constants.SHIP_HORIZONTAL)
+    board.place_ship(Ship(2), row=2, column=3, orientation=constants.SHIP_VERTICAL)
+    assert board.changed_cells() == [(1, 0), (1, 1), (1, 2), (2, 3), (3, 3)]
+    assert board.changes_count == 2
+
+    drawn_changes = board.changes_count
+    board.handle_attack(1, 1)
+    board.handle_attack(0, 0)
+    assert board.changed_cells(since=drawn_changes) == [(0, 0), (1, 1)]
+    assert board.changed_cells(since=drawn_changes + 1) == [(0, 0)]
+    assert board.changed_cells(since=board.changes_count) == []
+    assert board.changes_count == 4
+
+    # failed placement does not change anything
+    with pytest.raises(OcupiedCellError):
+        board.place_ship(Ship(2), row=0, column=1, orientation=constants.SHIP_VERTICAL)
+    assert board.changes_count == 4
+
+    # copy of board continues counting changes on its own
+    ship_copies = {ship: Ship(ship.length) for ship in board.ships}
+    board_copy = board.clone(ship_copies)
+    board_copy.handle_attack(3, 3)
+    assert board_copy.changed_cells(since=4) == [(3, 3)]
+    assert board.changed_cells(since=4) == []
@@ -2,8 +2,10 @@ from BoardPositionCalculations import (
     verify_row_and_column,
     calculate_row_and_column,
     calculate_x_y_cooridantes,
+    BoardLayout,
 )
 from GameErrors import OutOfTableError
+import numpy as np
 import pytest
 
 
@@ -114,3 +116,56 @@ def test_calculate_x_y_coordinates(monkeypatch):
     x, y = calculate_x_y_cooridantes(row=5, column=5, from_left_table=False)
     assert x == 150 + 600 + 100 + (5 * 60)
     assert y == 100 + (5 * 60)
+
+
+def test_BoardLayout_standard_board():
+    layout = BoardLayout(10, 10, screen_width=1600, screen_height=900)
+
+    assert layout.cell_size == 60
+    assert layout.table_width == 600
+    assert layout.table_position(from_left_table=True) == (150, 150)
+    assert layout.table_position(from_left_table=False) == (850, 150)
+
+    # the same results as functions for standard board
+    for row, column in [(0, 0), (3, 7), (9, 9)]:
+        for from_left_table in (True, False):
+            position = layout.cell_position(row, column, from_left_table)
+            assert position == calculate_x_y_cooridantes(row, column, from_left_table)
+            assert layout.cell_at(
+                (position[0] + 1, position[1] + 1), from_left_table
+            ) == (row, column)
+
+    assert layout.table_rect(from_left_table=False) == (850, 150, 600, 600)
+    assert layout.cell_rect(2, 3, from_left_table=True) == (330, 270, 60, 60)
+
+    with pytest.raises(OutOfTableError):
+        layout.cell_at((150, 150))
+    with pytest.raises(OutOfTableError):
+        layout.cell_position(10, 0)
+
+
+def test_BoardLayout_large_board():
+    layout = BoardLayout(50, 40, screen_width=1600, screen_height=900)
+
+    assert layout.cell_size == 12
+    assert layout.table_width == 480
+    assert layout.table_height == 600
+    assert layout.table_x(from_left_table=False) == 1600 - 150 - 480
+
+    rows = np.array([0, 49, 20])
+    columns = np.array([0, 39, 5])
+    positions = layout.cell_positions(rows, columns, from_left_table=False)
+    assert positions.tolist() == [[970, 150], [970 + 468, 150 + 588], [1030, 390]]
+
+    # bottom right corner of cell belongs to it
+    found_rows, found_columns, inside = layout.cells_at(
+        positions[:, 0] + 12, positions[:, 1] + 12, from_left_table=False
+    )
+    assert found_rows.tolist() == rows.tolist()
+    assert found_columns.tolist() == columns.tolist()
+    assert inside.all()
+
+    _, _, inside = layout.cells_at([150, 200, 631], [200, 150, 200])
+    assert inside.tolist() == [False, False, False]
+    with pytest.raises(OutOfTableError):
+        layout.cell_at((200, 751))
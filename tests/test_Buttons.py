@@ -25,3 +25,8 @@ def test_check_if_mouse_on_button_corners():
     assert button.check_if_mouse_on_button((0, 100))
     assert button.check_if_mouse_on_button((50, 100))
     assert button.check_if_mouse_on_button((50, 0))
+
+
+def test_button_rect():
+    button = Button(position=(20, 30), screen="this is screen", image=fake_image)
+    assert button.rect == (20, 30, 50, 100)
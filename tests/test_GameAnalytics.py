@@ -0,0 +1,132 @@
+from GameAnalytics import (
+    LogAnalytics,
+    analyze_logs,
+    read_log_chunk,
+    split_log_file,
+    summarize_games,
+)
+from GameErrors import BoardSizeMismatchError
+from GameLog import GameEventLog, read_game_events, GAME_STARTED_EVENT
+from GameLogicController import GameLogicController
+from Player import BotPlayer, ProbabilityBotPlayer
+from Simulation import SimulationClock, simulate_games
+import constants
+
+from datetime import timedelta
+import json
+import random
+import numpy as np
+import pytest
+
+
+def play_timed_bot_game(seed, event_log):
+    """plays bot game in which every round takes 100 milliseconds"""
+    clock = SimulationClock()
+    game_controller = GameLogicController(clock=clock, event_log=event_log)
+    game_controller.bots_selected(
+        ProbabilityBotPlayer(rng=random.Random(seed)),
+        BotPlayer(rng=random.Random(seed + 10)),
+    )
+    while game_controller.phase == constants.GAME_PHASE:
+        clock.advance(100)
+        game_controller.play_bot_round()
+    return game_controller
+
+
+def test_summaries_match_controller_statistics(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    event_log = GameEventLog(log_path)
+    games = [play_timed_bot_game(seed, event_log) for seed in range(3)]
+    event_log.close()
+
+    summaries = list(summarize_games(log_path))
+    assert len(summaries) == 3
+    for game_controller, summary in zip(games, summaries):
+        winner = game_controller.winner
+        assert summary.gamemode == constants.CVC
+        assert summary.rounds_played == game_controller.rounds_played
+        assert summary.game_play_time == game_controller.game_play_time
+        assert summary.winner_index == game_controller.get_player_index(winner)
+        assert summary.get_fleet_percentage(
+            summary.winner_index
+        ) == game_controller.calculate_percentage_state_of_players_fleet(winner)
+        assert summary.get_fleet_percentage(3 - summary.winner_index) == 0
+
+
+def test_heatmaps_count_shots_of_players(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    event_log = GameEventLog(log_path)
+    games = [play_timed_bot_game(seed, event_log) for seed in range(2)]
+    event_log.close()
+
+    analytics = LogAnalytics().add_games(summarize_games(log_path))
+    assert analytics.games_played == 2
+    mean_play_time = (
+        sum(
+            game_controller.game_play_time // timedelta(milliseconds=1)
+            for game_controller in games
+        )
+        / 2
+    )
+    assert analytics.as_dict()["mean_game_play_milliseconds"] == mean_play_time
+    assert analytics.mean_game_play_time == timedelta(milliseconds=mean_play_time)
+    assert analytics.board_shape == (
+        constants.BOARD_CELL_SIZE,
+        constants.BOARD_CELL_SIZE,
+    )
+    # shots of player 1 are on board of player 2
+    expected_shots = sum(
+        game_controller.player2.board.shots.astype(np.int64)
+        for game_controller in games
+    )
+    assert (analytics.get_shot_heatmap(1) == expected_shots).all()
+    assert analytics.get_shot_heatmap().sum() == sum(
+        game_controller.rounds_played for game_controller in games
+    )
+    hit_rates = analytics.get_hit_rate_heatmap()
+    assert ((hit_rates >= 0) & (hit_rates <= 1)).all()
+    assert (analytics.get_hit_heatmap() <= analytics.get_shot_heatmap()).all()
+
+
+def test_chunks_read_every_game_once(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    event_log = GameEventLog(log_path)
+    simulate_games(10, seed=3, event_log=event_log)
+    event_log.close()
+
+    chunks = split_log_file(log_path, chunk_size=5000)
+    assert len(chunks) > 10
+    chunk_events = []
+    for _, start, end in chunks:
+        chunk_events.extend(read_log_chunk(log_path, start, end))
+    assert chunk_events == list(read_game_events(log_path))
+    starts = [event for event in chunk_events if event["event"] == GAME_STARTED_EVENT]
+    assert len(starts) == 10
+
+
+def test_analyze_logs_does_not_depend_on_chunks_or_workers(tmp_path):
+    log_paths = [str(tmp_path / "games1.jsonl"), str(tmp_path / "games2.jsonl")]
+    for seed, log_path in enumerate(log_paths):
+        event_log = GameEventLog(log_path)
+        simulate_games(6, seed=seed, event_log=event_log)
+        event_log.close()
+
+    whole_files = analyze_logs(log_paths, workers=1, chunk_size=2**30)
+    in_pool = analyze_logs(log_paths, workers=2, chunk_size=7000)
+    assert whole_files.games_played == 12
+    assert whole_files.finished_games == 12
+    assert in_pool.as_dict() == whole_files.as_dict()
+    assert json.loads(json.dumps(whole_files.as_dict()))["games_played"] == 12
+    assert (in_pool.get_shot_heatmap() == whole_files.get_shot_heatmap()).all()
+    assert (in_pool.get_hit_heatmap(2) == whole_files.get_hit_heatmap(2)).all()
+
+
+def test_games_on_different_boards_cannot_be_merged(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    event_log = GameEventLog(log_path)
+    simulate_games(1, seed=1, event_log=event_log)
+    simulate_games(1, seed=1, board_height=8, board_width=8, event_log=event_log)
+    event_log.close()
+
+    with pytest.raises(BoardSizeMismatchError):
+        analyze_logs(log_path, workers=1)
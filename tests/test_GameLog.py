@@ -0,0 +1,183 @@
+from GameLog import (
+    GameEventLog,
+    GameReplay,
+    read_game_events,
+    replay_games,
+    SHOT_EVENT,
+    SHIP_PLACED_EVENT,
+)
+from GameErrors import ReplayError
+from GameLogicController import GameLogicController
+from Player import BotPlayer, ProbabilityBotPlayer
+from Simulation import SimulationClock, play_bot_game
+import constants
+
+import random
+import pytest
+
+
+def test_replay_of_bot_games(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    event_log = GameEventLog(log_path)
+    games = []
+    for seed in range(3):
+        games.append(
+            play_bot_game(
+                ProbabilityBotPlayer(rng=random.Random(seed)),
+                BotPlayer(rng=random.Random(seed + 10)),
+                event_log=event_log,
+            )
+        )
+    event_log.close()
+
+    replays = list(replay_games(log_path))
+    assert len(replays) == 3
+    for game_controller, replay in zip(games, replays):
+        assert replay.gamemode == constants.CVC
+        assert replay.phase == constants.GAME_RESULT_PHASE
+        assert replay.rounds_played == game_controller.rounds_played
+        assert replay.winner_index == game_controller.get_player_index(
+            game_controller.winner
+        )
+        for replayed_player, player in zip(
+            replay.players, (game_controller.player1, game_controller.player2)
+        ):
+            assert (replayed_player.board.shots == player.board.shots).all()
+            assert replayed_player.placements == player.placements
+
+
+def test_replay_of_pvp_game(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    clock = SimulationClock()
+    game_controller = GameLogicController(
+        ship_configuration={"Cruiser": 1},
+        clock=clock,
+        event_log=GameEventLog(log_path),
+    )
+    game_controller.game_mode_selected(constants.PVP)
+    clock.advance(1000)
+    game_controller.players_cells_selected(0, 0, 0, 2)
+    # failed placement is not recorded
+    game_controller.players_cells_selected(5, 5, 5, 6)
+    game_controller.switch_current_player()
+    game_controller.exit_black_screen_phase()
+    game_controller.players_cells_selected(1, 0, 1, 2)
+    game_controller.enemys_board_mouse_pressed(0, 0)
+
+    events = list(read_game_events(log_path))
+    assert [event["event"] for event in events] == [
+        "start",
+        "phase",
+        "placement",
+        "phase",
+        "phase",
+        "phase",
+        "placement",
+        "phase",
+        "shot",
+        "phase",
+    ]
+    assert events[2]["time"] == 1000
+
+    replay = GameReplay.from_events(events)
+    assert replay.phase == constants.READY_TO_SWITCH_PHASE
+    assert replay.rounds_played == 1
+    # player2 shot at cruiser of player1
+    assert replay.get_player(1).board[0, 0].ship_handle.hit_counter == 1
+    assert replay.winner_index is None
+
+
+def test_replay_detects_wrong_status(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    event_log = GameEventLog(log_path)
+    play_bot_game(
+        BotPlayer(rng=random.Random(1)),
+        BotPlayer(rng=random.Random(2)),
+        event_log=event_log,
+    )
+    event_log.close()
+
+    events = list(read_game_events(log_path))
+    shot = next(event for event in events if event["event"] == SHOT_EVENT)
+    shot["status"] = 5
+    with pytest.raises(ReplayError):
+        GameReplay.from_events(events)
+
+
+def test_clone_does_not_write_to_event_log(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    event_log = GameEventLog(log_path)
+    game_controller = GameLogicController(clock=SimulationClock(), event_log=event_log)
+    game_controller.bots_selected(
+        BotPlayer(rng=random.Random(1)), BotPlayer(rng=random.Random(2))
+    )
+    for _ in range(10):
+        game_controller.play_bot_round()
+    events_count = event_log.events_count
+
+    clone = game_controller.clone()
+    while clone.phase == constants.GAME_PHASE:
+        clone.play_bot_round()
+    assert event_log.events_count == events_count
+
+    while game_controller.phase == constants.GAME_PHASE:
+        game_controller.play_bot_round()
+    event_log.close()
+
+    (replay,) = replay_games(log_path)
+    assert replay.rounds_played == game_controller.rounds_played
+    assert replay.winner_index == game_controller.get_player_index(
+        game_controller.winner
+    )
+
+
+def test_replay_errors_have_event_index(tmp_path):
+    log_path = str(tmp_path / "games.jsonl")
+    event_log = GameEventLog(log_path)
+    play_bot_game(
+        BotPlayer(rng=random.Random(1)),
+        BotPlayer(rng=random.Random(2)),
+        event_log=event_log,
+    )
+    event_log.close()
+    events = list(read_game_events(log_path))
+    shot_index = next(
+        index for index, event in enumerate(events) if event["event"] == SHOT_EVENT
+    )
+    placement_index = next(
+        index
+        for index, event in enumerate(events)
+        if event["event"] == SHIP_PLACED_EVENT
+    )
+
+    def corrupted_events(index, **fields):
+        corrupted = [dict(event) for event in events]
+        corrupted[index].update(fields)
+        return corrupted
+
+    # the same cell is shot twice
+    repeated_shot = corrupted_events(shot_index)
+    repeated_shot.insert(shot_index, dict(events[shot_index]))
+    # missing field
+    missing_field = corrupted_events(shot_index)
+    del missing_field[shot_index]["row"]
+    for corrupted, error_index in (
+        (repeated_shot, shot_index + 1),
+        (missing_field, shot_index),
+        (corrupted_events(shot_index, row=-1), shot_index),
+        (corrupted_events(shot_index, player=0), shot_index),
+        (corrupted_events(placement_index, length=9), placement_index),
+        (
+            corrupted_events(
+                placement_index + 1,
+                x=events[placement_index]["x"],
+                y=events[placement_index]["y"],
+                orientation=events[placement_index]["orientation"],
+            ),
+            placement_index + 1,
+        ),
+        (corrupted_events(placement_index, orientation=7), placement_index),
+    ):
+        with pytest.raises(ReplayError) as error:
+            GameReplay.from_events(corrupted)
+        assert error.value.event_index == error_index
@@ -1,8 +1,15 @@
 from GameLogicController import GameLogicController
 import constants
-from Player import Player, BotPlayer
-from Ships import Carrier
+from Player import Player, BotPlayer, ProbabilityBotPlayer
+from Ships import FleetSpec
+from Simulation import SimulationClock
+from Snapshot import SNAPSHOT_HEADER
+from GameErrors import SnapshotError
 from datetime import timedelta
+import random
+import struct
+import pytest
+import numpy as np
 
 
 def test_GameLogicController_init(monkeypatch):
@@ -540,78 +547,79 @@ def test_calculate_players_alive_segments(monkeypatch):
     assert game_controller.calculate_players_alive_segments(player2) == 4
 
 
-def test_get_play_time_as_str(monkeypatch):
-    game_controller = GameLogicController()
-
-    time = timedelta(seconds=90)
-    monkeypatch.setattr("GameLogicController.GameLogicController.game_play_time", time)
-    assert game_controller.get_play_time_as_str() == "1 minute, 30 seconds"
-
-    time = timedelta(seconds=1)
-    monkeypatch.setattr("GameLogicController.GameLogicController.game_play_time", time)
-    assert game_controller.get_play_time_as_str() == "1 second"
-
-    time = timedelta(seconds=60)
-    monkeypatch.setattr("GameLogicController.GameLogicController.game_play_time", time)
-    assert game_controller.get_play_time_as_str() == "1 minute, 0 seconds"
-
-    time = timedelta(hours=1, minutes=1, seconds=1)
-    monkeypatch.setattr("GameLogicController.GameLogicController.game_play_time", time)
-    assert game_controller.get_play_time_as_str() == "1 hour, 1 minute, 1 second"
-
-    time = timedelta(hours=3, minutes=3, seconds=3)
-    monkeypatch.setattr("GameLogicController.GameLogicController.game_play_time", time)
-    assert game_controller.get_play_time_as_str() == "3 hours, 3 minutes, 3 seconds"
-
-
-def test_generate_statistics(monkeypatch):
-    def get_fake_time(_):
-        return "1 minute, 30 seconds"
-
-    def fake_winner_percentage(a, b):
-        return 90
-
-    monkeypatch.setattr(
-        "GameLogicController.GameLogicController.get_play_time_as_str", get_fake_time
+def test_statistics_are_counted_during_game():
+    clock = SimulationClock()
+    game_controller = GameLogicController(clock=clock)
+    game_controller.bots_selected(
+        ProbabilityBotPlayer(rng=random.Random(3)), BotPlayer(rng=random.Random(4))
     )
-    monkeypatch.setattr("GameLogicController.GameLogicController.rounds_played", 50)
-    monkeypatch.setattr(
-        "GameLogicController.GameLogicController.calculate_percentage_state_of_players_fleet",
-        fake_winner_percentage,
+    statistics = game_controller.statistics
+    assert statistics.shots == 0
+    assert statistics.accuracy == 0.0
+    assert statistics.winner_fleet_intact is None
+
+    while game_controller.phase == constants.GAME_PHASE:
+        clock.advance(500)
+        game_controller.play_bot_round()
+
+    statistics = game_controller.statistics
+    winner = game_controller.winner
+    assert statistics.play_time == game_controller.game_play_time
+    assert statistics.rounds_played == game_controller.rounds_played
+    assert statistics.shots == game_controller.rounds_played
+    assert statistics.winner_index == game_controller.get_player_index(winner)
+    assert statistics.winner_fleet_intact_percentage == (
+        game_controller.calculate_percentage_state_of_players_fleet(winner)
     )
 
-    game_controller = GameLogicController()
-    a = Player()
-
-    # testing monkey patch
-    assert game_controller.get_play_time_as_str() == "1 minute, 30 seconds"
-    assert game_controller.rounds_played == 50
-    assert game_controller.calculate_percentage_state_of_players_fleet(a) == 90
+    winner_shots = statistics.get_player_shots(statistics.winner_index)
+    assert winner_shots.hits == game_controller.get_total_ship_segments()
+    assert winner_shots.ships_sunk == game_controller.fleet_spec.ships_count
+    assert winner_shots.shots == int(game_controller.player_attacked.board.shots.sum())
+    assert winner_shots.misses == winner_shots.shots - winner_shots.hits
+    assert statistics.hits == sum(
+        statistics.get_player_shots(index).hits for index in (1, 2)
+    )
+    assert 0.0 < statistics.accuracy <= 1.0
+    assert (
+        statistics.as_dict()["players"][0] == statistics.get_player_shots(1).as_dict()
+    )
 
-    expected_output = {
-        "Time of gameplay": "1 minute, 30 seconds",
-        "Rounds played": "50",
-        "Percentage of winners fleet intact": "90",
-    }
-    assert game_controller.generate_statistics() == expected_output
 
+def test_statistics_of_pvc_game():
+    game_controller = GameLogicController(ship_configuration={"PatrolShip": 1})
+    game_controller.game_mode_selected(constants.PVC)
+    game_controller.position_ships_phase(0, 0, 0, 1)
+    bot = game_controller.player2
+    ship_row, ship_column = np.argwhere(bot.board.occupancy)[0]
+
+    game_controller.play_game_phase(ship_row, ship_column)
+    player_shots = game_controller.get_shot_statistics(game_controller.player1)
+    assert (player_shots.shots, player_shots.hits, player_shots.ships_sunk) == (
+        1,
+        1,
+        0,
+    )
+    assert game_controller.get_shot_statistics(bot).shots == 1
+    assert game_controller.statistics.shots == 2
 
-def test_calculate_players_alive_segments_and_calculate_percentage_of_players_fleet(
-    monkeypatch,
-):
-    ship = Carrier()
-    monkeypatch.setattr("Player.Player.fleet", [ship])
 
+def test_calculate_players_alive_segments_and_calculate_percentage_of_players_fleet():
     game_controller = GameLogicController()
     player = Player()
+    player.add_ship(5, constants.SHIP_HORIZONTAL, 0, 0)
     assert game_controller.calculate_players_alive_segments(player) == 5
 
     # player's ship was shot
-    player.fleet[0].take_damage()
+    player.take_attack(0, 0)
     assert game_controller.calculate_players_alive_segments(player) == 4
 
     # player's ship was shot
-    player.fleet[0].take_damage()
+    player.take_attack(1, 0)
+    assert game_controller.calculate_players_alive_segments(player) == 3
+
+    # missed shot does not change anything
+    player.take_attack(0, 1)
     assert game_controller.calculate_players_alive_segments(player) == 3
 
     # testing calculate_percentage_state_of_players_fleet
@@ -637,3 +645,204 @@ def test_exit_game():
     assert game_controller.game_is_running
     game_controller.exit_game()
     assert not game_controller.game_is_running
+
+
+def test_GameLogicController_custom_clock(monkeypatch):
+    standard_ship_quantities = {
+        "PatrolShip": 1,
+    }
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+    ticks = [1000]
+
+    game_controller = GameLogicController(
+        board_height=2, board_width=1, clock=lambda: ticks[0]
+    )
+    game_controller.game_mode_selected(constants.PVC)
+    game_controller.players_cells_selected(
+        start_column=0, start_row=0, end_row=1, end_column=0
+    )
+
+    ticks[0] = 61000
+    assert game_controller.game_play_time == timedelta(seconds=60)
+
+
+def test_play_bot_round(monkeypatch):
+    standard_ship_quantities = {
+        "PatrolShip": 1,
+    }
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+
+    game_controller = GameLogicController(board_height=2, board_width=1)
+    bot1 = BotPlayer(board_height=2, board_width=1)
+    bot2 = BotPlayer(board_height=2, board_width=1)
+    game_controller.bots_selected(bot1, bot2)
+
+    assert game_controller.phase == constants.GAME_PHASE
+    assert not bot1.ships_to_place
+    assert not bot2.ships_to_place
+
+    assert game_controller.play_bot_round() == constants.SHIP_HIT
+    assert game_controller.current_player == bot2
+    assert game_controller.player_attacked == bot1
+
+    game_controller.play_bot_round()
+    assert game_controller.play_bot_round() == constants.SHIP_SUNK
+    assert game_controller.rounds_played == 3
+    assert game_controller.phase == constants.GAME_RESULT_PHASE
+    assert game_controller.winner == bot1
+    assert game_controller.play_bot_round() is None
+
+
+def test_custom_ship_configuration():
+    fleet_spec = FleetSpec.from_length_quantities({8: 1, 1: 4})
+    game_controller = GameLogicController(
+        board_height=12, board_width=12, ship_configuration=fleet_spec
+    )
+    assert game_controller.fleet_spec is fleet_spec
+    assert game_controller.get_total_ship_segments() == 12
+
+    game_controller.game_mode_selected(constants.PVC)
+    assert game_controller.player1.fleet_spec is fleet_spec
+    assert len(game_controller.player1.ships_to_place) == 5
+    assert sorted(ship.length for ship in game_controller.player2.fleet) == [
+        1,
+        1,
+        1,
+        1,
+        8,
+    ]
+
+    game_controller = GameLogicController(ship_configuration={"Carrier": 2})
+    assert game_controller.get_total_ship_segments() == 10
+
+
+def test_snapshot_restore_bot_game():
+    clock = SimulationClock()
+    game_controller = GameLogicController(clock=clock)
+    game_controller.bots_selected(
+        ProbabilityBotPlayer(rng=random.Random(1)), BotPlayer(rng=random.Random(2))
+    )
+    for _ in range(30):
+        game_controller.play_bot_round()
+    clock.advance(5000)
+
+    restored = GameLogicController.restore(game_controller.snapshot(), clock=clock)
+    assert restored.snapshot() == game_controller.snapshot()
+    assert restored.phase == constants.GAME_PHASE
+    assert restored.rounds_played == 30
+    assert restored.game_play_time == timedelta(seconds=5)
+    assert restored.player1.alive_segments == game_controller.player1.alive_segments
+    assert (
+        restored.player1.calculate_heatmap()
+        == game_controller.player1.calculate_heatmap()
+    ).all()
+
+    # restored bots continue the same way, their random generators are restored
+    while game_controller.phase == constants.GAME_PHASE:
+        game_controller.play_bot_round()
+        restored.play_bot_round()
+    assert restored.rounds_played == game_controller.rounds_played
+    assert restored.winner_name == game_controller.winner_name
+    assert restored.statistics.as_dict() == game_controller.statistics.as_dict()
+
+
+def test_snapshot_restore_positioning_phase():
+    clock = SimulationClock()
+    game_controller = GameLogicController(clock=clock)
+    assert GameLogicController.restore(game_controller.snapshot()).player1 is None
+
+    game_controller.game_mode_selected(constants.PVC)
+    game_controller.players_cells_selected(0, 0, 0, 4)
+    game_controller.players_cells_selected(0, 0, 0, 2)
+
+    restored = GameLogicController.restore(game_controller.snapshot(), clock=clock)
+    assert restored.gamemode == constants.PVC
+    assert restored.phase == constants.POSITIONING_PHASE
+    assert restored.fetch_prompt() == "Cannot place ship here"
+    assert restored.current_player is restored.player1
+    assert restored.player_attacked is restored.player2
+    assert len(restored.player1.fleet) == 1
+    assert len(restored.player1.ships_to_place) == 8
+    assert isinstance(restored.player2, BotPlayer)
+    assert restored.player2.placements == game_controller.player2.placements
+
+
+def test_restore_invalid_board_size():
+    data = GameLogicController().snapshot()
+    # board height is stored right after header
+    for board_height in (10**6, -3, 0):
+        corrupted = bytearray(data)
+        struct.pack_into("<q", corrupted, SNAPSHOT_HEADER.size, board_height)
+        with pytest.raises(SnapshotError):
+            GameLogicController.restore(bytes(corrupted))
+
+
+def test_restore_inconsistent_players():
+    game_controller = GameLogicController()
+    game_controller.game_mode_selected(constants.PVC)
+    game_controller.players_cells_selected(0, 0, 0, 4)
+
+    # second ship at the same place
+    placements = game_controller.player1.placements
+    placements.append(placements[0])
+    with pytest.raises(SnapshotError):
+        GameLogicController.restore(game_controller.snapshot())
+    placements.pop()
+
+    # player has different board than game
+    game_controller.player2._board_height = 11
+    with pytest.raises(SnapshotError):
+        GameLogicController.restore(game_controller.snapshot())
+
+
+def test_restore_corrupted_snapshots():
+    game_controller = GameLogicController(clock=SimulationClock())
+    game_controller.bots_selected(
+        ProbabilityBotPlayer(rng=random.Random(1)), BotPlayer(rng=random.Random(2))
+    )
+    for _ in range(30):
+        game_controller.play_bot_round()
+    data = game_controller.snapshot()
+
+    rng = random.Random(0)
+    errors = 0
+    for _ in range(200):
+        corrupted = bytearray(data)
+        corrupted[rng.randrange(SNAPSHOT_HEADER.size, len(data))] = rng.randrange(256)
+        # corrupted data restores to some game or raises SnapshotError
+        try:
+            GameLogicController.restore(bytes(corrupted), clock=SimulationClock())
+        except SnapshotError:
+            errors += 1
+    assert errors > 0
+
+
+def test_clone():
+    game_controller = GameLogicController(clock=SimulationClock())
+    game_controller.bots_selected(
+        BotPlayer(rng=random.Random(1)), BotPlayer(rng=random.Random(2))
+    )
+    for _ in range(10):
+        game_controller.play_bot_round()
+
+    clone = game_controller.clone()
+    assert clone.current_player is clone.player1
+    assert clone.player_attacked is clone.player2
+    assert clone.player1 is not game_controller.player1
+    assert clone.fleet_spec is game_controller.fleet_spec
+
+    while clone.phase == constants.GAME_PHASE:
+        clone.play_bot_round()
+    assert game_controller.rounds_played == 10
+    assert game_controller.statistics.shots == 10
+    assert clone.statistics.shots == clone.rounds_played
+    assert game_controller.phase == constants.GAME_PHASE
+    assert game_controller.winner is None
+    assert clone.winner in (clone.player1, clone.player2)
+
+    # original game is played the same way as its clone
+    while game_controller.phase == constants.GAME_PHASE:
+        game_controller.play_bot_round()
+    assert game_controller.rounds_played == clone.rounds_played
+    assert game_controller.winner_name == clone.winner_name
+    assert game_controller.statistics.as_dict() == clone.statistics.as_dict()
@@ -0,0 +1,78 @@
+from GameStatistics import (
+    GameStatistics,
+    ShotStatistics,
+    format_play_time,
+    format_statistics,
+)
+import constants
+
+from datetime import timedelta
+
+
+def test_format_play_time():
+    assert format_play_time(timedelta(seconds=90)) == "1 minute, 30 seconds"
+    assert format_play_time(timedelta(seconds=1)) == "1 second"
+    assert format_play_time(timedelta(seconds=60)) == "1 minute, 0 seconds"
+    assert (
+        format_play_time(timedelta(hours=1, minutes=1, seconds=1))
+        == "1 hour, 1 minute, 1 second"
+    )
+    assert (
+        format_play_time(timedelta(hours=3, minutes=3, seconds=3))
+        == "3 hours, 3 minutes, 3 seconds"
+    )
+
+
+def test_shot_statistics():
+    shot_statistics = ShotStatistics()
+    assert shot_statistics.accuracy == 0.0
+    for attack_status in (
+        constants.ATTACK_UNSUCCESSFUL,
+        constants.SHIP_HIT,
+        constants.SHIP_SUNK,
+        constants.ATTACK_UNSUCCESSFUL,
+    ):
+        shot_statistics.add_shot(attack_status)
+    assert shot_statistics.as_dict() == {
+        "shots": 4,
+        "hits": 2,
+        "misses": 2,
+        "accuracy": 0.5,
+        "ships_sunk": 1,
+    }
+
+    clone = shot_statistics.clone()
+    clone.add_shot(constants.SHIP_HIT)
+    assert clone.shots == 5
+    assert shot_statistics.shots == 4
+
+
+def test_game_statistics_and_format_statistics():
+    players_shots = [ShotStatistics(50, 27, 9), ShotStatistics(40, 3, 0)]
+    statistics = GameStatistics(
+        play_time=90500,
+        rounds_played=90,
+        players_shots=players_shots,
+        winner_index=1,
+        winner_alive_segments=26,
+        total_segments=29,
+    )
+    # record does not change with counters it was created from
+    players_shots[0].add_shot(constants.SHIP_HIT)
+
+    assert statistics.play_time == timedelta(seconds=90.5)
+    assert statistics.shots == 90
+    assert statistics.hits == 30
+    assert statistics.misses == 60
+    assert statistics.ships_sunk == 9
+    assert statistics.accuracy == 30 / 90
+    assert statistics.winner_fleet_intact == 26 / 29
+    assert statistics.winner_fleet_intact_percentage == 89
+    assert statistics.get_player_shots(2).misses == 37
+    assert statistics.as_dict()["play_time_seconds"] == 90.5
+
+    assert format_statistics(statistics) == {
+        "Time of gameplay": "1 minute, 30 seconds",
+        "Rounds played": "90",
+        "Percentage of winners fleet intact": "89",
+    }
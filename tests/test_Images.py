@@ -0,0 +1,34 @@
+from Images import TextCache
+
+import pygame
+
+
+def test_text_cache_hits_and_misses():
+    pygame.font.init()
+    font = pygame.font.Font(None, 20)
+    text_cache = TextCache(max_size=2)
+
+    image = text_cache.get("text", font, (0, 0, 0))
+    assert text_cache.get("text", font, (0, 0, 0)) is image
+    assert text_cache.get("text", font, (255, 0, 0)) is not image
+    assert text_cache.hits == 1
+    assert text_cache.misses == 2
+    assert len(text_cache) == 2
+
+
+def test_text_cache_removes_least_recently_used():
+    pygame.font.init()
+    font = pygame.font.Font(None, 20)
+    text_cache = TextCache(max_size=2)
+
+    first_image = text_cache.get("first", font, (0, 0, 0))
+    text_cache.get("second", font, (0, 0, 0))
+    # first text is used again, so second one is the least recently used
+    text_cache.get("first", font, (0, 0, 0))
+    text_cache.get("third", font, (0, 0, 0))
+
+    assert len(text_cache) == 2
+    assert text_cache.get("first", font, (0, 0, 0)) is first_image
+    misses = text_cache.misses
+    text_cache.get("second", font, (0, 0, 0))
+    assert text_cache.misses == misses + 1
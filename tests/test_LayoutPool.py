@@ -0,0 +1,146 @@
+import os
+import pickle
+import random
+import pytest
+
+from GameErrors import FleetDoesNotFitError, LayoutPoolError
+from LayoutPool import LayoutPool, layout_pool_path
+from Player import Player, BotPlayer
+from Ships import FleetSpec
+from Simulation import simulate_games
+from Tournament import run_tournament
+
+
+def test_layout_pool_path():
+    path1 = layout_pool_path("cache", 10, 10, [2, 5, 3])
+    path2 = layout_pool_path("cache", 10, 10, [5, 3, 2])
+    path3 = layout_pool_path("cache", 10, 12, [5, 3, 2])
+    assert path1 == path2
+    assert path1 != path3
+    assert path1.startswith("cache")
+
+
+def test_LayoutPool_create(tmp_path, monkeypatch):
+    standard_ship_quantities = {"Carrier": 1, "Cruiser": 2, "PatrolShip": 1}
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+
+    path = str(tmp_path / "layouts.npy")
+    pool = LayoutPool.create(path, 200, 6, 7, [3, 5, 2, 3], seed=1)
+    assert len(pool) == 200
+
+    # every layout can be placed on the board
+    for layout_index in range(len(pool)):
+        layout = pool[layout_index]
+        assert [ship[0] for ship in layout] == [5, 3, 3, 2]
+        player = Player(6, 7)
+        for length, orientation, coordinate_x, coordinate_y in layout:
+            player.add_ship(length, orientation, coordinate_x, coordinate_y)
+        assert player.board.occupancy.sum() == 13
+
+
+def test_LayoutPool_load_or_create(tmp_path):
+    directory = str(tmp_path / "pools")
+    pool = LayoutPool.load_or_create(directory, 30, 10, 10, seed=2)
+    assert len(pool) == 30
+    first_layout = pool[0]
+
+    # pool is read from cache
+    pool = LayoutPool.load_or_create(directory, 20, 10, 10, seed=3)
+    assert len(pool) == 30
+    assert pool[0] == first_layout
+
+    # pool is regenerated when it is too small, old mapped pool stays readable
+    old_pool = pool
+    pool = LayoutPool.load_or_create(directory, 40, 10, 10, seed=3)
+    assert len(pool) == 40
+    assert len(old_pool) == 30
+    assert old_pool[0] == first_layout
+
+
+def test_LayoutPool_failed_creation_leaves_no_file(tmp_path):
+    directory = str(tmp_path / "pools")
+    for _ in range(2):
+        with pytest.raises(FleetDoesNotFitError):
+            LayoutPool.load_or_create(directory, 10, 3, 3, ship_lengths=[5])
+    assert os.listdir(directory) == []
+
+
+def test_LayoutPool_pickle(tmp_path):
+    pool = LayoutPool.load_or_create(str(tmp_path), 10, 10, 10, seed=2)
+    unpickled_pool = pickle.loads(pickle.dumps(pool))
+    assert unpickled_pool.path == pool.path
+    assert unpickled_pool[3] == pool[3]
+
+
+def test_BotPlayer_position_ships_from_layout_pool(tmp_path):
+    pool = LayoutPool.load_or_create(str(tmp_path), 10, 10, 10, seed=4)
+    bot = BotPlayer(10, 10, rng=random.Random(0), layout_pool=pool)
+    bot.position_ships()
+
+    assert not bot.ships_to_place
+    assert len(bot.fleet) == 9
+
+    # bot's board is the same as one of layouts in the pool
+    layout_boards = []
+    for layout_index in range(len(pool)):
+        player = Player(10, 10)
+        for length, orientation, coordinate_x, coordinate_y in pool[layout_index]:
+            player.add_ship(length, orientation, coordinate_x, coordinate_y)
+        layout_boards.append(player.board.occupancy)
+    assert any((board == bot.board.occupancy).all() for board in layout_boards)
+
+    results = simulate_games(10, seed=1, layout_pool=pool)
+    assert results.games_played == 10
+
+
+def test_LayoutPool_stores_board_and_fleet(tmp_path):
+    path = str(tmp_path / "layouts.pool")
+    pool = LayoutPool.create(path, 5, 6, 7, [3, 5, 2, 3], seed=1)
+    pool = LayoutPool(path)
+    assert (pool.board_height, pool.board_width) == (6, 7)
+    assert pool.ship_lengths == [5, 3, 3, 2]
+    pool.check_fleet(6, 7, [2, 3, 3, 5])
+    with pytest.raises(LayoutPoolError):
+        pool.check_fleet(7, 6, [5, 3, 3, 2])
+    with pytest.raises(LayoutPoolError):
+        pool.check_fleet(6, 7, [5, 3, 2])
+
+
+def test_LayoutPool_invalid_file(tmp_path):
+    path = tmp_path / "layouts.pool"
+    LayoutPool.create(str(path), 5, 10, 10, [5, 3], seed=1)
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])
+    with pytest.raises(LayoutPoolError):
+        LayoutPool(str(path))
+    path.write_bytes(b"not a pool")
+    with pytest.raises(LayoutPoolError):
+        LayoutPool(str(path))
+
+
+def test_LayoutPool_load_or_create_replaces_invalid_file(tmp_path):
+    directory = str(tmp_path)
+    path = layout_pool_path(directory, 10, 10, [5, 3])
+    with open(path, "wb") as pool_file:
+        pool_file.write(b"truncated")
+    pool = LayoutPool.load_or_create(directory, 5, 10, 10, [5, 3], seed=1)
+    assert len(pool) == 5
+    assert pool.ship_lengths == [5, 3]
+
+
+def test_bots_reject_pool_of_other_fleet(tmp_path):
+    pool = LayoutPool.load_or_create(str(tmp_path), 10, 10, 10, seed=4)
+    with pytest.raises(LayoutPoolError):
+        BotPlayer(8, 8, layout_pool=pool)
+    with pytest.raises(LayoutPoolError):
+        BotPlayer(
+            layout_pool=pool,
+            fleet_spec=FleetSpec.from_length_quantities({3: 2}),
+        )
+    with pytest.raises(LayoutPoolError):
+        run_tournament(
+            4,
+            workers=1,
+            fleet_spec=FleetSpec.from_length_quantities({3: 2}),
+            layout_pool=pool,
+        )
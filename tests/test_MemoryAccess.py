@@ -0,0 +1,56 @@
+from AssetBundle import ASSET_BUNDLE_HEADER, ASSET_BUNDLE_MAGIC, ASSET_BUNDLE_VERSION
+from MemoryAccess import prepare_image, AssetLoader, SHIP_IMAGE_PATHS, load_asset_bundle
+
+import pygame
+
+
+def test_prepare_image_scaling():
+    image = pygame.Surface((60, 60), pygame.SRCALPHA)
+
+    scaled_image = prepare_image(image, (20, 20))
+    assert scaled_image.get_size() == (20, 20)
+
+    # image of the right size is not scaled
+    assert prepare_image(scaled_image, (20, 20)).get_size() == (20, 20)
+    assert prepare_image(image).get_size() == (60, 60)
+
+
+def test_asset_loader_lazy_loading():
+    pygame.font.init()
+    asset_loader = AssetLoader(cell_size=30)
+
+    # waiting for every image finishes decoding
+    assert asset_loader.see_images[0] is asset_loader.get_see_image(0)
+    assert asset_loader.ship_images[0].get_size() == (30, 30)
+    # the same image is prepared for every size separately
+    ship_image_path = SHIP_IMAGE_PATHS[0]
+    assert asset_loader.get_image(ship_image_path, (10, 10)).get_size() == (10, 10)
+    assert asset_loader.get_image(ship_image_path, (30, 30)).get_size() == (30, 30)
+    assert asset_loader.get_image(ship_image_path, (10, 10)) is (
+        asset_loader.get_image(ship_image_path, (10, 10))
+    )
+    asset_loader.table_image
+    asset_loader.game_result_background
+    asset_loader.status_bar_background
+    asset_loader.small_ship_icon
+    asset_loader.cloud_images
+    asset_loader.logo_background
+    asset_loader.button_image
+    assert asset_loader.is_loaded
+    assert asset_loader.start_screen_loaded
+    assert asset_loader.loading_progress == 1.0
+
+    # fonts are created once for every size
+    assert asset_loader.get_font(20) is asset_loader.get_font(20)
+    assert asset_loader.get_font(20) is not asset_loader.get_font(21)
+
+
+def test_corrupt_bundle_is_not_loaded(tmp_path):
+    bundle_path = tmp_path / "assets.bundle"
+    bundle_path.write_bytes(b"")
+    assert load_asset_bundle(str(bundle_path)) is None
+    bundle_path.write_bytes(
+        ASSET_BUNDLE_HEADER.pack(ASSET_BUNDLE_MAGIC, ASSET_BUNDLE_VERSION, 10)
+        + b'{"a": {"of'
+    )
+    assert load_asset_bundle(str(bundle_path)) is None
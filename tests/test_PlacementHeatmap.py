@@ -0,0 +1,111 @@
+import numpy as np
+import random
+
+from PlacementHeatmap import (
+    window_sums,
+    spread_windows,
+    placement_heatmap,
+    PlacementIndex,
+)
+import constants
+
+
+def test_window_sums():
+    array = np.arange(12).reshape(3, 4)
+    assert (
+        window_sums(array, 2, axis=1) == [[1, 3, 5], [9, 11, 13], [17, 19, 21]]
+    ).all()
+    assert (window_sums(array, 3, axis=0) == [[12, 15, 18, 21]]).all()
+    assert (window_sums(array, 1, axis=1) == array).all()
+
+
+def test_spread_windows():
+    window_weights = np.ones((2, 3), dtype=np.int32)
+    spread = spread_windows(window_weights, 2, axis=1)
+    assert (spread == [[1, 2, 2, 1], [1, 2, 2, 1]]).all()
+
+
+def test_placement_heatmap_empty_board():
+    blocked = np.zeros((1, 3), dtype=np.uint8)
+    hits = np.zeros((1, 3), dtype=np.uint8)
+
+    heatmap = placement_heatmap(blocked, hits, {2: 1})
+    assert (heatmap == [[1, 2, 1]]).all()
+
+    heatmap = placement_heatmap(blocked, hits, {2: 2, 3: 1})
+    assert (heatmap == [[3, 5, 3]]).all()
+
+
+def test_placement_heatmap_blocked_and_hits():
+    blocked = np.zeros((3, 3), dtype=np.uint8)
+    hits = np.zeros((3, 3), dtype=np.uint8)
+    blocked[1, 0] = 1
+    hits[1, 1] = 1
+
+    heatmap = placement_heatmap(blocked, hits, {3: 1})
+    weight = 1 + constants.HEATMAP_HIT_WEIGHT
+    # row 1 cannot have horizontal ship, column 0 cannot have vertical one
+    assert (heatmap[:, 0] == [1, 0, 1]).all()
+    assert heatmap[1, 1] == weight
+    assert heatmap[0, 1] == 1 + weight
+
+
+def test_PlacementIndex_init():
+    index = PlacementIndex(1, 3, {2: 1, 4: 0})
+    assert (index.heatmap == [[1, 2, 1]]).all()
+    assert dict(index.ship_lengths) == {2: 1}
+
+
+def test_PlacementIndex_matches_full_calculation():
+    rng = random.Random(3)
+    ship_lengths = {2: 2, 3: 2, 5: 1}
+    index = PlacementIndex(8, 9, ship_lengths)
+    cells = [(row, column) for row in range(8) for column in range(9)]
+    rng.shuffle(cells)
+
+    for row, column in cells[:30]:
+        if rng.random() < 0.7:
+            index.add_miss(row, column)
+        else:
+            index.add_hit(row, column)
+        expected = placement_heatmap(index.blocked, index.hits, index.ship_lengths)
+        assert (index.heatmap == expected).all()
+        assert (index.target_heatmap == expected * (index.hits == 0)).all()
+
+
+def test_PlacementIndex_add_sunk_ship():
+    index = PlacementIndex(4, 4, {2: 1, 3: 1})
+    index.add_hit(0, 0)
+    index.add_sunk_ship([(0, 0), (0, 1)], length=2)
+
+    assert index.hits.sum() == 0
+    assert index.blocked[0, 0] == 1
+    assert index.blocked[0, 1] == 1
+    assert dict(index.ship_lengths) == {3: 1}
+    expected = placement_heatmap(index.blocked, index.hits, {3: 1})
+    assert (index.heatmap == expected).all()
+    assert (index.target_heatmap == expected).all()
+
+
+def test_PlacementIndex_target_heatmap_after_sinking():
+    rng = random.Random(5)
+    index = PlacementIndex(6, 6, {2: 2, 3: 1})
+    index.add_hit(2, 2)
+    index.add_hit(4, 1)
+    index.add_miss(0, 0)
+    clone = index.clone()
+    index.add_sunk_ship([(2, 2), (2, 3)], length=2)
+
+    expected = placement_heatmap(index.blocked, index.hits, index.ship_lengths)
+    assert index.hits[4, 1] == 1
+    assert (index.target_heatmap == expected * (index.hits == 0)).all()
+    assert index.target_heatmap[4, 1] == 0
+    # clone is not changed by original
+    assert clone.target_heatmap[2, 3] == clone.heatmap[2, 3] != 0
+    cells = [(row, column) for row in range(6) for column in range(6)]
+    rng.shuffle(cells)
+    for row, column in cells:
+        if not index.blocked[row, column] and not index.hits[row, column]:
+            index.add_miss(row, column)
+            expected = placement_heatmap(index.blocked, index.hits, index.ship_lengths)
+            assert (index.target_heatmap == expected * (index.hits == 0)).all()
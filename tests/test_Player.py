@@ -1,10 +1,16 @@
-from GameErrors import ShipPlacingError, NotSuchShipToPlaceError
+from GameErrors import (
+    ShipPlacingError,
+    NotSuchShipToPlaceError,
+    FleetDoesNotFitError,
+    FleetStoreMismatchError,
+)
 from BoardCell import BoardCell
-from Player import Player, BotPlayer
+from Player import Player, BotPlayer, ProbabilityBotPlayer
 import constants
-from Ships import Ship, Carrier, Battleship, Cruiser, PatrolShip
+from Ships import Ship, Carrier, Battleship, Cruiser, PatrolShip, FleetSpec
 
 import pytest
+import random
 
 
 def test_Player_init(monkeypatch):
@@ -327,6 +333,46 @@ def test_Player_take_attack(monkeypatch):
     assert not player1.board[1, 1].ship_handle.is_down()
 
 
+def test_Player_fleet_summary():
+    fleet_spec = FleetSpec.from_length_quantities({3: 2, 2: 1})
+    player1 = Player(board_height=4, board_width=4, fleet_spec=fleet_spec)
+    assert player1.fleet_summary == ((3, 0, 2), (2, 0, 1))
+    assert player1.alive_segments == 0
+
+    player1.add_ship(3, constants.SHIP_VERTICAL, 0, 0)
+    player1.add_ship(3, constants.SHIP_VERTICAL, 1, 0)
+    player1.add_ship(2, constants.SHIP_HORIZONTAL, 2, 3)
+    assert player1.fleet_summary == ((3, 2, 2), (2, 1, 1))
+    assert player1.alive_segments == 8
+
+    player1.take_attack(3, 0)
+    assert player1.alive_segments == 8
+    player1.take_attack(0, 0)
+    player1.take_attack(0, 1)
+    assert player1.count_alive_ships(3) == 2
+    assert player1.alive_segments == 6
+    player1.take_attack(0, 2)
+    assert player1.count_alive_ships(3) == 1
+    assert player1.alive_segments == 5
+    assert player1.fleet_summary == ((3, 1, 2), (2, 1, 1))
+
+
+def test_Player_fleet_index():
+    fleet_spec = FleetSpec.from_length_quantities({3: 2})
+    player1 = Player(board_height=4, board_width=4, fleet_spec=fleet_spec)
+    player1.add_ship(3, constants.SHIP_VERTICAL, 0, 0)
+    player1.add_ship(3, constants.SHIP_VERTICAL, 1, 0)
+    assert player1.alive_ships_count == 2
+
+    first_ship = player1.board[0, 0].ship_handle
+    assert player1.get_ship(first_ship.ship_id) is first_ship
+    for row in range(3):
+        player1.take_attack(0, row)
+    assert player1.alive_ships_count == 1
+    assert player1.fleet == [player1.board[0, 1].ship_handle]
+    assert not player1.is_defeated
+
+
 def test_Player_perform_attack(monkeypatch):
     standard_ship_quantities = {
         "Carrier": 1,
@@ -376,7 +422,7 @@ def test_BotPlayer_add_next_target():
     assert bot.next_targets == []
 
     bot.add_next_target((5, 5))
-    assert [((5, 5))] == bot.next_targets
+    assert [(5, 5)] == bot.next_targets
 
     bot.add_next_target((6, 6))
     assert (5, 5) in bot.next_targets
@@ -540,3 +586,182 @@ def test_BotPlayer_position_ships_standard_size(monkeypatch):
     bot.position_ships()
     assert len(bot.ships_to_place) == 0
     assert len(bot.fleet) == 9
+
+
+def test_BotPlayer_rng_is_reproducible():
+    bot1 = BotPlayer(10, 10, rng=random.Random(42))
+    bot2 = BotPlayer(10, 10, rng=random.Random(42))
+    bot1.position_ships()
+    bot2.position_ships()
+
+    assert (bot1.board.occupancy == bot2.board.occupancy).all()
+    assert bot1.find_new_target() == bot2.find_new_target()
+
+
+def test_ProbabilityBotPlayer_finds_ship(monkeypatch):
+    standard_ship_quantities = {"Cruiser": 1}
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+
+    bot = ProbabilityBotPlayer(board_height=5, board_width=5, rng=random.Random(0))
+    player = Player(board_height=5, board_width=5)
+    player.add_ship(3, constants.SHIP_HORIZONTAL, coordinate_x=0, coordinate_y=4)
+
+    # the middle of the board is the most probable
+    assert bot.find_new_target() == (2, 2)
+
+    shots = 0
+    while not player.is_defeated:
+        bot.perform_attack(player)
+        shots += 1
+
+    assert shots < 25
+    assert bot.remaining_ship_lengths[3] == 0
+    assert len(bot.potential_targets) == 25 - shots
+
+
+def test_ProbabilityBotPlayer_targets_around_hit(monkeypatch):
+    standard_ship_quantities = {"PatrolShip": 1}
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+
+    bot = ProbabilityBotPlayer(board_height=5, board_width=5, rng=random.Random(0))
+    player = Player(board_height=5, board_width=5)
+
+    bot.handle_next_targets(constants.SHIP_HIT, 2, 2, player)
+    assert bot.find_new_target() in [(1, 2), (3, 2), (2, 1), (2, 3)]
+
+
+def test_BotPlayer_position_ships_dense_fleet(monkeypatch):
+    standard_ship_quantities = {"Cruiser": 4, "PatrolShip": 6}
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+
+    # 24 of 36 cells are taken by ships
+    bot = BotPlayer(6, 6, rng=random.Random(1))
+    bot.position_ships()
+    assert len(bot.ships_to_place) == 0
+    assert len(bot.fleet) == 10
+    assert bot.board.occupancy.sum() == 24
+
+
+def test_BotPlayer_position_ships_fleet_does_not_fit(monkeypatch):
+    standard_ship_quantities = {"Carrier": 1}
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+    with pytest.raises(FleetDoesNotFitError):
+        BotPlayer(4, 4).position_ships()
+
+    standard_ship_quantities = {"PatrolShip": 5}
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+    with pytest.raises(FleetDoesNotFitError):
+        BotPlayer(3, 3).position_ships()
+
+
+def test_BotPlayer_generate_fleet_layout(monkeypatch):
+    bot = BotPlayer(1, 3, rng=random.Random(0))
+    assert bot.generate_fleet_layout([3]) == [(3, constants.SHIP_HORIZONTAL, 0, 0)]
+    assert bot.generate_fleet_layout([2, 2]) is None
+
+
+def test_Player_custom_fleet_spec():
+    fleet_spec = FleetSpec.from_length_quantities({6: 1, 2: 2})
+    player1 = Player(board_height=8, board_width=8, fleet_spec=fleet_spec)
+
+    assert player1.fleet_spec is fleet_spec
+    assert sorted(ship.length for ship in player1.ships_to_place) == [2, 2, 6]
+
+    player1.add_ship(2, constants.SHIP_HORIZONTAL, coordinate_x=0, coordinate_y=0)
+    player1.add_ship(2, constants.SHIP_HORIZONTAL, coordinate_x=0, coordinate_y=1)
+    assert [ship.length for ship in player1.ships_to_place] == [6]
+    with pytest.raises(NotSuchShipToPlaceError):
+        player1.add_ship(2, constants.SHIP_HORIZONTAL, coordinate_x=0, coordinate_y=2)
+
+    player1.add_ship(6, constants.SHIP_VERTICAL, coordinate_x=7, coordinate_y=0)
+    assert not player1.ships_to_place
+    assert len(player1.fleet) == 3
+
+
+def test_BotPlayer_custom_fleet_spec():
+    fleet_spec = FleetSpec.from_length_quantities({7: 2, 3: 3})
+    bot = ProbabilityBotPlayer(12, 12, rng=random.Random(0), fleet_spec=fleet_spec)
+    assert bot.remaining_ship_lengths == {7: 2, 3: 3}
+
+    bot.position_ships()
+    assert not bot.ships_to_place
+    assert sorted(ship.length for ship in bot.fleet) == [3, 3, 3, 7, 7]
+
+
+def test_Player_with_fleet_store():
+    fleet_spec = FleetSpec.from_length_quantities({3: 1, 2: 1})
+    fleet_store = fleet_spec.create_fleet_store(fleets_count=2)
+    player1 = Player(4, 4, fleet_spec=fleet_spec, fleet_store=fleet_store)
+    player2 = Player(
+        4, 4, fleet_spec=fleet_spec, fleet_store=fleet_store, fleet_index=1
+    )
+
+    player2.add_ship(3, constants.SHIP_HORIZONTAL, 1, 2)
+    assert fleet_store.rows[1, 0] == 2
+    assert fleet_store.columns[1, 0] == 1
+    assert fleet_store.count_alive_ships().tolist() == [0, 1]
+
+    for column in range(1, 4):
+        player2.take_attack(column, 2)
+    assert player2.is_defeated
+    assert player1.fleet == []
+    assert fleet_store.hit_counters[1].tolist() == [3, 0]
+
+
+def test_Player_with_fleet_store_of_other_fleet():
+    fleet_store = FleetSpec.from_length_quantities({3: 1, 2: 1}).create_fleet_store()
+    with pytest.raises(FleetStoreMismatchError):
+        # standard fleet is used when fleet spec is not given
+        Player(4, 4, fleet_store=fleet_store)
+    with pytest.raises(FleetStoreMismatchError):
+        Player(
+            4,
+            4,
+            fleet_spec=FleetSpec.from_length_quantities({3: 2}),
+            fleet_store=fleet_store,
+        )
+    with pytest.raises(FleetStoreMismatchError):
+        Player(
+            4,
+            4,
+            fleet_spec=FleetSpec.from_length_quantities({2: 1, 3: 1}),
+            fleet_store=fleet_store,
+            fleet_index=1,
+        )
+
+
+def test_Player_clone():
+    fleet_spec = FleetSpec.from_length_quantities({3: 1, 2: 1})
+    player1 = Player(4, 4, fleet_spec=fleet_spec)
+    player1.add_ship(3, constants.SHIP_VERTICAL, 0, 0)
+    player1.take_attack(0, 0)
+
+    clone = player1.clone()
+    assert clone.fleet_spec is fleet_spec
+    assert clone.board.shots.tolist() == player1.board.shots.tolist()
+
+    # changes of clone do not change original player
+    clone.take_attack(0, 1)
+    clone.add_ship(2, constants.SHIP_HORIZONTAL, 2, 3)
+    assert player1.board.shots.sum() == 1
+    assert player1.board[0, 0].ship_handle.hit_counter == 1
+    assert clone.board[0, 0].ship_handle.hit_counter == 2
+    assert len(player1.ships_to_place) == 1
+    assert player1.alive_segments == 2
+    assert clone.alive_segments == 3
+
+
+def test_ProbabilityBotPlayer_clone():
+    bot = ProbabilityBotPlayer(rng=random.Random(3))
+    opponent = BotPlayer(rng=random.Random(4))
+    opponent.position_ships()
+    for _ in range(10):
+        bot.perform_attack(opponent)
+
+    clone = bot.clone()
+    opponent_clone = opponent.clone()
+    # clone makes the same decisions as original bot
+    for _ in range(10):
+        assert bot.perform_attack(opponent) == clone.perform_attack(opponent_clone)
+    assert (bot.calculate_heatmap() == clone.calculate_heatmap()).all()
+    assert opponent.board.shots.tolist() == opponent_clone.board.shots.tolist()
@@ -1,4 +1,4 @@
-from Ships import Ship, Battleship, Carrier, Cruiser, PatrolShip
+from Ships import Ship, Battleship, Carrier, Cruiser, PatrolShip, FleetSpec
 import constants
 
 
@@ -60,3 +60,73 @@ def test_Cruiser():
 def test_PatrolShip():
     p = PatrolShip()
     assert p.length == constants.PATROL_SHIP_LENGTH
+
+
+def test_FleetSpec_standard(monkeypatch):
+    monkeypatch.setattr(
+        constants, "STANDARD_SHIP_QUANTITIES", {"Carrier": 1, "PatrolShip": 2}
+    )
+    fleet_spec = FleetSpec()
+
+    assert fleet_spec.ship_kinds == (("Carrier", 5, 1), ("PatrolShip", 2, 2))
+    assert fleet_spec.quantities_by_length == {5: 1, 2: 2}
+    assert fleet_spec.ship_lengths == [5, 2, 2]
+    assert fleet_spec.ships_count == 3
+    assert fleet_spec.total_segments == 9
+
+    ships = fleet_spec.create_ships()
+    assert isinstance(ships[0], Carrier)
+    assert isinstance(ships[1], PatrolShip)
+    assert isinstance(ships[2], PatrolShip)
+    assert [ship.ship_id for ship in ships] == [0, 1, 2]
+
+
+def test_FleetSpec_custom_lengths():
+    fleet_spec = FleetSpec(
+        {"Carrier": 1, "Destroyer": 2, "Submarine": 1},
+        {"Carrier": 7, "Destroyer": 3, "Submarine": 3},
+    )
+
+    assert fleet_spec.quantities_by_length == {7: 1, 3: 3}
+    assert fleet_spec.total_segments == 16
+    ships = fleet_spec.create_ships()
+    # Carrier of different length is not standard Carrier
+    assert not isinstance(ships[0], Carrier)
+    assert [ship.length for ship in ships] == [7, 3, 3, 3]
+
+
+def test_FleetSpec_from_length_quantities():
+    fleet_spec = FleetSpec.from_length_quantities({6: 1, 1: 3})
+
+    assert fleet_spec.ship_kinds == (("Ship6", 6, 1), ("Ship1", 1, 3))
+    assert fleet_spec.ship_lengths == [6, 1, 1, 1]
+
+
+def test_Ship_has_no_dict():
+    assert not hasattr(Ship(3), "__dict__")
+    assert not hasattr(Carrier(), "__dict__")
+
+
+def test_FleetStore():
+    fleet_spec = FleetSpec.from_length_quantities({3: 1, 2: 2})
+    fleet_store = fleet_spec.create_fleet_store(fleets_count=2)
+    assert fleet_store.fleets_count == 2
+    assert fleet_store.ships_count == 3
+
+    ships = fleet_store.create_ships(fleet_index=1)
+    assert [ship.length for ship in ships] == [3, 2, 2]
+    assert [ship.ship_id for ship in ships] == [0, 1, 2]
+    ships[1].position_ship()
+    fleet_store.set_position(1, 1, 4, 5, constants.SHIP_HORIZONTAL)
+    assert ships[1].is_positioned
+    assert fleet_store.rows[1, 1] == 4
+    assert fleet_store.columns[1, 1] == 5
+    assert fleet_store.count_alive_ships().tolist() == [0, 1]
+
+    assert not ships[1].take_damage()
+    assert ships[1].take_damage()
+    assert ships[1].is_down()
+    # ship cannot be hit more times than its length
+    ships[1].take_damage()
+    assert ships[1].hit_counter == 2
+    assert fleet_store.count_alive_ships().tolist() == [0, 0]
@@ -0,0 +1,82 @@
+from Simulation import (
+    SimulationClock,
+    SimulationResults,
+    play_bot_game,
+    simulate_games,
+)
+from Player import BotPlayer
+from Ships import FleetSpec
+import constants
+
+
+def test_SimulationClock():
+    clock = SimulationClock()
+    assert clock() == 0
+    clock.advance(150)
+    assert clock() == 150
+
+
+def test_SimulationResults_merge():
+    results1 = SimulationResults()
+    results1.add_game(winner_index=0, rounds_played=10, winner_shots=5)
+    results1.add_game(winner_index=1, rounds_played=20, winner_shots=10)
+
+    results2 = SimulationResults()
+    results2.add_game(winner_index=0, rounds_played=10, winner_shots=7)
+
+    results1.merge(results2)
+    assert results1.games_played == 3
+    assert results1.wins == (2, 1)
+    assert results1.mean_shots_to_win == (6.0, 10.0)
+    assert results1.rounds_distribution == {10: 2, 20: 1}
+    assert results1.mean_rounds == 40 / 3
+
+
+def test_play_bot_game(monkeypatch):
+    standard_ship_quantities = {
+        "Carrier": 1,
+        "PatrolShip": 1,
+    }
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+
+    bot1 = BotPlayer(board_height=6, board_width=6)
+    bot2 = BotPlayer(board_height=6, board_width=6)
+    game_controller = play_bot_game(bot1, bot2, board_height=6, board_width=6)
+
+    assert game_controller.phase == constants.GAME_RESULT_PHASE
+    assert game_controller.gamemode == constants.CVC
+    assert game_controller.winner in (bot1, bot2)
+    assert game_controller.winner_name in ("Bot1", "Bot2")
+    loser = bot2 if game_controller.winner == bot1 else bot1
+    assert loser.is_defeated
+    assert not game_controller.winner.is_defeated
+
+
+def test_simulate_games(monkeypatch):
+    standard_ship_quantities = {
+        "Carrier": 1,
+        "Battleship": 1,
+        "Cruiser": 4,
+        "PatrolShip": 3,
+    }
+    monkeypatch.setattr("constants.STANDARD_SHIP_QUANTITIES", standard_ship_quantities)
+
+    results = simulate_games(20, bot_a=BotPlayer, bot_b=BotPlayer, seed=3)
+    assert results.games_played == 20
+    assert sum(results.wins) == 20
+    assert sum(results.rounds_distribution.values()) == 20
+    for rounds in results.rounds_distribution:
+        assert 2 * 27 - 1 <= rounds <= 200
+
+    # the same seed gives the same results
+    assert simulate_games(20, seed=3).as_dict() == results.as_dict()
+
+
+def test_simulate_games_custom_fleet_spec():
+    fleet_spec = FleetSpec.from_length_quantities({3: 2})
+    results = simulate_games(
+        10, seed=1, board_height=5, board_width=5, fleet_spec=fleet_spec
+    )
+    assert results.games_played == 10
+    for rounds in results.rounds_distribution:
+        assert 2 * 6 - 1 <= rounds <= 50
@@ -0,0 +1,71 @@
+from Snapshot import SnapshotWriter, SnapshotReader
+from GameErrors import SnapshotError
+
+import numpy as np
+import pytest
+
+
+def test_snapshot_writer_and_reader():
+    writer = SnapshotWriter()
+    writer.write_int(-5)
+    writer.write_bool(True)
+    writer.write_str("Player1")
+    writer.write_array(np.arange(6, dtype=np.uint16).reshape(2, 3))
+    writer.write_array(np.zeros((0, 4), dtype=np.int32))
+
+    reader = SnapshotReader(writer.getvalue())
+    assert reader.read_int() == -5
+    assert reader.read_bool() is True
+    assert reader.read_str() == "Player1"
+    array = reader.read_array()
+    assert array.dtype == np.uint16
+    assert array.tolist() == [[0, 1, 2], [3, 4, 5]]
+    assert reader.read_array().shape == (0, 4)
+    reader.check_end()
+
+
+def test_snapshot_reader_invalid_data():
+    with pytest.raises(SnapshotError):
+        SnapshotReader(b"not a snapshot")
+
+    data = SnapshotWriter().getvalue()
+    with pytest.raises(SnapshotError):
+        # unsupported version
+        SnapshotReader(data[:4] + b"\xff\xff")
+
+    writer = SnapshotWriter()
+    writer.write_str("text")
+    with pytest.raises(SnapshotError):
+        SnapshotReader(writer.getvalue()[:-1]).read_str()
+
+
+def test_snapshot_reader_checks_values():
+    writer = SnapshotWriter()
+    writer.write_int(5)
+    writer.write_int(-1)
+    writer.write_int(3)
+    writer.write_array(np.array([3, 1, 3], dtype=np.uint16))
+    writer.write_array(np.zeros((2, 3), dtype=np.int32))
+    reader = SnapshotReader(writer.getvalue())
+    assert reader.read_count(5) == 5
+    with pytest.raises(SnapshotError):
+        reader.read_count(5)
+    with pytest.raises(SnapshotError):
+        reader.read_index(3)
+    with pytest.raises(SnapshotError):
+        # repeated index
+        reader.read_indices(4)
+    with pytest.raises(SnapshotError):
+        reader.read_array(ndim=2, columns=4)
+
+    writer = SnapshotWriter()
+    writer.write_str("O")
+    writer.write("B", 1)
+    with pytest.raises(SnapshotError):
+        SnapshotReader(writer.getvalue()).read_array()
+
+    writer = SnapshotWriter()
+    writer.write("I", 2)
+    writer.write("2s", b"\xff\xfe")
+    with pytest.raises(SnapshotError):
+        SnapshotReader(writer.getvalue()).read_str()
@@ -0,0 +1,50 @@
+import random
+import pytest
+
+from TargetPool import TargetPool
+
+
+def test_TargetPool_init():
+    pool = TargetPool(board_height=2, board_width=3)
+
+    assert len(pool) == 6
+    assert list(pool) == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+    assert (1, 2) in pool
+    assert (2, 0) not in pool
+    assert (0, -1) not in pool
+    assert (-1, 0) not in pool
+
+
+def test_TargetPool_remove():
+    pool = TargetPool(board_height=2, board_width=2)
+
+    pool.remove((0, 0))
+    assert (0, 0) not in pool
+    assert len(pool) == 3
+    assert set(pool) == {(0, 1), (1, 0), (1, 1)}
+
+    # removing last element does not need swapping
+    pool.remove((0, 1))
+    pool.remove((1, 1))
+    assert list(pool) == [(1, 0)]
+
+    with pytest.raises(ValueError):
+        pool.remove((1, 1))
+    with pytest.raises(ValueError):
+        pool.remove((5, 5))
+
+    pool.discard((1, 1))
+    pool.discard((1, 0))
+    assert len(pool) == 0
+    assert not pool
+
+
+def test_TargetPool_random_choice():
+    pool = TargetPool(board_height=4, board_width=4)
+    removed = set()
+    while pool:
+        target = random.choice(pool)
+        assert target not in removed
+        pool.remove(target)
+        removed.add(target)
+    assert len(removed) == 16
@@ -0,0 +1,23 @@
+from Tournament import generate_shard_seeds, run_tournament
+from Player import BotPlayer
+
+
+def test_generate_shard_seeds():
+    seeds = generate_shard_seeds(seed=7, shards_count=4)
+    assert len(seeds) == 4
+    assert len(set(seeds)) == 4
+    assert generate_shard_seeds(seed=7, shards_count=4) == seeds
+    assert generate_shard_seeds(seed=8, shards_count=4) != seeds
+
+
+def test_run_tournament_does_not_depend_on_workers():
+    results_in_process = run_tournament(
+        30, bot_a=BotPlayer, bot_b=BotPlayer, seed=5, workers=1, shard_size=8
+    )
+    results_in_pool = run_tournament(
+        30, bot_a=BotPlayer, bot_b=BotPlayer, seed=5, workers=2, shard_size=8
+    )
+
+    assert results_in_process.games_played == 30
+    assert sum(results_in_process.wins) == 30
+    assert results_in_pool.as_dict() == results_in_process.as_dict()
@@ -0,0 +1,126 @@
+from UserInterface import IdleScheduler, ScreenRenderer, BoardLayer
+from BoardPositionCalculations import BoardLayout
+from Board import Board
+from Ships import Ship
+import constants
+
+import pygame
+
+
+class fake_visualizer:
+    def __init__(self, update_time=None, dirty_rects=None):
+        self._update_time = update_time
+        self._dirty_rects = dirty_rects or []
+
+    def next_update_time(self):
+        return self._update_time
+
+    def dirty_rects(self):
+        return self._dirty_rects
+
+
+def test_IdleScheduler_get_timeout(monkeypatch):
+    monkeypatch.setattr("pygame.time.get_ticks", lambda: 1000)
+    monkeypatch.setattr("constants.IDLE_MAX_TIMEOUT", 500)
+
+    scheduler = IdleScheduler([fake_visualizer(), fake_visualizer()])
+    assert scheduler.next_update_time() is None
+    assert scheduler.get_timeout() == 500
+
+    scheduler = IdleScheduler([fake_visualizer(1900), fake_visualizer(1040)])
+    assert scheduler.next_update_time() == 1040
+    assert scheduler.get_timeout() == 40
+
+    # deadline has already passed
+    scheduler = IdleScheduler([fake_visualizer(990), fake_visualizer(None)])
+    assert scheduler.get_timeout() == 0
+
+
+def test_ScreenRenderer_collect_dirty_rects(monkeypatch):
+    screen = pygame.Surface((100, 100))
+    visualizers = [
+        fake_visualizer(dirty_rects=[(10, 10, 20, 20), (90, 90, 20, 20)]),
+        fake_visualizer(dirty_rects=[(0, 0, 50, 50), (60, 0, 10, 10)]),
+    ]
+    renderer = ScreenRenderer(screen, visualizers)
+
+    # rect inside other one is skipped, rects are clipped to screen
+    dirty_rects = renderer.collect_dirty_rects()
+    assert sorted(tuple(rect) for rect in dirty_rects) == [
+        (0, 0, 50, 50),
+        (60, 0, 10, 10),
+        (90, 90, 10, 10),
+    ]
+
+    monkeypatch.setattr("constants.DIRTY_RECTS_LIMIT", 2)
+    assert renderer.collect_dirty_rects() == [pygame.Rect(0, 0, 100, 100)]
+
+
+def create_board_layer(board, for_left_table):
+    """returns BoardLayer with single color cell images"""
+    board_layout = BoardLayout(board.height, board.width)
+    cell_size = (board_layout.cell_size, board_layout.cell_size)
+    ship_images = []
+    for color in ((0, 0, 255), (0, 0, 0), (0, 0, 0), (255, 0, 0)):
+        ship_image = pygame.Surface(cell_size)
+        ship_image.fill(color)
+        ship_images.append(ship_image)
+    cloud_image = pygame.Surface(cell_size)
+    cloud_image.fill((255, 255, 255))
+    # transparent table without grid
+    table_image = pygame.Surface(
+        (board_layout.table_width, board_layout.table_height), pygame.SRCALPHA
+    )
+    return BoardLayer(
+        board, for_left_table, board_layout, table_image, ship_images, [cloud_image]
+    )
+
+
+def get_cell_color(board_layer, row, column):
+    cell_size = board_layer._board_layout.cell_size
+    return tuple(
+        board_layer.surface.get_at((column * cell_size + 1, row * cell_size + 1))
+    )
+
+
+def test_BoardLayer_update_redraws_only_changed_cells(monkeypatch):
+    board = Board(5, 5)
+    left_layer = create_board_layer(board, for_left_table=True)
+    right_layer = create_board_layer(board, for_left_table=False)
+    assert left_layer.update() == set()
+    assert get_cell_color(right_layer, 0, 0) == (255, 255, 255, 255)
+
+    redrawn_cells = []
+    original_redraw_cell = BoardLayer.redraw_cell
+
+    def record_redraw_cell(board_layer, row, column):
+        redrawn_cells.append((row, column))
+        original_redraw_cell(board_layer, row, column)
+
+    monkeypatch.setattr(BoardLayer, "redraw_cell", record_redraw_cell)
+
+    board.place_ship(Ship(3), row=1, column=0, orientation=constants.SHIP_HORIZONTAL)
+    assert left_layer.update() == {(1, 0), (1, 1), (1, 2)}
+    assert sorted(redrawn_cells) == [(1, 0), (1, 1), (1, 2)]
+    assert get_cell_color(left_layer, 1, 1) == (0, 0, 255, 255)
+    assert get_cell_color(left_layer, 0, 0) == (0, 0, 0, 0)
+
+    redrawn_cells.clear()
+    board.handle_attack(1, 1)
+    board.handle_attack(4, 4)
+    assert left_layer.update() == {(1, 1), (4, 4)}
+    assert sorted(redrawn_cells) == [(1, 1), (4, 4)]
+    assert get_cell_color(left_layer, 1, 1) == (255, 0, 0, 255)
+    assert left_layer.update() == set()
+
+    # right table draws all changes since its last update at once
+    assert right_layer.update() == {(1, 0), (1, 1), (1, 2), (4, 4)}
+    assert get_cell_color(right_layer, 1, 1) == (255, 0, 0, 255)
+    assert get_cell_color(right_layer, 1, 0) == (255, 255, 255, 255)
+    assert get_cell_color(right_layer, 4, 4) == (0, 0, 0, 0)
+
+    # incremental drawing gives the same table as drawing whole table
+    for board_layer in (left_layer, right_layer):
+        updated_pixels = pygame.image.tobytes(board_layer.surface, "RGBA")
+        board_layer.redraw()
+        assert pygame.image.tobytes(board_layer.surface, "RGBA") == updated_pixels